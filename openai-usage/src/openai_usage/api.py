@@ -2,10 +2,24 @@
 OpenAI API client for fetching projects, API keys, and usage data.
 """
 
+import functools
+import hashlib
+import json
 import logging
+import time
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+try:  # Optional C-accelerated JSON decoding of large usage payloads
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +29,84 @@ API_BASE_URL_USAGE_COMPLETIONS = (
     "https://api.openai.com/v1/organization/usage/completions"
 )
 
+# Usage date ranges are split into weekly windows fetched concurrently; one
+# week of daily buckets fits in a single page at the API's default limit.
+USAGE_WINDOW_SECONDS = 7 * 24 * 60 * 60
+MAX_USAGE_WINDOW_WORKERS = 4
+
+# Usage responses are cached on disk; ranges ending before today never change
+# and are cached permanently, others only for this many seconds.
+USAGE_CACHE_TTL_SECONDS = 300
+
+# Projects are fetched concurrently by the CLI, each splitting its date range
+# into concurrent weekly windows; the connection pool holds one connection
+# per possible in-flight request.
+MAX_PROJECT_WORKERS = 8
+
+# Shared session so paginated calls reuse the same keep-alive TLS connection.
+# urllib3 advertises "br" only when the brotli decoder is importable.
+_SESSION = requests.Session()
+_SESSION.headers["Accept-Encoding"] = make_headers(accept_encoding=True)[
+    "accept-encoding"
+]
+# Rate limiting (429) and transient server errors are retried with exponential
+# backoff, honouring Retry-After. Once retries are exhausted the last response
+# is returned so raise_for_status reports it as before.
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=5,
+            backoff_factor=1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        ),
+        pool_maxsize=MAX_PROJECT_WORKERS * MAX_USAGE_WINDOW_WORKERS,
+    ),
+)
+
+
+def _parse_ymd(date_str: str) -> datetime:
+    """
+    Parse a 'YYYY-MM-DD' string into a UTC midnight datetime.
+
+    Parameters
+    ----------
+    date_str : str
+        The date string to parse.
+
+    Returns
+    -------
+    datetime
+        The parsed date at 00:00 UTC.
+
+    Raises
+    ------
+    ValueError
+        If the string is not three dash-separated integers forming a valid date.
+    """
+    year, month, day = date_str.split("-")
+    return datetime(int(year), int(month), int(day), tzinfo=timezone.utc)
+
+
+def _ymd_from_ts(timestamp: int) -> str:
+    """
+    Format a Unix timestamp as a 'YYYY-MM-DD' UTC date string.
+
+    Parameters
+    ----------
+    timestamp : int
+        Seconds since the epoch.
+
+    Returns
+    -------
+    str
+        The UTC calendar date of the timestamp.
+    """
+    t = time.gmtime(timestamp)
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+
 
 def fetch_all_api_keys(project_id: str, api_key: str) -> dict:
     """
@@ -46,7 +138,7 @@ def fetch_all_api_keys(project_id: str, api_key: str) -> dict:
     while current_request_url:
         try:
             active_params = params if current_request_url == url else None
-            response = requests.get(
+            response = _SESSION.get(
                 current_request_url, headers=headers, params=active_params
             )
             response.raise_for_status()
@@ -87,7 +179,7 @@ def fetch_usage_details(
     project_id: str,
     api_key: str,
     api_keys_map: dict,
-    pricing: dict,
+    pricing: Mapping,
     start_date_str: str | None = None,
     end_date_str: str | None = None,
 ) -> dict:
@@ -102,8 +194,8 @@ def fetch_usage_details(
         The admin API key for authentication.
     api_keys_map : dict
         A dictionary mapping API key IDs to their names.
-    pricing : dict
-        The pricing dictionary (model_name -> price_dict).
+    pricing : Mapping
+        The pricing table (model_name -> Price).
     start_date_str : str or None
         Optional start date in 'YYYY-MM-DD' format.
     end_date_str : str or None
@@ -121,8 +213,6 @@ def fetch_usage_details(
     ValueError
         If the start date is after the end date.
     """
-    from openai_usage.pricing import calculate_costs
-
     headers = {"Authorization": f"Bearer {api_key}"}
     now = datetime.now(timezone.utc)
 
@@ -133,9 +223,7 @@ def fetch_usage_details(
         )
     else:
         try:
-            start_time_dt = datetime.strptime(
-                start_date_str, "%Y-%m-%d"
-            ).replace(tzinfo=timezone.utc)
+            start_time_dt = _parse_ymd(start_date_str)
         except ValueError as ve:
             raise Exception(f"Invalid start date format: {ve}") from ve
 
@@ -150,12 +238,8 @@ def fetch_usage_details(
         )
     else:
         try:
-            end_time_dt = datetime.strptime(end_date_str, "%Y-%m-%d").replace(
-                hour=23,
-                minute=59,
-                second=59,
-                microsecond=999999,
-                tzinfo=timezone.utc,
+            end_time_dt = _parse_ymd(end_date_str).replace(
+                hour=23, minute=59, second=59, microsecond=999999
             )
         except ValueError as ve:
             raise Exception(f"Invalid end date format: {ve}") from ve
@@ -166,23 +250,87 @@ def fetch_usage_details(
     start_time_ts = int(start_time_dt.timestamp())
     end_time_ts = int(end_time_dt.timestamp())
 
+    windows = [
+        (window_start, min(window_start + USAGE_WINDOW_SECONDS - 1, end_time_ts))
+        for window_start in range(
+            start_time_ts, end_time_ts + 1, USAGE_WINDOW_SECONDS
+        )
+    ]
+    if len(windows) == 1:
+        return _fetch_usage_window(
+            project_id, headers, api_keys_map, pricing, *windows[0]
+        )
+
     usages_by_date = {}
-    current_params = {
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_USAGE_WINDOW_WORKERS, len(windows))
+    ) as executor:
+        futures = [
+            executor.submit(
+                _fetch_usage_window,
+                project_id,
+                headers,
+                api_keys_map,
+                pricing,
+                window_start,
+                window_end,
+            )
+            for window_start, window_end in windows
+        ]
+        # Windows never share a daily bucket, so merging keeps dates unique
+        # and in chronological order.
+        for future in futures:
+            usages_by_date.update(future.result())
+
+    return usages_by_date
+
+
+def _iter_usage_pages(
+    project_id: str, headers: dict, start_time_ts: int, end_time_ts: int
+) -> Iterator[dict]:
+    """
+    Yield the decoded pages of the usage endpoint for one time window.
+
+    Each page is yielded as soon as it is decoded, before the next one is
+    requested.
+
+    Parameters
+    ----------
+    project_id : str
+        The project ID to query usage for.
+    headers : dict
+        Request headers, including the Authorization bearer token.
+    start_time_ts : int
+        Window start as a Unix timestamp.
+    end_time_ts : int
+        Window end as a Unix timestamp.
+
+    Yields
+    ------
+    dict
+        One decoded page of the usage response.
+
+    Raises
+    ------
+    Exception
+        If an API request fails.
+    """
+    base_params = {
         "project_id": project_id,
         "start_time": start_time_ts,
         "end_time": end_time_ts,
         "group_by": "api_key_id,model",
         "bucket_width": "1d",
     }
+    current_params = base_params
     current_url = API_BASE_URL_USAGE_COMPLETIONS
 
     while current_url:
         try:
-            response = requests.get(
+            response = _SESSION.get(
                 current_url, headers=headers, params=current_params
             )
             response.raise_for_status()
-            data = response.json()
         except requests.exceptions.HTTPError as http_err:
             error_message = (
                 f"HTTP error fetching usage data: {http_err} - "
@@ -190,31 +338,21 @@ def fetch_usage_details(
                 f"URL: {response.url}\nParams: {current_params}"
             )
             raise Exception(error_message) from http_err
-        except requests.exceptions.JSONDecodeError as json_err:
-            raise Exception(
-                f"Failed to decode JSON response for usage data: "
-                f"{response.text}"
-            ) from json_err
         except requests.exceptions.RequestException as req_err:
             raise Exception(
                 f"Request failed while fetching usage data: {req_err}"
             ) from req_err
 
-        for bucket in data.get("data", []):
-            bucket_start_time_str = datetime.fromtimestamp(
-                bucket.get("start_time"), timezone.utc
-            ).strftime("%Y-%m-%d")
-            if bucket_start_time_str not in usages_by_date:
-                usages_by_date[bucket_start_time_str] = []
+        # Both json.JSONDecodeError and orjson.JSONDecodeError are ValueErrors
+        try:
+            data = _json_loads(response.content)
+        except ValueError as json_err:
+            raise Exception(
+                f"Failed to decode JSON response for usage data: "
+                f"{response.text}"
+            ) from json_err
 
-            for result in bucket.get("results", []):
-                key_id = result.get("api_key_id")
-                if key_id not in api_keys_map:
-                    continue
-                result["api_key_name"] = api_keys_map[key_id]
-                model_name = result.get("model", "unknown")
-                result["costs"] = calculate_costs(result, model_name, pricing)
-                usages_by_date[bucket_start_time_str].append(result)
+        yield data
 
         next_page_info = data.get("next_page")
         if not next_page_info:
@@ -224,68 +362,239 @@ def fetch_usage_details(
             current_url = next_page_info
             current_params = None
         else:
-            current_params = {
-                "project_id": project_id,
-                "start_time": start_time_ts,
-                "end_time": end_time_ts,
-                "group_by": "api_key_id,model",
-                "bucket_width": "1d",
-                "page": next_page_info,
-            }
+            current_params = {**base_params, "page": next_page_info}
             current_url = API_BASE_URL_USAGE_COMPLETIONS
 
+
+def _fetch_usage_window(
+    project_id: str,
+    headers: dict,
+    api_keys_map: dict,
+    pricing: Mapping,
+    start_time_ts: int,
+    end_time_ts: int,
+) -> dict:
+    """
+    Fetch and price usage buckets for one time window, following pagination.
+
+    Parameters
+    ----------
+    project_id : str
+        The project ID to query usage for.
+    headers : dict
+        Request headers, including the Authorization bearer token.
+    api_keys_map : dict
+        A dictionary mapping API key IDs to their names.
+    pricing : Mapping
+        The pricing table (model_name -> Price).
+    start_time_ts : int
+        Window start as a Unix timestamp.
+    end_time_ts : int
+        Window end as a Unix timestamp.
+
+    Returns
+    -------
+    dict
+        A dictionary mapping dates ('YYYY-MM-DD') to lists of usage details.
+
+    Raises
+    ------
+    Exception
+        If an API request fails.
+    """
+    from openai_usage.pricing import calculate_costs
+
+    usages_by_date = {}
+    for data in _iter_usage_pages(project_id, headers, start_time_ts, end_time_ts):
+        for bucket in data.get("data", []):
+            day_usages = usages_by_date.setdefault(
+                _ymd_from_ts(bucket.get("start_time")), []
+            )
+            for result in bucket.get("results", []):
+                key_name = api_keys_map.get(result.get("api_key_id"))
+                if key_name is None:
+                    continue
+                result["api_key_name"] = key_name
+                model_name = result.get("model", "unknown")
+                result["costs"] = calculate_costs(result, model_name, pricing)
+                day_usages.append(result)
+
     return usages_by_date
 
 
+def _usage_cache_path(
+    project_id: str, start_date_str: str | None, end_date_str: str | None
+) -> Path:
+    """
+    Return the cache file path for a project's usage over a date range.
+
+    A missing start date is keyed as the first day of the current UTC month,
+    the start ``fetch_usage_details`` resolves it to, so that the same
+    arguments in a later month map to a different entry.
+
+    Parameters
+    ----------
+    project_id : str
+        The project ID.
+    start_date_str : str or None
+        The requested start date in 'YYYY-MM-DD' format.
+    end_date_str : str or None
+        The requested end date in 'YYYY-MM-DD' format.
+
+    Returns
+    -------
+    Path
+        The path of the JSON cache file inside the usage cache directory.
+    """
+    from openai_usage.pricing import _get_cache_dir
+
+    if not start_date_str:
+        start_date_str = datetime.now(timezone.utc).strftime("%Y-%m-01")
+    key = hashlib.sha1(
+        f"{project_id}|{start_date_str}|{end_date_str}".encode()
+    ).hexdigest()
+    return _get_cache_dir() / "usage" / f"{key}.json"
+
+
+def _load_cached_usage(
+    cache_path: Path, end_date_str: str | None, pricing: Mapping
+) -> dict | None:
+    """
+    Load cached usage details if the cache entry is still valid.
+
+    Entries for ranges ending before today (UTC) never expire; other entries
+    expire after USAGE_CACHE_TTL_SECONDS. Costs are recomputed with the
+    current pricing since it may have changed since the entry was written.
+
+    Parameters
+    ----------
+    cache_path : Path
+        The cache file path.
+    end_date_str : str or None
+        The requested end date in 'YYYY-MM-DD' format.
+    pricing : Mapping
+        The pricing table (model_name -> Price).
+
+    Returns
+    -------
+    dict or None
+        A dictionary mapping dates to usage details, or None on cache miss.
+    """
+    from openai_usage.pricing import calculate_costs
+
+    try:
+        mtime = cache_path.stat().st_mtime
+    except OSError:
+        return None
+
+    # Compared as dates: unpadded input such as '2026-11-1' sorts wrongly as text
+    today = datetime.now(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    is_past_range = bool(end_date_str) and _parse_ymd(end_date_str) < today
+    if not is_past_range and time.time() - mtime > USAGE_CACHE_TTL_SECONDS:
+        return None
+
+    try:
+        usages_by_date = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError) as exc:
+        logger.debug("Ignoring unreadable usage cache %s: %s", cache_path, exc)
+        return None
+
+    for usage_list in usages_by_date.values():
+        for result in usage_list:
+            result["costs"] = calculate_costs(
+                result, result.get("model", "unknown"), pricing
+            )
+    return usages_by_date
+
+
+def _save_cached_usage(cache_path: Path, usages_by_date: dict) -> None:
+    """
+    Write usage details to the cache, ignoring filesystem errors.
+
+    Parameters
+    ----------
+    cache_path : Path
+        The cache file path.
+    usages_by_date : dict
+        A dictionary mapping dates to usage details.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(usages_by_date), encoding="utf-8")
+    except OSError as exc:
+        logger.debug("Could not write usage cache %s: %s", cache_path, exc)
+
+
 def fetch_project_usage(
     project_id: str,
     api_key: str,
-    pricing: dict,
+    pricing: Mapping,
     start_date_str: str | None = None,
     end_date_str: str | None = None,
+    use_cache: bool = True,
 ) -> dict:
     """
     Fetch all usage details for a single project.
 
+    Results are cached on disk per project and date range, see
+    ``_load_cached_usage`` for the expiry rules.
+
     Parameters
     ----------
     project_id : str
         The project ID to query usage for.
     api_key : str
         The admin API key for authentication.
-    pricing : dict
-        The pricing dictionary (model_name -> price_dict).
+    pricing : Mapping
+        The pricing table (model_name -> Price).
     start_date_str : str or None
         Optional start date in 'YYYY-MM-DD' format.
     end_date_str : str or None
         Optional end date in 'YYYY-MM-DD' format.
+    use_cache : bool
+        Whether to read and write the on-disk usage cache. Defaults to True.
 
     Returns
     -------
     dict
         A dictionary mapping dates to usage details.
     """
+    cache_path = None
+    if use_cache:
+        cache_path = _usage_cache_path(project_id, start_date_str, end_date_str)
+        cached = _load_cached_usage(cache_path, end_date_str, pricing)
+        if cached is not None:
+            logger.debug("Using cached usage for project %s", project_id)
+            return cached
+
     api_keys_map = fetch_all_api_keys(project_id, api_key)
-    return fetch_usage_details(
+    usages_by_date = fetch_usage_details(
         project_id, api_key, api_keys_map, pricing, start_date_str, end_date_str
     )
+    if cache_path is not None:
+        _save_cached_usage(cache_path, usages_by_date)
+    return usages_by_date
 
 
-def list_projects(api_key: str, return_list: bool = False) -> list | None:
+@functools.lru_cache(maxsize=8)
+def _fetch_all_projects(api_key: str) -> tuple:
     """
-    Fetch and display a list of available OpenAI projects.
+    Fetch every project of the organization, following pagination.
+
+    Results are memoized per API key, so repeated lookups within one run
+    cost a single round of requests.
 
     Parameters
     ----------
     api_key : str
         The admin API key for authentication.
-    return_list : bool
-        If True, returns the list instead of printing. Defaults to False.
 
     Returns
     -------
-    list or None
-        A list of project dicts if return_list is True, otherwise None.
+    tuple
+        The project dicts returned by the API.
 
     Raises
     ------
@@ -299,7 +608,7 @@ def list_projects(api_key: str, return_list: bool = False) -> list | None:
 
     try:
         while current_url:
-            response = requests.get(
+            response = _SESSION.get(
                 current_url, headers=headers, params=current_params
             )
             response.raise_for_status()
@@ -316,17 +625,6 @@ def list_projects(api_key: str, return_list: bool = False) -> list | None:
                 current_url = API_BASE_URL_PROJECTS
             else:
                 break
-
-        if return_list:
-            return all_projects
-
-        if not all_projects:
-            print("No projects found.")
-            return None
-        print("Available Projects:")
-        for project in all_projects:
-            print(f"- ID: {project.get('id')}, Name: {project.get('name')}")
-        return None
     except requests.exceptions.HTTPError as http_err:
         error_message = (
             f"HTTP error fetching projects: {http_err} - "
@@ -341,3 +639,40 @@ def list_projects(api_key: str, return_list: bool = False) -> list | None:
         raise Exception(
             f"Request failed while fetching projects: {req_err}"
         ) from req_err
+
+    return tuple(all_projects)
+
+
+def list_projects(api_key: str, return_list: bool = False) -> list | None:
+    """
+    Fetch and display a list of available OpenAI projects.
+
+    Parameters
+    ----------
+    api_key : str
+        The admin API key for authentication.
+    return_list : bool
+        If True, returns the list instead of printing. Defaults to False.
+
+    Returns
+    -------
+    list or None
+        A list of project dicts if return_list is True, otherwise None.
+
+    Raises
+    ------
+    Exception
+        If the API request fails or the JSON response is invalid.
+    """
+    all_projects = list(_fetch_all_projects(api_key))
+
+    if return_list:
+        return all_projects
+
+    if not all_projects:
+        print("No projects found.")
+        return None
+    print("Available Projects:")
+    for project in all_projects:
+        print(f"- ID: {project.get('id')}, Name: {project.get('name')}")
+    return None
@@ -4,9 +4,10 @@ Command-line interface for the OpenAI usage reporting tool.
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
-from openai_usage.api import fetch_project_usage, list_projects
+from openai_usage.api import MAX_PROJECT_WORKERS, fetch_project_usage, list_projects
 from openai_usage.display import display_results
 from openai_usage.pricing import get_cache_info, load_pricing, update_pricing
 
@@ -81,6 +82,11 @@ def _build_parser():
         action="store_true",
         help="Show pricing cache status and exit.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch usage from the API instead of the local cache.",
+    )
     return parser
 
 
@@ -148,84 +154,89 @@ def main() -> None:
     # Load pricing
     pricing = load_pricing()
 
-    # Determine which project IDs to fetch
-    project_ids_to_fetch = []
-    if args.projects:
-        project_ids_to_fetch = args.projects
-    else:
+    # One project listing serves both the names map and, when no projects
+    # were given, the list of project IDs to fetch
+    if not args.projects:
         print(
             "No projects specified with -p/--projects. "
             "Fetching usage for all available projects...",
         )
-        try:
-            all_available_projects = list_projects(api_key, return_list=True)
-            if all_available_projects:
-                project_ids_to_fetch = [
-                    p["id"]
-                    for p in all_available_projects
-                    if p.get("id")
-                ]
-                if not project_ids_to_fetch:
-                    print(
-                        "No project IDs found after listing all projects.",
-                        file=sys.stderr,
-                    )
-                    sys.exit(1)
-                print(
-                    f"Found {len(project_ids_to_fetch)} projects to process."
-                )
-            else:
-                print("No projects found to process.", file=sys.stderr)
-                sys.exit(1)
-        except Exception as e:
+    try:
+        projects_list_data = list_projects(api_key, return_list=True)
+    except Exception as e:
+        if not args.projects:
             print(
                 f"Error fetching list of all projects: {e}",
                 file=sys.stderr,
             )
             sys.exit(1)
-
-    if not project_ids_to_fetch:
-        print("Error: No project IDs to process.", file=sys.stderr)
-        sys.exit(1)
-
-    all_projects_usage_details = []
-    project_names_map = {}
-
-    # Fetch project names for display
-    try:
-        projects_list_data = list_projects(api_key, return_list=True)
-        if projects_list_data:
-            project_names_map = {
-                p.get("id"): p.get("name", "Unknown Project")
-                for p in projects_list_data
-            }
-    except Exception as e:
         print(
             f"Warning: Could not fetch project names: {e}. "
             f"Project IDs will be used.",
             file=sys.stderr,
         )
+        projects_list_data = []
 
-    # Fetch usage for each project
-    for project_id in project_ids_to_fetch:
+    project_names_map = {
+        p["id"]: p.get("name", "Unknown Project")
+        for p in projects_list_data
+        if p.get("id")
+    }
+
+    # Determine which project IDs to fetch
+    if args.projects:
+        project_ids_to_fetch = args.projects
+    elif not projects_list_data:
+        print("No projects found to process.", file=sys.stderr)
+        sys.exit(1)
+    elif not project_names_map:
         print(
-            f"Fetching usage for project: "
-            f"{project_names_map.get(project_id, project_id)}..."
+            "No project IDs found after listing all projects.",
+            file=sys.stderr,
         )
-        try:
-            usage_by_date = fetch_project_usage(
-                project_id, api_key, pricing, args.start_date, args.end_date
+        sys.exit(1)
+    else:
+        project_ids_to_fetch = list(project_names_map)
+        print(f"Found {len(project_ids_to_fetch)} projects to process.")
+
+    all_projects_usage_details = []
+
+    # Fetch usage for all projects concurrently
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_PROJECT_WORKERS, len(project_ids_to_fetch))
+    ) as executor:
+        futures = {}
+        for project_id in project_ids_to_fetch:
+            print(
+                f"Fetching usage for project: "
+                f"{project_names_map.get(project_id, project_id)}..."
+            )
+            future = executor.submit(
+                fetch_project_usage,
+                project_id,
+                api_key,
+                pricing,
+                args.start_date,
+                args.end_date,
+                not args.no_cache,
             )
+            futures[future] = project_id
+
+        for future in as_completed(futures):
+            project_id = futures[future]
+            try:
+                usage_by_date = future.result()
+            except Exception as e:
+                print(
+                    f"Error fetching usage for project {project_id}: {e}",
+                    file=sys.stderr,
+                )
+                continue
             for date, usage_list in usage_by_date.items():
                 for usage_item in usage_list:
                     usage_item["date"] = date
                     usage_item["project_id"] = project_id
                     all_projects_usage_details.append(usage_item)
-        except Exception as e:
-            print(
-                f"Error fetching usage for project {project_id}: {e}",
-                file=sys.stderr,
-            )
 
     # Display the consolidated results
     display_results(
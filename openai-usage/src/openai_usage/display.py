@@ -2,8 +2,59 @@
 Usage data display with formatted tables.
 """
 
-from prettytable import PrettyTable
-from termcolor import colored
+import os
+import sys
+from itertools import groupby
+from operator import itemgetter
+
+_CYAN = "\x1b[36m"
+_BLUE = "\x1b[34m"
+_GREEN = "\x1b[32m"
+_YELLOW = "\x1b[33m"
+_RED = "\x1b[31m"
+_RED_B = "\x1b[1;31m"
+_MAG_B = "\x1b[1;35m"
+_BLUE_B = "\x1b[1;34m"
+_RST = "\x1b[0m"
+
+# Totals are accumulated as integer ten-thousandths of a dollar (the table's
+# display precision), so subtotals add up exactly to the rows shown.
+COST_UNITS_PER_DOLLAR = 10_000
+
+# Colors of the table columns, in TABLE_HEADERS order
+_ROW_COLORS = (_CYAN, _BLUE, _GREEN, _YELLOW, _RED, _RED, _RED, _RED_B)
+
+TABLE_HEADERS = (
+    "Date",
+    "Project",
+    "Model",
+    "API Key",
+    "Input ($)",
+    "Output ($)",
+    "Cached ($)",
+    "Total ($)",
+)
+
+
+def _color_enabled() -> bool:
+    """
+    Tell whether ANSI colors should be written to stdout.
+
+    ``NO_COLOR`` and ``ANSI_COLORS_DISABLED`` disable colors,
+    ``FORCE_COLOR`` enables them, otherwise colors are only used when stdout
+    is a terminal.
+
+    Returns
+    -------
+    bool
+        True if colored output should be produced.
+    """
+    if os.environ.get("ANSI_COLORS_DISABLED") or os.environ.get("NO_COLOR"):
+        return False
+    if os.environ.get("FORCE_COLOR"):
+        return True
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
 
 
 def get_month_from_date(date_value: str) -> str:
@@ -26,53 +77,155 @@ def get_month_from_date(date_value: str) -> str:
     return date_value
 
 
-def get_sort_key_tuple(
-    usage_item: dict,
-    criteria_list: list[str],
-    project_names_map: dict,
-) -> tuple:
+class _ProjectDisplayCache(dict):
+    """
+    Lazily filled mapping of project IDs to their display names.
+
+    Unknown project IDs resolve to themselves, like
+    ``project_names.get(project_id, project_id)``, but each ID is only
+    resolved once.
+    """
+
+    def __init__(self, project_names: dict) -> None:
+        super().__init__()
+        self._project_names = project_names
+
+    def __missing__(self, project_id: str) -> str:
+        return self.setdefault(
+            project_id, self._project_names.get(project_id, project_id)
+        )
+
+
+_SORT_KEY_ACCESSORS = {
+    "project": "pnm[x.get('project_id', '')]",
+    "day": "x.get('date', '')",
+    "month": "x.get('date', '')[:7]",
+    "key": "x.get('api_key_name', '')",
+    "model": "x.get('model', '')",
+}
+
+
+def build_sort_key(criteria_list: list[str], project_names_map: dict):
     """
-    Generate a sort key for a usage item based on specified criteria.
+    Build a sort key function specialized for the given criteria.
+
+    The key starts with the requested criteria, in order, followed by the
+    remaining ones among project, month, day, key and model; unknown
+    criteria sort as an empty string. The function body is generated from
+    the whitelisted accessors in ``_SORT_KEY_ACCESSORS`` so each call is a
+    single tuple expression.
 
     Parameters
     ----------
-    usage_item : dict
-        The usage data dictionary.
     criteria_list : list[str]
         User-specified sort criteria (e.g., ['project', 'day']).
     project_names_map : dict
         A mapping of project IDs to names.
 
+    Returns
+    -------
+    Callable[[dict], tuple]
+        A function mapping a usage item to its sort key.
+    """
+    exprs = [
+        _SORT_KEY_ACCESSORS.get(criterion.lower(), "''")
+        for criterion in criteria_list
+    ]
+    for crit in ("project", "month", "day", "key", "model"):
+        if crit not in criteria_list:
+            exprs.append(_SORT_KEY_ACCESSORS[crit])
+
+    source = f"def _k(x, pnm=pnm):\n    return ({', '.join(exprs)},)\n"
+    if not isinstance(project_names_map, _ProjectDisplayCache):
+        project_names_map = _ProjectDisplayCache(project_names_map)
+    namespace: dict = {"pnm": project_names_map}
+    exec(source, namespace)  # noqa: S102 - source only uses whitelisted accessors
+    return namespace["_k"]
+
+
+def _row_cells(
+    usage: dict, project_names: _ProjectDisplayCache, show_month: bool
+) -> tuple[str, str, str, str, float, float, float]:
+    """
+    Extract the displayed text and cost values of one usage row.
+
+    Parameters
+    ----------
+    usage : dict
+        The usage data dictionary.
+    project_names : _ProjectDisplayCache
+        Cached mapping of project IDs to display names.
+    show_month : bool
+        Whether the date column shows the month instead of the day.
+
     Returns
     -------
     tuple
-        A tuple of values suitable for use as a sort key.
+        (date, project, model, api_key, input_cost, output_cost, cached_cost).
     """
-    project_id_val = usage_item.get("project_id", "")
-    project_name_val = project_names_map.get(project_id_val, project_id_val)
-    date_val = usage_item.get("date", "")
-    month_val = get_month_from_date(date_val)
-    key_name_val = usage_item.get("api_key_name", "")
-    model_val = usage_item.get("model", "")
-
-    criteria_to_value_map = {
-        "project": project_name_val,
-        "day": date_val,
-        "month": month_val,
-        "key": key_name_val,
-        "model": model_val,
-    }
+    date_str = usage.get("date", "unknown_date")
+    if show_month:
+        date_str = get_month_from_date(date_str)
+    project_id = usage.get("project_id", "unknown_project")
+    costs_get = usage.get("costs", {}).get
+    return (
+        date_str,
+        project_names[project_id],
+        usage.get("model", "unknown_model"),
+        usage.get("api_key_name", "Unknown Key"),
+        costs_get("input_cost", 0.0),
+        costs_get("output_cost", 0.0),
+        costs_get("cached_input_cost", 0.0),
+    )
 
-    key_parts = []
-    for criterion in criteria_list:
-        key_parts.append(criteria_to_value_map.get(criterion.lower(), ""))
 
-    all_possible_criteria = ["project", "month", "day", "key", "model"]
-    for crit in all_possible_criteria:
-        if crit not in criteria_list:
-            key_parts.append(criteria_to_value_map[crit])
+def _group_display_name(
+    usage: dict, criterion: str, project_names: _ProjectDisplayCache
+) -> str:
+    """
+    Return the name shown in the subtotal label of a row's group.
+
+    Parameters
+    ----------
+    usage : dict
+        The usage data dictionary.
+    criterion : str
+        The primary group-by criterion.
+    project_names : _ProjectDisplayCache
+        Cached mapping of project IDs to display names.
+
+    Returns
+    -------
+    str
+        The group's display name.
+    """
+    if criterion == "project":
+        return project_names[usage.get("project_id", "unknown_project")]
+    if criterion == "key":
+        return usage.get("api_key_name", "Unknown")
+    if criterion == "model":
+        return usage.get("model", "Unknown Model")
+    date_str = usage.get("date", "unknown_date")
+    if criterion == "month":
+        date_str = get_month_from_date(date_str)
+    return date_str
+
+
+def _leading_sort_value(decorated_usage: tuple) -> object:
+    """
+    Return the primary group value of a (sort_key, usage) pair.
+
+    Parameters
+    ----------
+    decorated_usage : tuple
+        A (sort_key, usage) pair.
 
-    return tuple(key_parts)
+    Returns
+    -------
+    object
+        The first element of the sort key.
+    """
+    return decorated_usage[0][0]
 
 
 def display_results(
@@ -83,6 +236,12 @@ def display_results(
     """
     Display usage data in a formatted table, grouped and sorted as specified.
 
+    Rows are sorted once on their decorated sort key, whose first element
+    is the primary group value, so subtotals are emitted in a single pass
+    whenever that value changes. Column widths are measured in a first pass
+    so that rows can then be written straight to stdout from precomputed
+    format templates.
+
     Parameters
     ----------
     all_usage_details : list
@@ -96,29 +255,15 @@ def display_results(
         print("No usage data to display.")
         return
 
-    table = PrettyTable()
-    table.field_names = [
-        "Date",
-        "Project",
-        "Model",
-        "API Key",
-        "Input ($)",
-        "Output ($)",
-        "Cached ($)",
-        "Total ($)",
-    ]
-    for col in ("Input ($)", "Output ($)", "Cached ($)", "Total ($)"):
-        table.align[col] = "r"
-
-    grand_total_cost = 0.0
-
-    sorted_usage_details = sorted(
-        all_usage_details,
-        key=lambda x: get_sort_key_tuple(x, group_by_criteria, project_names),
-    )
+    # Subtotals follow the first criterion, which must also lead the sort key.
+    group_by_criteria = group_by_criteria or ["day"]
+    primary_group_criterion = group_by_criteria[0]
 
-    primary_group_criterion = (
-        group_by_criteria[0] if group_by_criteria else "day"
+    project_display = _ProjectDisplayCache(project_names)
+    sort_key = build_sort_key(group_by_criteria, project_display)
+    decorated_usage_details = sorted(
+        ((sort_key(usage), usage) for usage in all_usage_details),
+        key=itemgetter(0),
     )
     group_label_prefix_map = {
         "project": "Total for Project",
@@ -130,129 +275,136 @@ def display_results(
     group_label_prefix = group_label_prefix_map.get(
         primary_group_criterion, f"Total for {primary_group_criterion}"
     )
+    show_month = "month" in group_by_criteria
 
-    current_primary_group_id_val = None
-    current_primary_group_display_name = ""
-    current_group_total_cost = 0.0
+    # First pass: measure every column so rows can be streamed afterwards.
+    widths = [len(header) for header in TABLE_HEADERS]
+    widths[0] = max(widths[0], len("GRAND TOTAL"))
+    max_costs = [0.0, 0.0, 0.0]
+    grand_total_units = 0
+    for _, group_rows in groupby(decorated_usage_details, key=_leading_sort_value):
+        group_name = None
+        for _, usage in group_rows:
+            if group_name is None:
+                group_name = _group_display_name(
+                    usage, primary_group_criterion, project_display
+                )
+                widths[0] = max(
+                    widths[0], len(f"{group_label_prefix} {group_name}")
+                )
+            cells = _row_cells(usage, project_display, show_month)
+            for index in range(4):
+                if len(cells[index]) > widths[index]:
+                    widths[index] = len(cells[index])
+            for index in range(3):
+                if cells[4 + index] > max_costs[index]:
+                    max_costs[index] = cells[4 + index]
+            grand_total_units += round(
+                (cells[4] + cells[5] + cells[6]) * COST_UNITS_PER_DOLLAR
+            )
+    for index in range(3):
+        widths[4 + index] = max(widths[4 + index], len(f"{max_costs[index]:.4f}"))
+    # Costs are non-negative, so the grand total is the widest total cell.
+    grand_total_cost = grand_total_units / COST_UNITS_PER_DOLLAR
+    widths[7] = max(widths[7], len(f"${grand_total_cost:.4f}"))
 
-    for usage in sorted_usage_details:
-        if primary_group_criterion == "project":
-            project_id = usage.get("project_id", "unknown_project")
-            item_primary_group_id_val = project_id
-            item_primary_group_display_name = project_names.get(
-                project_id, project_id
+    w_date, w_proj, w_model, w_key, w_in, w_out, w_cached, w_total = widths
+    border = "+" + "+".join("-" * (width + 2) for width in widths) + "+\n"
+    header = (
+        "| "
+        + " | ".join(
+            f"{title:^{width}}" for title, width in zip(TABLE_HEADERS, widths)
+        )
+        + " |\n"
+    )
+    blank_cells = " | ".join(" " * width for width in widths[1:7])
+    if _color_enabled():
+        row_colors = _ROW_COLORS
+        subtotal_on, grand_total_on, color_off = _MAG_B, _BLUE_B, _RST
+    else:
+        row_colors = ("",) * len(_ROW_COLORS)
+        subtotal_on = grand_total_on = color_off = ""
+    row_cell_specs = (
+        f"d:<{w_date}",
+        f"p:<{w_proj}",
+        f"m:<{w_model}",
+        f"k:<{w_key}",
+        f"i:>{w_in}.4f",
+        f"o:>{w_out}.4f",
+        f"c:>{w_cached}.4f",
+        f"t:>{w_total}.4f",
+    )
+    row_fmt = (
+        "| "
+        + " | ".join(
+            f"{color}{{{spec}}}{color_off}"
+            for color, spec in zip(row_colors, row_cell_specs)
+        )
+        + " |\n"
+    )
+    subtotal_fmt = (
+        f"| {subtotal_on}{{label:<{w_date}}}{color_off} | {blank_cells} | "
+        f"{subtotal_on}{{total:>{w_total}}}{color_off} |\n"
+    )
+    grand_total_fmt = (
+        f"| {grand_total_on}{{label:<{w_date}}}{color_off} | {blank_cells} | "
+        f"{grand_total_on}{{total:>{w_total}}}{color_off} |\n"
+    )
+
+    write = sys.stdout.write
+    write(border)
+    write(header)
+    write(border)
+
+    # The decorated sort leads with the group value, so each group is one
+    # contiguous run of rows.
+    for _, group_rows in groupby(decorated_usage_details, key=_leading_sort_value):
+        group_name = None
+        group_total_units = 0
+        for _, usage in group_rows:
+            if group_name is None:
+                group_name = _group_display_name(
+                    usage, primary_group_criterion, project_display
+                )
+            (
+                date_str_row,
+                project_name_disp_row,
+                model_row,
+                api_key_name_disp_row,
+                input_cost,
+                output_cost,
+                cached_cost,
+            ) = _row_cells(usage, project_display, show_month)
+
+            row_total_units = round(
+                (input_cost + output_cost + cached_cost) * COST_UNITS_PER_DOLLAR
             )
-        elif primary_group_criterion == "key":
-            api_key_name = usage.get("api_key_name", "Unknown")
-            item_primary_group_id_val = api_key_name
-            item_primary_group_display_name = api_key_name
-        elif primary_group_criterion == "model":
-            model_name = usage.get("model", "Unknown Model")
-            item_primary_group_id_val = model_name
-            item_primary_group_display_name = model_name
-        elif primary_group_criterion == "month":
-            date_str_group = usage.get("date", "unknown_date")
-            month_str_group = get_month_from_date(date_str_group)
-            item_primary_group_id_val = month_str_group
-            item_primary_group_display_name = month_str_group
-        else:
-            date_str_group = usage.get("date", "unknown_date")
-            item_primary_group_id_val = date_str_group
-            item_primary_group_display_name = date_str_group
-
-        if current_primary_group_id_val is None:
-            current_primary_group_id_val = item_primary_group_id_val
-            current_primary_group_display_name = (
-                item_primary_group_display_name
+            group_total_units += row_total_units
+
+            write(
+                row_fmt.format(
+                    d=date_str_row,
+                    p=project_name_disp_row,
+                    m=model_row,
+                    k=api_key_name_disp_row,
+                    i=input_cost,
+                    o=output_cost,
+                    c=cached_cost,
+                    t=row_total_units / COST_UNITS_PER_DOLLAR,
+                )
             )
 
-        if item_primary_group_id_val != current_primary_group_id_val:
-            table.add_row([
-                colored(
-                    f"{group_label_prefix} "
-                    f"{current_primary_group_display_name}",
-                    "magenta",
-                    attrs=["bold"],
-                ),
-                "",
-                "",
-                "",
-                "",
-                "",
-                "",
-                colored(
-                    f"${current_group_total_cost:.4f}",
-                    "magenta",
-                    attrs=["bold"],
-                ),
-            ])
-            table.add_divider()
-            current_group_total_cost = 0.0
-            current_primary_group_id_val = item_primary_group_id_val
-            current_primary_group_display_name = (
-                item_primary_group_display_name
+        write(
+            subtotal_fmt.format(
+                label=f"{group_label_prefix} {group_name}",
+                total=f"${group_total_units / COST_UNITS_PER_DOLLAR:.4f}",
             )
+        )
+        write(border)
 
-        date_str_row = usage.get("date", "unknown_date")
-        if "month" in group_by_criteria:
-            date_str_row = get_month_from_date(date_str_row)
-        project_id_row = usage.get("project_id", "unknown_project")
-        project_name_disp_row = project_names.get(
-            project_id_row, project_id_row
+    write(
+        grand_total_fmt.format(
+            label="GRAND TOTAL", total=f"${grand_total_cost:.4f}"
         )
-        model_row = usage.get("model", "unknown_model")
-        api_key_name_disp_row = usage.get("api_key_name", "Unknown Key")
-
-        costs = usage.get("costs", {})
-        input_cost = costs.get("input_cost", 0.0)
-        output_cost = costs.get("output_cost", 0.0)
-        cached_cost = costs.get("cached_input_cost", 0.0)
-
-        current_row_total = input_cost + output_cost + cached_cost
-        current_group_total_cost += current_row_total
-        grand_total_cost += current_row_total
-
-        table.add_row([
-            colored(date_str_row, "cyan"),
-            colored(project_name_disp_row, "blue"),
-            colored(model_row, "green"),
-            colored(api_key_name_disp_row, "yellow"),
-            colored(f"{input_cost:.4f}", "red"),
-            colored(f"{output_cost:.4f}", "red"),
-            colored(f"{cached_cost:.4f}", "red"),
-            colored(f"{current_row_total:.4f}", color="red", attrs=["bold"]),
-        ])
-
-    if sorted_usage_details:
-        table.add_row([
-            colored(
-                f"{group_label_prefix} "
-                f"{current_primary_group_display_name}",
-                "magenta",
-                attrs=["bold"],
-            ),
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            colored(
-                f"${current_group_total_cost:.4f}",
-                "magenta",
-                attrs=["bold"],
-            ),
-        ])
-        table.add_divider()
-
-    table.add_row([
-        colored("GRAND TOTAL", "blue", attrs=["bold"]),
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        colored(f"${grand_total_cost:.4f}", "blue", attrs=["bold"]),
-    ])
-    print(table)
+    )
+    write(border)
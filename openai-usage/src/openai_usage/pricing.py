@@ -5,12 +5,16 @@ Manages a local cache of OpenAI model pricing data, sourced from litellm's
 community-maintained pricing database. All prices are stored in USD per 1M tokens.
 """
 
+import functools
 import json
 import logging
 import os
 import sys
+from collections import namedtuple
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from pathlib import Path
+from types import MappingProxyType
 
 import requests
 
@@ -37,6 +41,13 @@ FALLBACK_PRICING = {
     "o4-mini": {"input": 1.10, "output": 4.40, "cached_input": 0.275},
 }
 
+# Prices of one model in $/1M tokens; metrics without a price are None.
+Price = namedtuple("Price", "input output cached_input", defaults=(None,) * 3)
+
+# Models already reported as missing from the pricing data, so the warning is
+# printed once per model instead of once per usage row.
+_warned_missing_models: set[str] = set()
+
 
 def _get_cache_dir() -> Path:
     """
@@ -217,7 +228,30 @@ def load_cache() -> dict | None:
     return cache_data
 
 
-def load_pricing() -> dict:
+def _build_price_table(models: dict) -> Mapping[str, Price]:
+    """
+    Freeze pricing dicts into a read-only mapping of Price tuples.
+
+    Parameters
+    ----------
+    models : dict
+        A dictionary mapping model names to their pricing dicts.
+
+    Returns
+    -------
+    Mapping[str, Price]
+        A read-only mapping of model names to their prices. Keys of the
+        pricing dicts other than Price fields are ignored.
+    """
+    return MappingProxyType(
+        {
+            model_name: Price(*(prices.get(field) for field in Price._fields))
+            for model_name, prices in models.items()
+        }
+    )
+
+
+def load_pricing() -> Mapping[str, Price]:
     """
     Load pricing data with auto-fetch and fallback.
 
@@ -226,26 +260,26 @@ def load_pricing() -> dict:
 
     Returns
     -------
-    dict
-        A dictionary mapping model names to their pricing dicts.
+    Mapping[str, Price]
+        A read-only mapping of model names to their prices.
     """
     cache_data = load_cache()
     if cache_data and cache_data.get("models"):
-        return cache_data["models"]
+        return _build_price_table(cache_data["models"])
 
     # No cache — try auto-fetch
     try:
         print("No pricing cache found. Fetching from litellm...", file=sys.stderr)
         models = fetch_litellm_pricing()
         save_cache(models)
-        return models
+        return _build_price_table(models)
     except Exception as exc:
         print(
             f"Warning: Failed to fetch pricing data: {exc}. "
             f"Using minimal fallback pricing.",
             file=sys.stderr,
         )
-        return FALLBACK_PRICING.copy()
+        return _build_price_table(FALLBACK_PRICING)
 
 
 def update_pricing() -> None:
@@ -297,7 +331,36 @@ def get_cache_info() -> str:
     )
 
 
-def calculate_costs(usage: dict, model_name: str, pricing: dict) -> dict:
+@functools.lru_cache(maxsize=256)
+def _rates_for(price: Price) -> tuple[tuple[str, str, float], ...]:
+    """
+    Build the per-token rate table for one model's $/1M token prices.
+
+    Parameters
+    ----------
+    price : Price
+        The model's prices in $/1M tokens.
+
+    Returns
+    -------
+    tuple
+        (usage_key, cost_key, $/token) triples for every priced metric.
+    """
+    prices = (
+        ("input_tokens", "input_cost", price.input),
+        ("output_tokens", "output_cost", price.output),
+        ("cached_input_tokens", "cached_input_cost", price.cached_input),
+    )
+    return tuple(
+        (usage_key, cost_key, metric_price / 1_000_000)
+        for usage_key, cost_key, metric_price in prices
+        if metric_price is not None
+    )
+
+
+def calculate_costs(
+    usage: dict, model_name: str, pricing: Mapping[str, Price]
+) -> dict:
     """
     Calculate cost in dollars based on usage data and pricing for a model.
 
@@ -307,9 +370,9 @@ def calculate_costs(usage: dict, model_name: str, pricing: dict) -> dict:
         Usage data containing keys like 'input_tokens', 'output_tokens',
         'cached_input_tokens'.
     model_name : str
-        The model name to look up in the pricing dict.
-    pricing : dict
-        The full pricing dictionary (model_name -> price_dict).
+        The model name to look up in the pricing mapping.
+    pricing : Mapping[str, Price]
+        The pricing table returned by load_pricing.
 
     Returns
     -------
@@ -318,8 +381,13 @@ def calculate_costs(usage: dict, model_name: str, pricing: dict) -> dict:
         cached_input_cost).
     """
     model_pricing = pricing.get(model_name)
-    if not model_pricing:
-        if model_name and model_name.lower() != "unknown":
+    if model_pricing is None:
+        if (
+            model_name
+            and model_name.lower() != "unknown"
+            and model_name not in _warned_missing_models
+        ):
+            _warned_missing_models.add(model_name)
             print(
                 f"Warning: Pricing for model '{model_name}' not found. "
                 f"Costs will be $0.",
@@ -327,16 +395,8 @@ def calculate_costs(usage: dict, model_name: str, pricing: dict) -> dict:
             )
         return {}
 
-    costs = {}
-
-    # Token costs: price is $/1M tokens
-    if "input_tokens" in usage and "input" in model_pricing:
-        costs["input_cost"] = (usage["input_tokens"] / 1_000_000) * model_pricing["input"]
-    if "output_tokens" in usage and "output" in model_pricing:
-        costs["output_cost"] = (usage["output_tokens"] / 1_000_000) * model_pricing["output"]
-    if "cached_input_tokens" in usage and "cached_input" in model_pricing:
-        costs["cached_input_cost"] = (
-            usage["cached_input_tokens"] / 1_000_000
-        ) * model_pricing["cached_input"]
-
-    return costs
+    return {
+        cost_key: usage[usage_key] * rate
+        for usage_key, cost_key, rate in _rates_for(model_pricing)
+        if usage_key in usage
+    }
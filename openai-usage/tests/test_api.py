@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+import requests
+
+from openai_usage import api
+from openai_usage.api import _parse_ymd, _ymd_from_ts
+from openai_usage.pricing import Price
+
+
+def test_parse_ymd_returns_utc_midnight() -> None:
+    assert _parse_ymd("2024-02-29") == datetime(2024, 2, 29, tzinfo=timezone.utc)
+
+
+def test_parse_ymd_rejects_invalid_dates() -> None:
+    with pytest.raises(ValueError):
+        _parse_ymd("2024-02-30")
+    with pytest.raises(ValueError):
+        _parse_ymd("2024/02/01")
+
+
+def test_ymd_from_ts_formats_utc_date() -> None:
+    assert _ymd_from_ts(1709164800) == "2024-02-29"
+
+
+def test_fetch_usage_details_merges_weekly_windows_in_order(monkeypatch) -> None:
+    windows: list[tuple[int, int]] = []
+
+    def _fake_window(project_id, headers, api_keys_map, pricing, start, end):
+        windows.append((start, end))
+        return {_ymd_from_ts(start): [{"window_start": start}]}
+
+    monkeypatch.setattr(api, "_fetch_usage_window", _fake_window)
+
+    usage = api.fetch_usage_details(
+        "proj_1", "key", {}, {}, "2024-01-01", "2024-01-20"
+    )
+
+    assert sorted(windows) == [
+        (1704067200, 1704671999),
+        (1704672000, 1705276799),
+        (1705276800, 1705795199),
+    ]
+    assert list(usage) == ["2024-01-01", "2024-01-08", "2024-01-15"]
+
+
+def test_fetch_project_usage_reuses_cache_for_past_ranges(
+    monkeypatch, tmp_path
+) -> None:
+    calls: list[str] = []
+
+    def _fake_details(project_id, api_key, api_keys_map, pricing, start, end):
+        calls.append(project_id)
+        return {"2024-01-01": [{"model": "gpt-test", "input_tokens": 1_000_000}]}
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(api, "fetch_all_api_keys", lambda project_id, key: {})
+    monkeypatch.setattr(api, "fetch_usage_details", _fake_details)
+    pricing = {"gpt-test": Price(input=2.0)}
+
+    api.fetch_project_usage("proj_1", "key", pricing, "2024-01-01", "2024-01-31")
+    cached = api.fetch_project_usage(
+        "proj_1", "key", pricing, "2024-01-01", "2024-01-31"
+    )
+    api.fetch_project_usage(
+        "proj_1", "key", pricing, "2024-01-01", "2024-01-31", use_cache=False
+    )
+
+    assert calls == ["proj_1", "proj_1"]
+    assert cached["2024-01-01"][0]["costs"] == {"input_cost": 2.0}
+
+
+def test_cached_usage_for_open_ranges_expires(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache_path = api._usage_cache_path("proj_1", None, None)
+    api._save_cached_usage(cache_path, {"2024-01-01": []})
+
+    assert api._load_cached_usage(cache_path, None, {}) == {"2024-01-01": []}
+
+    monkeypatch.setattr(api, "USAGE_CACHE_TTL_SECONDS", -1)
+    assert api._load_cached_usage(cache_path, None, {}) is None
+
+
+def test_cached_usage_for_unpadded_future_end_date_expires(
+    monkeypatch, tmp_path
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    next_year = datetime.now(timezone.utc).year + 1
+    end_date = f"{next_year}-1-1"
+    cache_path = api._usage_cache_path("proj_1", None, end_date)
+    api._save_cached_usage(cache_path, {"2024-01-01": []})
+
+    monkeypatch.setattr(api, "USAGE_CACHE_TTL_SECONDS", -1)
+    assert api._load_cached_usage(cache_path, end_date, {}) is None
+    assert api._load_cached_usage(cache_path, "2024-1-1", {}) == {"2024-01-01": []}
+
+
+def test_usage_cache_key_resolves_missing_start_to_current_month(
+    monkeypatch, tmp_path
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    month_start = datetime.now(timezone.utc).strftime("%Y-%m-01")
+
+    assert api._usage_cache_path("proj_1", None, "2024-01-31") == (
+        api._usage_cache_path("proj_1", month_start, "2024-01-31")
+    )
+    assert api._usage_cache_path("proj_1", None, "2024-01-31") != (
+        api._usage_cache_path("proj_1", "2023-12-01", "2024-01-31")
+    )
+
+
+class _FakeResponse:
+    def __init__(self, payload: dict) -> None:
+        self.content = json.dumps(payload).encode()
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def test_fetch_usage_window_follows_pages(monkeypatch) -> None:
+    pages = [
+        {
+            "data": [
+                {
+                    "start_time": 1704067200,
+                    "results": [
+                        {"api_key_id": "k1", "model": "gpt-test"},
+                        {"api_key_id": "gone", "model": "gpt-test"},
+                    ],
+                }
+            ],
+            "next_page": "page_2",
+        },
+        {"data": [{"start_time": 1704153600, "results": []}], "next_page": None},
+    ]
+    seen_params: list[dict] = []
+
+    def _fake_get(url, headers=None, params=None):
+        seen_params.append(params)
+        return _FakeResponse(pages[len(seen_params) - 1])
+
+    monkeypatch.setattr(api._SESSION, "get", _fake_get)
+
+    usage = api._fetch_usage_window(
+        "proj_1", {}, {"k1": "Key One"}, {}, 1704067200, 1704239999
+    )
+
+    assert seen_params[1]["page"] == "page_2"
+    assert seen_params[1]["project_id"] == "proj_1"
+    assert list(usage) == ["2024-01-01", "2024-01-02"]
+    assert [r["api_key_name"] for r in usage["2024-01-01"]] == ["Key One"]
+
+
+def test_iter_usage_pages_reports_request_setup_errors(monkeypatch) -> None:
+    def _fake_get(url, headers=None, params=None):
+        raise requests.exceptions.InvalidURL("bad url")
+
+    monkeypatch.setattr(api._SESSION, "get", _fake_get)
+
+    with pytest.raises(Exception, match="Request failed .*: bad url"):
+        next(api._iter_usage_pages("proj_1", {}, 1704067200, 1704239999))
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import pytest
+
+from openai_usage.display import build_sort_key, display_results
+
+_ITEM = {
+    "project_id": "proj_1",
+    "date": "2026-01-05",
+    "api_key_name": "Key A",
+    "model": "gpt-4o",
+}
+
+
+@pytest.mark.parametrize(
+    ("criteria", "expected"),
+    [
+        ([], ("Project One", "2026-01", "2026-01-05", "Key A", "gpt-4o")),
+        (["month", "key"], ("2026-01", "Key A", "Project One", "2026-01-05", "gpt-4o")),
+        (
+            ["model", "day", "project"],
+            ("gpt-4o", "2026-01-05", "Project One", "2026-01", "Key A"),
+        ),
+        (["Bogus"], ("", "Project One", "2026-01", "2026-01-05", "Key A", "gpt-4o")),
+    ],
+)
+def test_build_sort_key_orders_requested_criteria_first(
+    criteria: list[str], expected: tuple
+) -> None:
+    key_fn = build_sort_key(criteria, {"proj_1": "Project One"})
+
+    assert key_fn(_ITEM) == expected
+
+
+def test_build_sort_key_defaults_missing_fields() -> None:
+    key_fn = build_sort_key(["project"], {})
+
+    assert key_fn({"project_id": "proj_2", "date": "2026"}) == (
+        "proj_2",
+        "2026",
+        "2026",
+        "",
+        "",
+    )
+    assert key_fn({}) == ("", "", "", "", "")
+
+
+def test_display_results_colors_only_when_enabled(capsys, monkeypatch) -> None:
+    usage = [
+        {
+            "project_id": "proj_1",
+            "date": "2026-01-05",
+            "api_key_name": "Key A",
+            "model": "gpt-4o",
+            "costs": {"input_cost": 0.5},
+        }
+    ]
+    monkeypatch.delenv("FORCE_COLOR", raising=False)
+    monkeypatch.delenv("NO_COLOR", raising=False)
+    monkeypatch.delenv("ANSI_COLORS_DISABLED", raising=False)
+
+    display_results(usage, {}, ["project"])
+    assert "\x1b[" not in capsys.readouterr().out
+
+    monkeypatch.setenv("FORCE_COLOR", "1")
+    display_results(usage, {}, ["project"])
+    assert "\x1b[36m2026-01-05" in capsys.readouterr().out
+
+
+def test_display_results_totals_match_displayed_rows(capsys) -> None:
+    usage = [
+        {
+            "project_id": "proj_1",
+            "date": f"2026-01-0{day}",
+            "api_key_name": "Key A",
+            "model": "gpt-4o",
+            "costs": {"input_cost": 0.00004},
+        }
+        for day in range(1, 4)
+    ]
+
+    display_results(usage, {}, ["project"])
+
+    out = capsys.readouterr().out
+    assert "$0.0001" not in out
+    assert out.count("$0.0000") == 2
+
+
+def test_display_results_emits_one_subtotal_per_group(capsys) -> None:
+    usage = [
+        {
+            "project_id": f"proj_{day % 2}",
+            "date": f"2026-01-0{day}",
+            "api_key_name": "Key A",
+            "model": "gpt-4o",
+            "costs": {"input_cost": 1.0},
+        }
+        for day in range(1, 7)
+    ]
+
+    display_results(usage, {"proj_0": "Project Zero"}, ["project", "day"])
+
+    out = capsys.readouterr().out
+    assert out.count("Total for Project Project Zero") == 1
+    assert out.count("Total for Project proj_1") == 1
+    assert "$6.0000" in out
+
+
+def test_display_results_draws_a_boxed_table(capsys) -> None:
+    usage = [{"project_id": "proj_1", "date": "2026-01-05", "costs": {}}]
+
+    display_results(usage, {}, ["day"])
+
+    out = capsys.readouterr().out
+    assert out.startswith("+-")
+    assert out.endswith("+\n")
+    assert out.count("| Total for day 2026-01-05") == 1
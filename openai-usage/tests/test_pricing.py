@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import pytest
+
+from openai_usage.pricing import Price, _build_price_table, calculate_costs
+
+
+def test_calculate_costs_prices_only_known_metrics() -> None:
+    pricing = {"gpt-test": Price(input=2.0, output=8.0)}
+    usage = {
+        "input_tokens": 500_000,
+        "output_tokens": 1_000_000,
+        "cached_input_tokens": 10,
+    }
+
+    costs = calculate_costs(usage, "gpt-test", pricing)
+
+    assert costs == {"input_cost": 1.0, "output_cost": 8.0}
+
+
+def test_calculate_costs_warns_once_per_missing_model(capsys) -> None:
+    for _ in range(3):
+        assert calculate_costs({"input_tokens": 1}, "gpt-missing", {}) == {}
+
+    assert capsys.readouterr().err.count("gpt-missing") == 1
+
+
+def test_build_price_table_freezes_known_fields() -> None:
+    table = _build_price_table(
+        {"gpt-test": {"input": 1.0, "cached_input": 0.5, "audio": 9.0}}
+    )
+
+    assert table["gpt-test"] == Price(input=1.0, cached_input=0.5)
+    assert "gpt-other" not in table
+    with pytest.raises(TypeError):
+        table["gpt-other"] = Price()  # type: ignore[index]
@@ -3,13 +3,26 @@ import time
 import re
 import os
 import collections  # For deque
+import functools
+import mmap
+import signal
 from datetime import timedelta
-import plotext as pltext  # Import de plotext
+from typing import NamedTuple
+
+try:  # Optional: wait for log writes with inotify instead of polling (Linux)
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
 
 # --- Configuration ---
 TASKS_ROOT = '/var/log/pve/tasks/'
 ACTIVE_PATH = TASKS_ROOT + 'active'
 
+# Log following: maximum wait for new data before the display is refreshed
+# anyway (inotify), and polling interval when inotify is not available
+LOG_WAIT_TIMEOUT_MS = 1000
+LOG_POLL_INTERVAL_S = 0.5
+
 # CLI display configuration
 # Height of the throughput graph in text lines
 PLOT_HEIGHT_LINES = 8
@@ -35,8 +48,29 @@ except OSError:  # May fail if not in a real terminal (e.g. pipe)
 # Number of points in throughput history / graph width
 PLOT_WIDTH_POINTS = min(TERM_WIDTH_CHARS - 10, 70)
 
+# Number of latest progress samples used to compute the current speed
+SPEED_WINDOW_POINTS = 10
+
+# Precompiled patterns for the per-line parsing helpers
+_UPID_RE = re.compile(
+    r'^(UPID:[^:]+:[0-9A-F]+:[0-9A-F]+:[0-9A-F]+:([a-zA-Z0-9\-_]+):([^:]*):([^:\s]+))(:?\s+(\S.*))?$')
+_PROGRESS_RE = re.compile(
+    r'transferred ([\d.]+) GiB of ([\d.]+) GiB \([\d.]+%\) in (\d+)m (\d+)s')
+
 first_cli_print_done = False
 
+
+class TaskInfo(NamedTuple):
+    '''
+    Parsed fields of a Proxmox task UPID line.
+    '''
+    upid: str
+    action: str
+    vmid: str
+    user: str
+    status: str
+
+
 # Utility functions (those unchanged can be omitted here for brevity,
 # but must be present in your final .py file)
 
@@ -50,25 +84,17 @@ def parse_upid(line):
                     Example: UPID:node:PID:STARTTIME:PSTART:TYPE:ID:USER: STATUS
 
     Returns:
-        dict or None: A dictionary with parsed information (upid, action, vmid, user, status)
-                      if parsing is successful, otherwise None.
+        TaskInfo or None: The parsed information (upid, action, vmid, user, status)
+                          if parsing is successful, otherwise None.
     '''
-    match = re.match(
-        r'^(UPID:[^:]+:[0-9A-F]+:[0-9A-F]+:[0-9A-F]+:([a-zA-Z0-9\-_]+):([^:]*):([^:\s]+))(:?\s+(\S.*))?$',
-        line)
+    match = _UPID_RE.match(line)
     if match:
         upid_str = match.group(1)
         action_type = match.group(2)
         vmid_val = match.group(3) if match.group(3) else 'N/A'
         user_val = match.group(4)
         status_msg = (match.group(6) or '').strip()
-        return {
-            'upid': upid_str,
-            'action': action_type,
-            'vmid': vmid_val,
-            'user': user_val,
-            'status': status_msg
-        }
+        return TaskInfo(upid_str, action_type, vmid_val, user_val, status_msg)
     return None
 
 
@@ -77,16 +103,16 @@ def read_active_tasks():
     Read and parse the list of currently active Proxmox tasks from the active tasks file.
 
     Returns:
-        list[dict]: A list of dictionaries, where each dictionary represents an active task.
-                    Returns an empty list if the file doesn't exist or an error occurs.
+        list[TaskInfo]: A list of parsed active tasks.
+                        Returns an empty list if the file doesn't exist or an error occurs.
     '''
     active_tasks_list = []
     try:
-        with open(ACTIVE_PATH, 'r') as f:
+        # UPID lines are ASCII; only matching lines get their newline stripped
+        with open(ACTIVE_PATH, 'r', buffering=-1, encoding='ascii', errors='replace') as f:
             for current_line in f:
-                current_line = current_line.strip()
                 if current_line.startswith('UPID:'):
-                    task_info = parse_upid(current_line)
+                    task_info = parse_upid(current_line.rstrip())
                     if task_info:
                         active_tasks_list.append(task_info)
     except FileNotFoundError:
@@ -97,10 +123,12 @@ def read_active_tasks():
     return active_tasks_list
 
 
+@functools.lru_cache(maxsize=128)
 def find_task_logfile(upid_str):
     '''
     Find the log file path for a given Proxmox task UPID.
     The subfolder is determined by the first character of the PSTART field (4th hex field) of the UPID.
+    Results are cached per UPID, so repeated lookups do not rescan the task folders.
 
     Args:
         upid_str (str): The UPID string of the task.
@@ -119,6 +147,12 @@ def find_task_logfile(upid_str):
     log_filename_candidate = upid_str if upid_str.endswith(
         ':') else upid_str + ':'
 
+    # Exact file names first, avoiding a directory listing
+    for exact_name in (log_filename_candidate, upid_str):
+        path = os.path.join(expected_folder_path, exact_name)
+        if os.path.isfile(path):
+            return path
+
     if os.path.isdir(expected_folder_path):
         for filename in os.listdir(expected_folder_path):
             # Adjusted for flexibility
@@ -150,9 +184,10 @@ def parse_progress_line(log_line):
         tuple[int, float, float] or None: A tuple (elapsed_seconds, transferred_gib, total_gib)
                                          if progress information is found, otherwise None.
     '''
-    match = re.search(
-        r'transferred ([\d.]+) GiB of ([\d.]+) GiB \([\d.]+%\) in (\d+)m (\d+)s',
-        log_line)
+    # Cheap substring check rejects most lines before running the regex
+    if 'transferred ' not in log_line:
+        return None
+    match = _PROGRESS_RE.search(log_line)
     if match:
         transferred_gib = float(match.group(1))
         total_gib = float(match.group(2))
@@ -167,23 +202,49 @@ def follow_log(log_file_path):
     '''
     A generator that yields new lines appended to a log file.
     Starts reading from the end of the file for live monitoring.
+    Appended bytes are read through a read-only mmap of the file, up to the last
+    complete line. When no more data is available it yields "" and then waits for
+    the file to be modified (inotify if available, otherwise polling) or for a
+    timeout.
 
     Args:
         log_file_path (str): The path to the log file.
 
     Yields:
-        str: The next new line appended to the file, or "" on timeout.
+        str: The next new line appended to the file, or "" once caught up.
     '''
+    inotify = None
     try:
-        with open(log_file_path, 'r') as f:
-            f.seek(0, 2)
+        with open(log_file_path, 'rb') as f:
+            read_pos = os.fstat(f.fileno()).st_size
+            if INotify is not None:
+                try:
+                    inotify = INotify()
+                    inotify.add_watch(log_file_path, inotify_flags.MODIFY)
+                except OSError:
+                    inotify = None
             while True:
-                current_line = f.readline()
-                if not current_line:
-                    time.sleep(0.1)
-                    yield ""
+                file_size = os.fstat(f.fileno()).st_size
+                if file_size < read_pos:  # Truncated: follow from the new end
+                    read_pos = file_size
+                new_bytes = b''
+                if file_size > read_pos:
+                    with mmap.mmap(f.fileno(), file_size, access=mmap.ACCESS_READ) as mm:
+                        # Only consume complete lines; a partial last line is
+                        # picked up once its newline has been written
+                        last_newline = mm.rfind(b'\n', read_pos, file_size)
+                        if last_newline != -1:
+                            new_bytes = mm[read_pos:last_newline]
+                            read_pos = last_newline + 1
+                if new_bytes:
+                    for raw_line in new_bytes.split(b'\n'):
+                        yield raw_line.decode('utf-8', 'replace').strip()
                     continue
-                yield current_line.strip()
+                yield ""
+                if inotify is not None:
+                    inotify.read(timeout=LOG_WAIT_TIMEOUT_MS)
+                else:
+                    time.sleep(LOG_POLL_INTERVAL_S)
     except FileNotFoundError:
         print(
             f"Error: Log file '{log_file_path}' not found during follow.", file=sys.stderr)
@@ -192,52 +253,34 @@ def follow_log(log_file_path):
         print(
             f"Error following log file '{log_file_path}': {e}", file=sys.stderr)
         yield None  # Signal exhaustion or error
+    finally:
+        if inotify is not None:
+            inotify.close()
 
 
-def calculate_eta_and_speed(times_data_list, progresses_data_list, current_total_gib_val):
+def calculate_eta_and_speed(sum_dt, sum_dp, last_progress_gib, current_total_gib_val):
     '''
     Calculate current transfer speed and Estimated Time of Arrival (ETA).
 
     Args:
-        times_data_list (list[int]): List of elapsed times in seconds.
-        progresses_data_list (list[float]): List of transferred data in GiB.
+        sum_dt (float): Sum of the time deltas (seconds) in the speed window.
+        sum_dp (float): Sum of the progress deltas (GiB) in the speed window.
+        last_progress_gib (float or None): Latest transferred amount in GiB.
         current_total_gib_val (float or None): Total size of the transfer in GiB.
 
     Returns:
         tuple[float, float, float]: (current_speed_mib_s, eta_seconds_val, percent_complete_val)
     '''
-    if not times_data_list or len(times_data_list) < 2 or current_total_gib_val is None:
-        percent_val = 0.0
-        if current_total_gib_val and progresses_data_list:
-            percent_val = (
-                progresses_data_list[-1] / current_total_gib_val * 100)
-        return 0.0, float('inf'), percent_val
-
-    window_points = min(10, len(times_data_list))
-    if window_points < 2:
-        percent_val = (progresses_data_list[-1] / current_total_gib_val * 100)
-        return 0.0, float('inf'), percent_val
-
-    relevant_times = times_data_list[-window_points:]
-    relevant_progress = progresses_data_list[-window_points:]
-
-    total_delta_time = 0
-    total_delta_progress = 0
-    for i in range(1, len(relevant_times)):
-        dt = relevant_times[i] - relevant_times[i-1]
-        dp = relevant_progress[i] - relevant_progress[i-1]
-        if dt > 0:
-            total_delta_time += dt
-            total_delta_progress += dp
+    if last_progress_gib is None or not current_total_gib_val:
+        return 0.0, float('inf'), 0.0
 
     current_speed_gib_s = 0.0
-    if total_delta_time > 0:
-        current_speed_gib_s = total_delta_progress / total_delta_time
+    if sum_dt > 0:
+        current_speed_gib_s = sum_dp / sum_dt
 
     current_speed_mib_s = current_speed_gib_s * 1024
-    percent_complete_val = (
-        progresses_data_list[-1] / current_total_gib_val * 100)
-    remaining_gib = current_total_gib_val - progresses_data_list[-1]
+    percent_complete_val = (last_progress_gib / current_total_gib_val * 100)
+    remaining_gib = current_total_gib_val - last_progress_gib
     eta_seconds_val = float('inf')
 
     if current_speed_gib_s > 1e-9:
@@ -246,38 +289,91 @@ def calculate_eta_and_speed(times_data_list, progresses_data_list, current_total
     return current_speed_mib_s, eta_seconds_val, percent_complete_val
 
 
-plotext_size_warning_shown = False
+# Braille cells with their bottom 0-4 dot rows filled (both dot columns)
+_BRAILLE_BLANK = 0x2800
+_BRAILLE_FILL_BY_ROWS = (0x00, 0xC0, 0xE4, 0xF6, 0xFF)
+
+
+def render_speed_graph(values, width, height):
+    '''
+    Render speed values as a filled braille area graph.
+    The first line is a title with the scale; each following line is a row of
+    braille cells, one cell (4 vertical dots) per value, scaled to the peak value.
 
+    Args:
+        values (Iterable[float]): Speed values (MiB/s), oldest first.
+        width (int): Maximum number of characters per line; only the latest
+                     `width` values are drawn.
+        height (int): Total number of lines, including the title.
 
-def update_cli_display(task_details, times_list, progresses_list, total_gib_val,
-                       speed_history_q, recent_logs_q, status_str="Monitoring..."):
+    Returns:
+        list[str]: The graph lines, or an empty list if there is nothing to draw.
+    '''
+    values = list(values)[-width:]
+    rows = height - 1
+    if not values or rows < 1:
+        return []
+
+    peak = max(values)
+    title = f"Speed History (MiB/s) - peak {peak:.1f}, now {values[-1]:.1f}"
+    dot_levels = rows * 4
+    scale = dot_levels / peak if peak > 0 else 0.0
+
+    grid = [[_BRAILLE_BLANK] * len(values) for _ in range(rows)]
+    for x, value in enumerate(values):
+        filled = min(dot_levels, max(0, int(round(value * scale))))
+        full_rows, partial_dots = divmod(filled, 4)
+        for row in range(rows - full_rows, rows):
+            grid[row][x] |= _BRAILLE_FILL_BY_ROWS[4]
+        if partial_dots:
+            grid[rows - 1 - full_rows][x] |= _BRAILLE_FILL_BY_ROWS[partial_dots]
+
+    return [title[:width]] + ["".join(map(chr, row)) for row in grid]
+
+
+# Last rendered speed graph and the speed history it was rendered from
+_cached_graph_key = None
+_cached_graph_lines = []
+# Lines last drawn for each screen region (stats, graph, logs); None forces a redraw
+_prev_region_lines = [None, None, None]
+
+
+def update_cli_display(task_details, current_metrics, last_progress_gib, total_gib_val,
+                       speed_history_q, recent_logs_q, status_str="Monitoring...",
+                       log_file_path_str=None):
     '''
     Refresh the CLI display with current migration progress, speed graph, and status.
-    Uses ANSI escape codes and plotext to update a fixed number of lines in place.
-    Includes compatibility for plotext size setting.
+    Uses ANSI escape codes to update a fixed number of lines in place; only the
+    regions (stats, graph, logs) whose lines changed since the last frame are redrawn.
 
     Args:
-        task_details (dict): Dictionary containing details of the task being monitored.
-        times_list (list[int]): List of time points.
-        progresses_list (list[float]): List of progress points.
+        task_details (TaskInfo): Details of the task being monitored.
+        current_metrics (tuple[float, float, float] or None): (speed_mib_s,
+                                 eta_seconds, percent) as computed by
+                                 calculate_eta_and_speed for the latest sample.
+        last_progress_gib (float or None): Latest transferred amount in GiB.
         total_gib_val (float or None): Total GiB to transfer.
         speed_history_q (collections.deque): Deque of recent speed values (MiB/s).
         recent_logs_q (collections.deque): Deque of recent log lines.
         status_str (str): Current status message for the task.
+        log_file_path_str (str or None): Path of the monitored log file; looked up
+                                         from the UPID when not given.
     '''
-    global first_cli_print_done, plotext_size_warning_shown
+    global first_cli_print_done
+    global _cached_graph_key, _cached_graph_lines, _prev_region_lines
     global NUM_CLI_OUTPUT_LINES, PLOT_WIDTH_POINTS, PLOT_HEIGHT_LINES
     # Ensure these constants are defined globally or passed as arguments
     global LINES_FOR_STATS_AND_HEADER, LINES_FOR_GRAPH_BLOCK, LINE_FOR_LOG_TITLE
 
-    vm_id_str = task_details['vmid']
-    node_str = task_details['upid'].split(':')[1]
-    log_file_path_str = find_task_logfile(task_details['upid']) or "N/A"
+    vm_id_str = task_details.vmid
+    node_str = task_details.upid.split(':')[1]
+    if log_file_path_str is None:
+        log_file_path_str = find_task_logfile(task_details.upid) or "N/A"
 
     output_lines_list = []
 
     # --- Section 1: Stats --- (same as previous version)
-    if not progresses_list or total_gib_val is None:
+    if current_metrics is None or last_progress_gib is None or total_gib_val is None:
         output_lines_list.extend([
             f"VM: {vm_id_str} on {node_str} - Migration Progress ({status_str})",
             "-" * (PLOT_WIDTH_POINTS + 4),
@@ -287,9 +383,8 @@ def update_cli_display(task_details, times_list, progresses_list, total_gib_val,
         while len(output_lines_list) < LINES_FOR_STATS_AND_HEADER:
             output_lines_list.append("")
     else:
-        speed_val, eta_val, percent_val = calculate_eta_and_speed(
-            times_list, progresses_list, total_gib_val)
-        prog_str = f"{progresses_list[-1]:.2f}"
+        speed_val, eta_val, percent_val = current_metrics
+        prog_str = f"{last_progress_gib:.2f}"
         total_str = f"{total_gib_val:.2f}"
         perc_str = f"{percent_val:.2f}%"
         speed_str = f"{speed_val:.1f} MiB/s"
@@ -309,47 +404,28 @@ def update_cli_display(task_details, times_list, progresses_list, total_gib_val,
         ])
     output_lines_list = output_lines_list[:LINES_FOR_STATS_AND_HEADER]
 
-    # --- Section 2: Speed Graph (plotext) ---
+    # --- Section 2: Speed Graph ---
     # Separator before graph
     output_lines_list.append("-" * (PLOT_WIDTH_POINTS + 4))
 
-    graph_lines_generated = []
-    if speed_history_q and len(speed_history_q) > 1:
-        pltext.clear_figure()
+    # Re-render only when the speed history changed since the last frame
+    speed_history_snapshot = tuple(speed_history_q)
+    if speed_history_snapshot != _cached_graph_key:
+        graph_lines_generated = []
+        if speed_history_q and len(speed_history_q) > 1:
+            graph_lines_generated.extend(render_speed_graph(
+                speed_history_q, PLOT_WIDTH_POINTS, PLOT_HEIGHT_LINES))
 
-        # Set graph size - compatibility handling
-        try:
-            # For plotext >= 5.x.x (figsize or plot_size are often aliases)
-            pltext.figsize(PLOT_WIDTH_POINTS, PLOT_HEIGHT_LINES)
-        except AttributeError:
-            try:
-                # For plotext ~4.x.x and some earlier 5.x versions
-                pltext.plot_size(PLOT_WIDTH_POINTS, PLOT_HEIGHT_LINES)
-            except AttributeError:
-                # If no direct sizing method found
-                if not plotext_size_warning_shown:
-                    # Print warning outside refresh block to avoid alignment disruption
-                    # sys.stderr is preferred for error/warning messages
-                    # This warning will be shown only once.
-                    # To display it properly, it should be done before main refresh loop.
-                    # For now, we note it here. Could be moved higher.
-                    # print("\nWarning: Could not set plotext size (figsize/plot_size not found). Graph may use default size. Consider `pip install --upgrade plotext`.", file=sys.stderr)
-                    # plotext_size_warning_shown = True # Manage this global state if needed
-                    pass  # plotext will use its default size or adapt
-
-        pltext.plot(list(speed_history_q), marker="braille")
-        pltext.title("Speed History (MiB/s)")
-        graph_str_lines = pltext.build().splitlines()
-        # Ensure graph does not exceed PLOT_HEIGHT_LINES
-        graph_lines_generated.extend(graph_str_lines[:PLOT_HEIGHT_LINES])
-
-    # Fill graph space even if empty or smaller than expected
-    while len(graph_lines_generated) < PLOT_HEIGHT_LINES:
-        # Empty line of graph width
-        graph_lines_generated.append(" " * PLOT_WIDTH_POINTS)
-
-    # Ensure no overflow
-    output_lines_list.extend(graph_lines_generated[:PLOT_HEIGHT_LINES])
+        # Fill graph space even if empty or smaller than expected
+        while len(graph_lines_generated) < PLOT_HEIGHT_LINES:
+            # Empty line of graph width
+            graph_lines_generated.append(" " * PLOT_WIDTH_POINTS)
+
+        _cached_graph_key = speed_history_snapshot
+        # Ensure no overflow
+        _cached_graph_lines = graph_lines_generated[:PLOT_HEIGHT_LINES]
+
+    output_lines_list.extend(_cached_graph_lines)
 
     # Separator after graph
     output_lines_list.append("-" * (PLOT_WIDTH_POINTS + 4))
@@ -366,24 +442,67 @@ def update_cli_display(task_details, times_list, progresses_list, total_gib_val,
         output_lines_list.append("")
     output_lines_list = output_lines_list[:NUM_CLI_OUTPUT_LINES]
 
-    # ANSI escape codes for in-place update
-    if first_cli_print_done:
-        sys.stdout.write(f"\033[{NUM_CLI_OUTPUT_LINES}A")
-    else:
-        first_cli_print_done = True
+    if not first_cli_print_done:
+        _prev_region_lines = [None, None, None]
+
+    # ANSI escape codes for in-place update, emitted as a single frame write.
+    # The cursor rests on the line below the frame between refreshes; the frame's
+    # absolute row is unknown, so dirty regions are reached with relative moves.
+    graph_end_row = LINES_FOR_STATS_AND_HEADER + LINES_FOR_GRAPH_BLOCK
+    region_bounds = ((0, LINES_FOR_STATS_AND_HEADER),
+                     (LINES_FOR_STATS_AND_HEADER, graph_end_row),
+                     (graph_end_row, NUM_CLI_OUTPUT_LINES))
+    frame_parts = []
+    cursor_row = NUM_CLI_OUTPUT_LINES if first_cli_print_done else 0
+    for region_idx, (start_row, end_row) in enumerate(region_bounds):
+        region_lines = output_lines_list[start_row:end_row]
+        if region_lines == _prev_region_lines[region_idx]:
+            continue
+        if cursor_row > start_row:
+            frame_parts.append(f"\033[{cursor_row - start_row}A")
+        elif cursor_row < start_row:
+            frame_parts.append(f"\033[{start_row - cursor_row}B")
+        frame_parts.extend(f"\033[2K{line_to_print}\n" for line_to_print in region_lines)
+        cursor_row = end_row
+        _prev_region_lines[region_idx] = region_lines
+    first_cli_print_done = True
+
+    if not frame_parts:
+        return
+    # Park the cursor back below the frame
+    if cursor_row < NUM_CLI_OUTPUT_LINES:
+        frame_parts.append(f"\033[{NUM_CLI_OUTPUT_LINES - cursor_row}B")
 
-    for line_to_print in output_lines_list:
-        sys.stdout.write(f"\033[2K{line_to_print}\n")
+    sys.stdout.write("".join(frame_parts))
     sys.stdout.flush()
 
 
+def _on_terminal_resize(signum, frame):
+    '''
+    SIGWINCH handler: recompute the terminal-dependent widths so the next refresh
+    adapts to the new size, and drop the cached graph rendered at the old width.
+    The main loop resizes the speed history to the new width before that refresh.
+
+    Args:
+        signum (int): The received signal number.
+        frame (frame or None): The interrupted stack frame.
+    '''
+    global TERM_WIDTH_CHARS, PLOT_WIDTH_POINTS, _cached_graph_key
+    try:
+        TERM_WIDTH_CHARS = os.get_terminal_size().columns
+    except OSError:
+        return
+    PLOT_WIDTH_POINTS = min(TERM_WIDTH_CHARS - 10, 70)
+    _cached_graph_key = None
+
+
 def print_final_summary(task_details, final_status_msg, log_file_path_str):
     '''
     Prints a final summary message when monitoring ends.
     Ensures this message is printed below the dynamic CLI block.
 
     Args:
-        task_details (dict): Details of the monitored task.
+        task_details (TaskInfo): Details of the monitored task.
         final_status_msg (str): The final status of the task (e.g., Completed, Failed, Interrupted).
         log_file_path_str (str or None): Path to the log file.
     '''
@@ -391,8 +510,8 @@ def print_final_summary(task_details, final_status_msg, log_file_path_str):
     if first_cli_print_done:  # If dynamic block was active, ensure we are below it
         sys.stdout.write("\n")
 
-    vm_id_str = task_details['vmid']
-    node_str = task_details['upid'].split(':')[1]
+    vm_id_str = task_details.vmid
+    node_str = task_details.upid.split(':')[1]
 
     print("-" * 70)
     print(f"Monitoring for VM {vm_id_str} on {node_str} ended.")
@@ -407,12 +526,16 @@ def main():
     Main function to select a Proxmox qmigrate task and monitor its progress in the CLI,
     including a text-based graph of transfer speed.
     '''
-    global first_cli_print_done, PLOT_WIDTH_POINTS
+    global first_cli_print_done
     first_cli_print_done = False
 
+    # Widths are only recomputed when the terminal is resized (Unix only)
+    if hasattr(signal, 'SIGWINCH'):
+        signal.signal(signal.SIGWINCH, _on_terminal_resize)
+
     active_qmigrate_tasks = [
         task for task in read_active_tasks()
-        if task['action'] == "qmigrate" and (task['status'] == "0" or task['status'] == "")
+        if task.action == "qmigrate" and (task.status == "0" or task.status == "")
     ]
 
     if not active_qmigrate_tasks:
@@ -423,12 +546,12 @@ def main():
     if len(active_qmigrate_tasks) == 1:
         task_to_monitor_details = active_qmigrate_tasks[0]
         print(
-            f"Auto-selecting task: VM {task_to_monitor_details['vmid']} on node {task_to_monitor_details['upid'].split(':')[1]}")
+            f"Auto-selecting task: VM {task_to_monitor_details.vmid} on node {task_to_monitor_details.upid.split(':')[1]}")
     else:
         print("Ongoing qmigrate tasks found:")
         for idx, task in enumerate(active_qmigrate_tasks):
             print(
-                f"  {idx+1}. VM {task['vmid']} on node {task['upid'].split(':')[1]} (UPID: {task['upid']})")
+                f"  {idx+1}. VM {task.vmid} on node {task.upid.split(':')[1]} (UPID: {task.upid})")
         try:
             choice_idx = int(
                 input(f"Select task [1-{len(active_qmigrate_tasks)}]: ")) - 1
@@ -439,10 +562,10 @@ def main():
             print("Invalid selection.")
             return
 
-    log_file_to_monitor = find_task_logfile(task_to_monitor_details['upid'])
+    log_file_to_monitor = find_task_logfile(task_to_monitor_details.upid)
     if not log_file_to_monitor:
         print(
-            f"Error: Could not find log file for UPID {task_to_monitor_details['upid']}.")
+            f"Error: Could not find log file for UPID {task_to_monitor_details.upid}.")
         return
 
     print(f"Attempting to monitor log: {log_file_to_monitor}")
@@ -450,11 +573,18 @@ def main():
     time.sleep(1)
 
     log_lines_generator = follow_log(log_file_to_monitor)
-    time_points = []
-    progress_points = []
+    # Rolling speed window: (dt, dp) deltas between the last samples, with
+    # running sums updated as deltas enter and leave the window
+    speed_window_deltas = collections.deque(maxlen=SPEED_WINDOW_POINTS - 1)
+    window_sum_dt = 0.0
+    window_sum_dp = 0.0
+    last_elapsed_t = None
+    last_transferred_g = None
     # Store speed history for the plot (MiB/s)
     speed_history_for_plot = collections.deque(maxlen=PLOT_WIDTH_POINTS)
     current_total_transfer_gib = None
+    # (speed, eta, percent) of the latest sample, computed once per sample
+    current_metrics = None
 
     recent_logs_queue = collections.deque(maxlen=max(
         1, NUM_CLI_OUTPUT_LINES // 3))  # Dynamic log history size
@@ -464,65 +594,82 @@ def main():
 
     try:
         # Initial display before loop starts
-        update_cli_display(task_to_monitor_details, time_points, progress_points,
+        update_cli_display(task_to_monitor_details, current_metrics,
+                           last_transferred_g,
                            current_total_transfer_gib, speed_history_for_plot,
-                           recent_logs_queue, current_task_status)
+                           recent_logs_queue, current_task_status,
+                           log_file_to_monitor)
 
+        # The generator yields "" whenever the log is caught up, which is when
+        # the display is refreshed
         while True:
-            any_new_log_activity = False
+            log_line = next(log_lines_generator)
             task_log_ended = False
 
-            for _ in range(5):
-                log_line = next(log_lines_generator)
-
-                # Generator exhausted (e.g. file not found initially or error)
-                if log_line is None:
-                    current_task_status = "Log Unavailable"
-                    task_log_ended = True
-                    break
-
-                if log_line:
-                    any_new_log_activity = True
-                    recent_logs_queue.append(log_line)
+            # Generator exhausted (e.g. file not found initially or error)
+            if log_line is None:
+                current_task_status = "Log Unavailable"
+                task_log_ended = True
+            elif log_line:
+                recent_logs_queue.append(log_line)
 
+                # Every end-of-task marker contains one of these two
+                # substrings; skip the detailed checks for other lines
+                if "TASK " in log_line or "migration " in log_line:
                     if "TASK OK" in log_line or "migration status: completed" in log_line or "migration finished successfully" in log_line:
                         current_task_status = "Completed (TASK OK in log)"
                         task_log_ended = True
-                        break
-                    if "TASK ERROR" in log_line or "migration status: failed" in log_line or "migration aborted" in log_line:
+                    elif "TASK ERROR" in log_line or "migration status: failed" in log_line or "migration aborted" in log_line:
                         err_msg = log_line.split(
                             'TASK ERROR', 1)[-1].strip() if "TASK ERROR" in log_line else "failure in log"
                         current_task_status = f"Failed ({err_msg})"
                         task_log_ended = True
-                        break
 
+                if not task_log_ended:
                     progress_data = parse_progress_line(log_line)
                     if progress_data:
                         elapsed_t, transferred_g, total_g = progress_data
-                        if not time_points or elapsed_t > time_points[-1]:
-                            time_points.append(elapsed_t)
-                            progress_points.append(transferred_g)
+                        if last_elapsed_t is None or elapsed_t > last_elapsed_t:
+                            if last_elapsed_t is not None:
+                                if len(speed_window_deltas) == speed_window_deltas.maxlen:
+                                    expired_dt, expired_dp = speed_window_deltas[0]
+                                    window_sum_dt -= expired_dt
+                                    window_sum_dp -= expired_dp
+                                new_dt = elapsed_t - last_elapsed_t
+                                new_dp = transferred_g - last_transferred_g
+                                speed_window_deltas.append((new_dt, new_dp))
+                                window_sum_dt += new_dt
+                                window_sum_dp += new_dp
+                            last_elapsed_t = elapsed_t
+                            last_transferred_g = transferred_g
                             current_total_transfer_gib = total_g
 
-                            # Calculate current speed and add to history for plotting
-                            current_speed_mib, _, _ = calculate_eta_and_speed(
-                                time_points, progress_points, current_total_transfer_gib)
-                            if len(time_points) >= 2:  # Only add speed if it can be calculated
+                            # Calculate metrics once per sample; the display only formats them
+                            current_metrics = calculate_eta_and_speed(
+                                window_sum_dt, window_sum_dp, last_transferred_g,
+                                current_total_transfer_gib)
+                            if speed_window_deltas:  # Only add speed if it can be calculated
                                 speed_history_for_plot.append(
-                                    current_speed_mib)
+                                    current_metrics[0])
 
                             current_task_status = "Monitoring..."
+                    continue
 
-            update_cli_display(task_to_monitor_details, time_points, progress_points,
+            # A terminal resize changes the graph width; keep as many samples
+            if speed_history_for_plot.maxlen != PLOT_WIDTH_POINTS:
+                speed_history_for_plot = collections.deque(
+                    speed_history_for_plot, maxlen=PLOT_WIDTH_POINTS)
+
+            update_cli_display(task_to_monitor_details, current_metrics,
+                               last_transferred_g,
                                current_total_transfer_gib, speed_history_for_plot,
-                               recent_logs_queue, current_task_status)
+                               recent_logs_queue, current_task_status,
+                               log_file_to_monitor)
 
             if task_log_ended:
                 final_status_message_on_exit = current_task_status
                 break
 
-            time.sleep(0.2 if any_new_log_activity else 1.0)
-
     except KeyboardInterrupt:
         final_status_message_on_exit = "Interrupted by user"
     except StopIteration:  # Should not happen if follow_log yields None
@@ -535,7 +682,7 @@ def main():
 
 
 if __name__ == '__main__':
-    # Ensure TERM environment variable is set for plotext or terminal size detection
+    # Ensure TERM environment variable is set for terminal size detection
     if 'TERM' not in os.environ:
         # A common default that supports color
         os.environ['TERM'] = 'xterm-256color'
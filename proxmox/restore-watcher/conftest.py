@@ -0,0 +1,7 @@
+"""Pytest configuration shared by the restore watcher test modules."""
+
+# Living next to the module, this conftest puts the project root on sys.path, so
+# a bare ``pytest`` finds restore_watcher too. Importing it here loads it (and
+# compiles its regexes) once at session start; the test modules then reuse the
+# cached module.
+import restore_watcher  # noqa: F401
@@ -3,75 +3,190 @@
 from __future__ import annotations
 
 import argparse
+from array import array
 import collections
+import functools
+import itertools
 import math
+import os
+import queue
 from pathlib import Path
 import re
 import sys
+import threading
 import time
-from typing import Callable, Iterable, Iterator, Sequence, TextIO
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Sequence,
+    TextIO,
+    overload,
+)
+
+try:  # Optional: wait for log writes with inotify instead of polling (Linux)
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+    inotify_flags = None
 
-RESTORE_ACTION_MARKERS = ["qmrestore", "pctrestore"]
+RESTORE_ACTION_MARKERS = frozenset(("qmrestore", "pctrestore"))
 RESTORE_KEYWORD_MARKERS = ["restore", "restoring", "backup"]
 ACTIVE_STATUS_MARKERS = {"", "0"}
 
 TASKS_LOG_DIR = "/var/log/pve/tasks"
+# Longest wait for a log write before yielding an idle tick (inotify), and the
+# polling interval when inotify is not available
+LOG_WAIT_TIMEOUT_MS = 1000
+LOG_POLL_INTERVAL_SECONDS = 0.2
+LOG_READ_CHUNK_BYTES = 1 << 20
 ACTIVE_TASKS_INDEX = "active"
 HEX_ARCHIVE_FOLDERS = "0123456789ABCDEF"
-_PROGRESS_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = (
-    (
-        "size_with_total",
-        re.compile(
-            r"transferred\s+(?P<transferred>\d+(?:\.\d+)?)\s+"
-            r"(?P<unit>GiB|MiB)\s+of\s+(?P<total>\d+(?:\.\d+)?)\s+"
-            r"(?P<total_unit>GiB|MiB).*?\sin\s+(?P<elapsed>(?:\d+m\s+)?\d+s)",
-            flags=re.IGNORECASE,
-        ),
-    ),
-    (
-        "qmrestore_bytes_progress",
-        re.compile(
-            r"progress\s+(?P<percent>\d+(?:\.\d+)?)%\s+"
-            r"\(read\s+(?P<read_bytes>\d+)\s+bytes,.*?"
-            r"duration\s+(?P<duration_seconds>\d+)\s+sec\)",
-            flags=re.IGNORECASE,
-        ),
-    ),
-    (
-        "percent_only",
-        re.compile(
-            r"transferred\s+(?P<percent>\d+(?:\.\d+)?)%\s+in\s+"
-            r"(?P<elapsed>(?:\d+m\s+)?\d+s)",
-            flags=re.IGNORECASE,
-        ),
-    ),
+_HEX_DIGITS = frozenset("0123456789ABCDEFabcdef")
+SPEED_WINDOW_POINTS = 6
+# Every progress line contains one of these; lines without them skip the regexes
+_PROGRESS_SENTINEL_TRANSFERRED = "transferred"
+_PROGRESS_SENTINEL_PROGRESS = "progress "
+_SIZE_UNITS = frozenset(("gib", "mib"))
+# Only this many leading characters of a log line are scanned for progress and
+# status markers, which bounds the regex work on corrupt or runaway lines
+_MAX_SCAN_LEN = 4096
+# One alternation of every known progress format, matched against the lowercased
+# line; the named alternative that matched (``lastgroup``) selects the parser.
+# Subgroup names carry a per-format prefix since group names must be unique.
+_PROGRESS_RE = re.compile(
+    r"(?P<size_with_total>"
+    r"transferred\s+(?P<st_transferred>\d+(?:\.\d+)?)\s+"
+    r"(?P<st_unit>gib|mib)\s+of\s+(?P<st_total>\d+(?:\.\d+)?)\s+"
+    r"(?P<st_total_unit>gib|mib).*?\sin\s+(?P<st_elapsed>(?:\d+m\s+)?\d+s))"
+    r"|(?P<qmrestore_bytes_progress>"
+    r"progress\s+(?P<qm_percent>\d+(?:\.\d+)?)%\s+"
+    r"\(read\s+(?P<qm_read_bytes>\d+)\s+bytes,.*?"
+    r"duration\s+(?P<qm_duration_seconds>\d+)\s+sec\))"
+    r"|(?P<percent_only>"
+    r"transferred\s+(?P<po_percent>\d+(?:\.\d+)?)%\s+in\s+"
+    r"(?P<po_elapsed>(?:\d+m\s+)?\d+s))"
 )
-ProgressPoint = tuple[int, float, float | None]
+# Elapsed text as captured above, e.g. "1m 31s" or "45s"
+_ELAPSED_RE = re.compile(r"(?:(\d+)m\s+)?(\d+)s")
 TerminalStatus = str | None
 
 _SUCCESS_STATUS_MARKERS = ("task ok", "completed", "success")
 _FAILURE_STATUS_MARKERS = ("task error", "failed", "aborted")
+# Marker lists fused into single alternations, matched against lowercased text;
+# _TERMINAL_STATUS_RE classifies a line in one scan via its named groups
+_TERMINAL_STATUS_RE = re.compile(
+    "(?P<failure>{})|(?P<success>{})".format(
+        "|".join(map(re.escape, _FAILURE_STATUS_MARKERS)),
+        "|".join(map(re.escape, _SUCCESS_STATUS_MARKERS)),
+    )
+)
+_FAILURE_STATUS_RE = re.compile("|".join(map(re.escape, _FAILURE_STATUS_MARKERS)))
+_RESTORE_KEYWORD_RE = re.compile("|".join(map(re.escape, RESTORE_KEYWORD_MARKERS)))
+_FINAL_STATUS_SUMMARY = MappingProxyType(
+    {
+        "success": "Final status: success",
+        "failure": "Final status: failure",
+        "interrupted": "Final status: interrupted",
+        "no-task": "Final status: no-task",
+        "log-missing": "Final status: log-missing",
+    }
+)
+_UNKNOWN_FINAL_STATUS = "Final status: unknown"
 _COLOR_RESET = "\033[0m"
 _COLOR_GREEN = "\033[32m"
 _COLOR_CYAN = "\033[36m"
 _COLOR_YELLOW = "\033[33m"
 _COLOR_DIM = "\033[2m"
+_CLEAR_LINE = "\033[2K"
+_BAR_WIDTH = 28
+_BAR_CELLS_PER_PERCENT = _BAR_WIDTH / 100
+# Every possible progress bar, indexed by the number of filled cells
+_BARS = tuple(
+    f"[{'=' * filled}{'.' * (_BAR_WIDTH - filled)}]" for filled in range(_BAR_WIDTH + 1)
+)
+# Status line fragments as (plain, colored) pairs, indexed by the color flag
+_BAR_VARIANTS = (_BARS, tuple(f"{_COLOR_GREEN}{bar}{_COLOR_RESET}" for bar in _BARS))
+_SPEED_UNIT_VARIANTS = ("MiB/s", f"{_COLOR_CYAN}MiB/s{_COLOR_RESET}")
+_ETA_LABEL_VARIANTS = ("ETA", f"{_COLOR_YELLOW}ETA{_COLOR_RESET}")
+_RECENT_LOG_LINES = 5
+# Log lines processed between two clock reads while lines keep streaming in
+_CLOCK_CHECK_LINES = 128
+# Marks the end of the source in the background reader queue
+_END_OF_LINES = object()
+
+
+class ProgressPoint(NamedTuple):
+    """One parsed progress sample: elapsed seconds, transferred value, total."""
+
+    elapsed: int
+    value: float
+    total: float | None
+
+
+class ProgressBuffer(Sequence[ProgressPoint]):
+    """Append-only progress history stored as three parallel typed arrays.
+
+    Samples are kept column-wise (elapsed, value, total) instead of one tuple
+    per sample, so a long restore costs 24 bytes per point. An unknown total is
+    stored as NaN. Indexing returns ``ProgressPoint`` tuples, so the buffer can
+    be passed anywhere a sequence of points is expected.
+    """
+
+    __slots__ = ("elapsed", "value", "total")
+
+    def __init__(self, points: Iterable[tuple[int, float, float | None]] = ()) -> None:
+        self.elapsed = array("q")
+        self.value = array("d")
+        self.total = array("d")
+        for point in points:
+            self.append(point)
+
+    def append(self, point: tuple[int, float, float | None]) -> None:
+        """Store one ``(elapsed, value, total)`` sample."""
+        elapsed, value, total = point
+        self.elapsed.append(elapsed)
+        self.value.append(value)
+        self.total.append(math.nan if total is None else total)
+
+    def __len__(self) -> int:
+        return len(self.elapsed)
+
+    def to_list(self) -> list[ProgressPoint]:
+        """Materialize the whole history as a list of ``ProgressPoint`` tuples."""
+        totals = [None if math.isnan(total) else total for total in self.total]
+        return list(map(ProgressPoint, self.elapsed, self.value, totals))
+
+    @overload
+    def __getitem__(self, index: int) -> ProgressPoint: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ProgressPoint]: ...
+
+    def __getitem__(self, index: int | slice) -> ProgressPoint | list[ProgressPoint]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        total = self.total[index]
+        return ProgressPoint(
+            self.elapsed[index],
+            self.value[index],
+            None if math.isnan(total) else total,
+        )
 
 
 def parse_upid(line: str) -> dict[str, str] | None:
     """Parse one active tasks line into a normalized task dict."""
     raw_line = line.rstrip("\n")
-    if not raw_line:
-        return None
 
-    upid = raw_line.split(maxsplit=1)[0]
-    trailing = raw_line[len(upid) :]
-    if trailing.startswith("  ") or not trailing.strip():
-        status = ""
-    else:
-        status = trailing.strip().split(maxsplit=1)[0]
+    # Fields are single-space separated; an empty status leaves two spaces
+    upid, _, trailing = raw_line.lstrip().partition(" ")
+    if not upid:
+        return None
+    status = trailing.partition(" ")[0]
 
-    upid_parts = upid.split(":")
+    upid_parts = upid.split(":", 6)
     action = upid_parts[5] if len(upid_parts) > 5 else ""
 
     return {"upid": upid, "action": action, "status": status, "raw": raw_line}
@@ -85,95 +200,196 @@ def read_active_tasks(active_path: str | None = None) -> list[dict[str, str]]:
     if not path.exists():
         return []
 
+    # One read and one decode for the whole index, then a single line split
     tasks: list[dict[str, str]] = []
-    with path.open(encoding="utf-8") as handle:
-        for line in handle:
-            parsed = parse_upid(line)
-            if not parsed:
-                continue
-            if parsed["status"] in ACTIVE_STATUS_MARKERS:
-                tasks.append(parsed)
+    for line in path.read_bytes().decode("utf-8").splitlines():
+        parsed = parse_upid(line)
+        if not parsed:
+            continue
+        if parsed["status"] in ACTIVE_STATUS_MARKERS:
+            tasks.append(parsed)
 
     return tasks
 
 
 def filter_restore_tasks(tasks: list[dict[str, str]]) -> list[dict[str, str]]:
     """Filter tasks down to restore-like actions or UPID markers."""
-    restore_tasks: list[dict[str, str]] = []
-    for task in tasks:
-        action = task.get("action", "").lower()
-        task_text = f"{task.get('upid', '')} {task.get('raw', '')}".lower()
-        if action in RESTORE_ACTION_MARKERS:
-            restore_tasks.append(task)
-            continue
-        if any(keyword in task_text for keyword in RESTORE_KEYWORD_MARKERS):
-            restore_tasks.append(task)
-
-    return restore_tasks
+    # The keyword text is only built for tasks whose action is not a restore one
+    return [
+        task
+        for task in tasks
+        if task.get("action", "").lower() in RESTORE_ACTION_MARKERS
+        or _RESTORE_KEYWORD_RE.search(
+            f"{task.get('upid', '')} {task.get('raw', '')}".lower()
+        )
+    ]
 
 
 def find_task_logfile(
     upid_str: str, tasks_root: str | Path | None = None
 ) -> Path | None:
     """Resolve task logfile path for a given UPID string."""
-    upid_parts = upid_str.split(":")
-    if len(upid_parts) < 8 or upid_parts[0] != "UPID":
+    # Stop splitting after the start time field; the tail (type, id, user)
+    # only has to carry its two remaining separators
+    upid_parts = upid_str.split(":", 5)
+    if (
+        len(upid_parts) < 6
+        or upid_parts[0] != "UPID"
+        or upid_parts[5].count(":") < 2
+    ):
         return None
 
     pstart = upid_parts[4]
-    if not re.fullmatch(r"[0-9A-Fa-f]{8}", pstart):
+    if len(pstart) != 8 or not _HEX_DIGITS.issuperset(pstart):
         return None
 
     expected_folder = pstart[0].upper()
     if expected_folder not in HEX_ARCHIVE_FOLDERS:
         return None
 
-    root = Path(tasks_root) if tasks_root is not None else Path(TASKS_LOG_DIR)
+    # Plain path strings; a Path is only built for the resolved file
+    root_str = os.fspath(tasks_root) if tasks_root is not None else TASKS_LOG_DIR
+
+    preferred = os.path.join(root_str, expected_folder, upid_str)
+    if os.path.isfile(preferred):
+        return Path(preferred)
 
-    preferred = root / expected_folder / upid_str
-    if preferred.exists():
-        return preferred
+    # One directory listing instead of a stat per archive folder
+    try:
+        with os.scandir(root_str) as entries:
+            present_folders = {
+                entry.name
+                for entry in entries
+                if len(entry.name) == 1
+                and entry.name in HEX_ARCHIVE_FOLDERS
+                and entry.is_dir()
+            }
+    except OSError:
+        return None
 
     for folder in HEX_ARCHIVE_FOLDERS:
-        if folder == expected_folder:
+        if folder == expected_folder or folder not in present_folders:
             continue
-        candidate = root / folder / upid_str
-        if candidate.exists():
-            return candidate
+        candidate = os.path.join(root_str, folder, upid_str)
+        if os.path.isfile(candidate):
+            return Path(candidate)
 
     return None
 
 
-def parse_progress_line(line: str) -> tuple[int, float, float | None] | None:
-    """Parse one restore progress line into normalized elapsed and transfer values."""
-    for pattern_name, pattern in _PROGRESS_PATTERNS:
-        match = pattern.search(line)
-        if not match:
-            continue
+def parse_progress_line(line: str, lowered: str | None = None) -> ProgressPoint | None:
+    """Parse one restore progress line into normalized elapsed and transfer values.
+
+    ``lowered`` may carry the lowercased line when the caller already computed it.
+    Only its first ``_MAX_SCAN_LEN`` characters are scanned.
+    """
+    if lowered is None:
+        lowered = line[:_MAX_SCAN_LEN].lower()
+    elif len(lowered) > _MAX_SCAN_LEN:
+        lowered = lowered[:_MAX_SCAN_LEN]
+    # Two direct substring searches, without a generator frame per line; their
+    # positions are where a progress match can start
+    transferred_pos = lowered.find(_PROGRESS_SENTINEL_TRANSFERRED)
+    progress_pos = lowered.find(_PROGRESS_SENTINEL_PROGRESS)
+    if transferred_pos == -1 and progress_pos == -1:
+        return None
 
-        if pattern_name == "size_with_total":
-            elapsed_seconds = _parse_elapsed_seconds(match.group("elapsed"))
-            transferred_gib = _to_gib(
-                float(match.group("transferred")), match.group("unit")
-            )
-            total_gib = _to_gib(float(match.group("total")), match.group("total_unit"))
-            return (elapsed_seconds, transferred_gib, total_gib)
-
-        if pattern_name == "qmrestore_bytes_progress":
-            percent = float(match.group("percent"))
-            read_bytes = int(match.group("read_bytes"))
-            duration_seconds = int(match.group("duration_seconds"))
-            transferred_gib = _bytes_to_gib(read_bytes)
-            if percent <= 0:
-                return (duration_seconds, transferred_gib, None)
-            total_gib = transferred_gib * 100 / percent
-            return (duration_seconds, transferred_gib, total_gib)
-
-        if pattern_name == "percent_only":
-            elapsed_seconds = _parse_elapsed_seconds(match.group("elapsed"))
-            return (elapsed_seconds, float(match.group("percent")), None)
+    # The most common format has a rigid layout that str.split parses faster
+    # than the regex; anything unusual falls through to _PROGRESS_RE
+    if transferred_pos != -1 and " of " in lowered:
+        progress = _fast_parse_size_with_total(lowered, transferred_pos)
+        if progress is not None:
+            return progress
 
-    return None
+    # Anchor the regex at the first sentinel instead of trying every position
+    if transferred_pos == -1 or -1 < progress_pos < transferred_pos:
+        start = progress_pos
+    else:
+        start = transferred_pos
+    match = _PROGRESS_RE.match(lowered, start) or _PROGRESS_RE.search(
+        lowered, start + 1
+    )
+    if match is None:
+        return None
+
+    format_name = match.lastgroup
+    if format_name == "size_with_total":
+        elapsed_seconds = _parse_elapsed_seconds(match.group("st_elapsed"))
+        transferred_gib = _to_gib(
+            float(match.group("st_transferred")), match.group("st_unit")
+        )
+        total_gib = _to_gib(
+            float(match.group("st_total")), match.group("st_total_unit")
+        )
+        return ProgressPoint(elapsed_seconds, transferred_gib, total_gib)
+
+    if format_name == "qmrestore_bytes_progress":
+        percent = float(match.group("qm_percent"))
+        read_bytes = int(match.group("qm_read_bytes"))
+        duration_seconds = int(match.group("qm_duration_seconds"))
+        transferred_gib = _bytes_to_gib(read_bytes)
+        if percent <= 0:
+            return ProgressPoint(duration_seconds, transferred_gib, None)
+        total_gib = transferred_gib * 100 / percent
+        return ProgressPoint(duration_seconds, transferred_gib, total_gib)
+
+    elapsed_seconds = _parse_elapsed_seconds(match.group("po_elapsed"))
+    return ProgressPoint(elapsed_seconds, float(match.group("po_percent")), None)
+
+
+def _fast_parse_size_with_total(lowered: str, start: int = 0) -> ProgressPoint | None:
+    """Parse a lowercased ``transferred X unit of Y unit ... in [Mm ]Ss`` line.
+
+    ``start`` is where "transferred" was already found, which spares a second
+    scan of the line. Returns None when the line does not follow that exact
+    layout.
+    """
+    if not lowered.startswith("transferred ", start):
+        start = lowered.find("transferred ", start)
+        if start == -1:
+            return None
+
+    fields = lowered[start + 12 :].split(maxsplit=5)
+    if (
+        len(fields) < 6
+        or fields[2] != "of"
+        or fields[1] not in _SIZE_UNITS
+        or fields[4] not in _SIZE_UNITS
+        or not _is_decimal(fields[0])
+        or not _is_decimal(fields[3])
+    ):
+        return None
+
+    # The unit is followed by whitespace, which may be the one before "in"
+    trailing = f" {fields[5]}"
+    in_pos = trailing.find(" in ")
+    if in_pos == -1:
+        return None
+
+    elapsed_fields = trailing[in_pos + 4 :].split(maxsplit=2)
+    minutes = 0
+    if elapsed_fields and elapsed_fields[0][-1:] == "m":
+        minutes_text = elapsed_fields.pop(0)[:-1]
+        if not minutes_text.isdecimal():
+            return None
+        minutes = int(minutes_text)
+    if not elapsed_fields or elapsed_fields[0][-1:] != "s":
+        return None
+    seconds_text = elapsed_fields[0][:-1]
+    if not seconds_text.isdecimal():
+        return None
+
+    return ProgressPoint(
+        minutes * 60 + int(seconds_text),
+        _to_gib(float(fields[0]), fields[1]),
+        _to_gib(float(fields[3]), fields[4]),
+    )
+
+
+def _is_decimal(text: str) -> bool:
+    """Return whether text is a plain decimal number such as '12' or '5.5'."""
+    whole, dot, fraction = text.partition(".")
+    return whole.isdecimal() and (not dot or fraction.isdecimal())
 
 
 def calculate_eta_and_speed(points: Sequence[ProgressPoint]) -> tuple[float, float]:
@@ -188,14 +404,22 @@ def calculate_eta_and_speed_with_memory(
     if len(points) < 2:
         return (previous_speed, math.inf)
 
-    window = points[-6:]
+    # Work on the elapsed and value columns of the last SPEED_WINDOW_POINTS
+    # points: sliced straight from a ProgressBuffer's arrays, without building
+    # a ProgressPoint per sample, or split out of any other sequence of points
+    if isinstance(points, ProgressBuffer):
+        elapsed_column: Sequence[int] = points.elapsed[-SPEED_WINDOW_POINTS:]
+        value_column: Sequence[float] = points.value[-SPEED_WINDOW_POINTS:]
+    else:
+        window = points[-SPEED_WINDOW_POINTS:]
+        elapsed_column = [point[0] for point in window]
+        value_column = [point[1] for point in window]
+
     total_delta_seconds = 0
     total_delta_value = 0.0
-    for previous_point, current_point in zip(window, window[1:]):
-        previous_elapsed, previous_value, _ = previous_point
-        elapsed_seconds, current_value, _ = current_point
-        delta_seconds = elapsed_seconds - previous_elapsed
-        delta_value = current_value - previous_value
+    for index in range(1, len(elapsed_column)):
+        delta_seconds = elapsed_column[index] - elapsed_column[index - 1]
+        delta_value = value_column[index] - value_column[index - 1]
         if delta_seconds > 0 and delta_value > 0:
             total_delta_seconds += delta_seconds
             total_delta_value += delta_value
@@ -208,7 +432,7 @@ def calculate_eta_and_speed_with_memory(
     if current_total is None or speed <= 0:
         return (speed, math.inf)
 
-    current_value = points[-1][1]
+    current_value = value_column[-1]
     remaining = max(current_total - current_value, 0.0)
     return (speed, remaining / speed)
 
@@ -272,13 +496,7 @@ def build_tqdm_line(
         else:
             percent = max(0.0, min(100.0, transferred))
 
-    bar_width = 28
-    filled = int((percent / 100) * bar_width)
-    bar_inner = f"{'=' * filled}{'.' * (bar_width - filled)}"
-    if color:
-        bar = f"{_COLOR_GREEN}[{bar_inner}]{_COLOR_RESET}"
-    else:
-        bar = f"[{bar_inner}]"
+    bar = _BAR_VARIANTS[color][int(percent * _BAR_CELLS_PER_PERCENT)]
     speed_mib_s = speed_gib_s * 1024
     average_speed_mib_s = average_speed_gib_s * 1024
     eta_text = "n/a" if math.isinf(eta_seconds) else _format_eta(eta_seconds)
@@ -292,13 +510,13 @@ def build_tqdm_line(
     else:
         size_text = f"{transferred:6.2f} %"
 
-    now_speed = f"Now {speed_mib_s:6.1f} {_COLOR_CYAN}MiB/s{_COLOR_RESET}" if color else f"Now {speed_mib_s:6.1f} MiB/s"
-    avg_speed = f"Avg {average_speed_mib_s:6.1f} {_COLOR_CYAN}MiB/s{_COLOR_RESET}" if color else f"Avg {average_speed_mib_s:6.1f} MiB/s"
-    eta_label = f"{_COLOR_YELLOW}ETA{_COLOR_RESET}" if color else "ETA"
+    speed_unit = _SPEED_UNIT_VARIANTS[color]
+    eta_label = _ETA_LABEL_VARIANTS[color]
 
     return (
         f"{bar} {percent:5.1f}% | {size_text} | "
-        f"{now_speed} | {avg_speed} | "
+        f"Now {speed_mib_s:6.1f} {speed_unit} | "
+        f"Avg {average_speed_mib_s:6.1f} {speed_unit} | "
         f"Elapsed {elapsed_text} | {eta_label} {eta_text}{waiting_text}"
     )
 
@@ -308,7 +526,7 @@ def build_dashboard_lines(
     speed_gib_s: float,
     average_speed_gib_s: float,
     eta_seconds: float,
-    recent_logs: list[str],
+    recent_logs: Sequence[str],
     waiting: bool = False,
     color: bool = False,
 ) -> list[str]:
@@ -323,7 +541,9 @@ def build_dashboard_lines(
     )
 
     lines = [status_line]
-    for log_line in recent_logs[-5:]:
+    # islice instead of a slice so a deque can be passed without copying it
+    first_shown = max(0, len(recent_logs) - _RECENT_LOG_LINES)
+    for log_line in itertools.islice(recent_logs, first_shown, None):
         rendered = _truncate(log_line, 140)
         if color:
             rendered = f"{_COLOR_DIM}{rendered}{_COLOR_RESET}"
@@ -338,13 +558,13 @@ def render_dashboard(
     is_tty: bool,
 ) -> int:
     """Render dashboard lines, in place when output is a TTY."""
-    if is_tty and previous_line_count > 0:
-        output_stream.write(f"\033[{previous_line_count}A")
-
-    for line in lines:
-        if is_tty:
-            output_stream.write("\033[2K")
-        output_stream.write(f"{line}\n")
+    # The whole frame goes out in a single write
+    if is_tty:
+        cursor_up = f"\033[{previous_line_count}A" if previous_line_count > 0 else ""
+        frame = cursor_up + "".join(f"{_CLEAR_LINE}{line}\n" for line in lines)
+    else:
+        frame = "".join(f"{line}\n" for line in lines)
+    output_stream.write(frame)
     output_stream.flush()
     return len(lines)
 
@@ -373,11 +593,10 @@ def _format_eta(eta_seconds: float) -> str:
 
 def _parse_elapsed_seconds(elapsed: str) -> int:
     """Convert elapsed text like '1m 31s' or '45s' to total seconds."""
-    minutes_match = re.search(r"(?P<minutes>\d+)m", elapsed)
-    seconds_match = re.search(r"(?P<seconds>\d+)s", elapsed)
-    minutes = int(minutes_match.group("minutes")) if minutes_match else 0
-    seconds = int(seconds_match.group("seconds")) if seconds_match else 0
-    return (minutes * 60) + seconds
+    match = _ELAPSED_RE.search(elapsed)
+    if match is None:
+        return 0
+    return int(match[1] or 0) * 60 + int(match[2])
 
 
 def _to_gib(value: float, unit: str) -> float:
@@ -401,14 +620,41 @@ def _truncate(value: str, length: int) -> str:
     return f"{value[: length - 3]}..."
 
 
-def detect_terminal_status(line: str) -> TerminalStatus:
-    """Detect whether one log line reports a terminal restore status."""
-    lowered = line.lower()
-    if any(marker in lowered for marker in _FAILURE_STATUS_MARKERS):
+def detect_terminal_status(line: str, lowered: str | None = None) -> TerminalStatus:
+    """Detect whether one log line reports a terminal restore status.
+
+    ``lowered`` may carry the lowercased line when the caller already computed it.
+    Only its first ``_MAX_SCAN_LEN`` characters are scanned.
+    """
+    if lowered is None:
+        lowered = line[:_MAX_SCAN_LEN].lower()
+    elif len(lowered) > _MAX_SCAN_LEN:
+        lowered = lowered[:_MAX_SCAN_LEN]
+    # Every _SUCCESS/_FAILURE_STATUS_MARKERS entry contains one of these; plain
+    # substring checks reject the usual neutral line far faster than the regex
+    if (
+        "task " not in lowered
+        and "completed" not in lowered
+        and "success" not in lowered
+        and "failed" not in lowered
+        and "aborted" not in lowered
+    ):
+        return None
+    return _classify_terminal_status(lowered)
+
+
+# Lines that pass the substring prefilter repeat a lot (task status echoes,
+# "restore ... completed" chatter), so their regex verdicts are memoized
+@functools.lru_cache(maxsize=1024)
+def _classify_terminal_status(lowered: str) -> TerminalStatus:
+    """Run the terminal status regexes over one lowercased line."""
+    match = _TERMINAL_STATUS_RE.search(lowered)
+    if match is None:
+        return None
+    # Failure markers win when a line carries both kinds, even after a success one
+    if match.lastgroup == "failure" or _FAILURE_STATUS_RE.search(lowered, match.end()):
         return "failure"
-    if any(marker in lowered for marker in _SUCCESS_STATUS_MARKERS):
-        return "success"
-    return None
+    return "success"
 
 
 def debug_log(enabled: bool, message: str, stream: TextIO | None = None) -> None:
@@ -421,25 +667,19 @@ def debug_log(enabled: bool, message: str, stream: TextIO | None = None) -> None
 
 def map_final_status_message(status: str | None) -> str:
     """Map one terminal status value to a final summary line."""
-    summary_by_status = {
-        "success": "Final status: success",
-        "failure": "Final status: failure",
-        "interrupted": "Final status: interrupted",
-        "no-task": "Final status: no-task",
-        "log-missing": "Final status: log-missing",
-    }
     if status is None:
-        return "Final status: unknown"
-    return summary_by_status.get(status, "Final status: unknown")
+        return _UNKNOWN_FINAL_STATUS
+    return _FINAL_STATUS_SUMMARY.get(status, _UNKNOWN_FINAL_STATUS)
 
 
 def choose_restore_task(tasks: list[dict[str, str]]) -> dict[str, str] | None:
-    """Choose one restore task to monitor."""
-    if not tasks:
-        return None
-    if len(tasks) == 1:
-        return tasks[0]
-    return tasks[-1]
+    """Choose one restore task to monitor.
+
+    A single task is returned as is; with several, the most recent one wins.
+    """
+    # tasks[-1] is also the only element of a one-task list, so one branch
+    # covers both cases without measuring the list
+    return tasks[-1] if tasks else None
 
 
 def resolve_restore_logfile(
@@ -469,22 +709,122 @@ def follow_log_lines(
     ------
     str
         Each log line stripped of trailing newline, or empty string
-        when no new data is available yet.
+        when no new data arrived within one wait interval.
+
+    Notes
+    -----
+    The file is read with ``os.read`` in ``LOG_READ_CHUNK_BYTES`` chunks and
+    each chunk's complete lines are decoded and split at once; a partial line
+    is kept until its newline has been written. With ``inotify_simple``
+    installed, waits block until the file is modified instead of polling every
+    ``LOG_POLL_INTERVAL_SECONDS``.
+    """
+    inotify = None
+    if INotify is not None:
+        try:
+            inotify = INotify()
+            inotify.add_watch(str(log_path), inotify_flags.MODIFY)
+        except OSError:
+            inotify = None
+
+    try:
+        fd = os.open(log_path, os.O_RDONLY)
+        try:
+            read_pos = 0
+            partial_line = b""
+            last_data_time = time.monotonic()
+            while True:
+                chunk = os.read(fd, LOG_READ_CHUNK_BYTES)
+                if chunk:
+                    read_pos += len(chunk)
+                    block = partial_line + chunk if partial_line else chunk
+                    # Locate the end of the complete lines with one reverse
+                    # scan, then decode and split them all at once
+                    last_newline = block.rfind(b"\n")
+                    if last_newline == -1:
+                        partial_line = block
+                        continue
+                    partial_line = block[last_newline + 1 :]
+                    last_data_time = time.monotonic()
+                    yield from (
+                        block[:last_newline].decode("utf-8", "replace").split("\n")
+                    )
+                    continue
+                if os.fstat(fd).st_size < read_pos:  # Truncated: start over
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    read_pos = 0
+                    partial_line = b""
+                    continue
+                # Nothing to read: wait for a write, never past the idle timeout
+                idle_left = idle_timeout_seconds - (time.monotonic() - last_data_time)
+                if idle_left <= 0:
+                    return
+                if inotify is None:
+                    time.sleep(min(LOG_POLL_INTERVAL_SECONDS, idle_left))
+                    yield ""
+                elif not inotify.read(
+                    timeout=min(LOG_WAIT_TIMEOUT_MS, math.ceil(idle_left * 1000))
+                ):
+                    # Timed out without a write: still tick the dashboard
+                    yield ""
+        finally:
+            os.close(fd)
+    finally:
+        if inotify is not None:
+            inotify.close()
+
+
+def read_lines_in_background(
+    log_lines: Iterable[str], idle_tick_seconds: float = 1.0
+) -> Iterator[str]:
+    """Read lines on a daemon thread and hand them over through a queue.
+
+    Parameters
+    ----------
+    log_lines : Iterable[str]
+        Source of log lines, typically ``follow_log_lines``; it is consumed
+        entirely on the reader thread.
+    idle_tick_seconds : float
+        Interval between empty-string ticks while no line arrives.
+
+    Yields
+    ------
+    str
+        Each line from the source, and an empty string every time the queue
+        has been drained, so the consumer can render once per batch.
     """
-    with log_path.open(encoding="utf-8") as handle:
-        idle_elapsed = 0.0
-        poll_interval = 0.2
+    lines_queue: queue.SimpleQueue[object] = queue.SimpleQueue()
+    stop_event = threading.Event()
+
+    def feed() -> None:
+        try:
+            for line in log_lines:
+                if stop_event.is_set():
+                    break
+                lines_queue.put(line)
+        except BaseException as exc:  # Re-raised on the consumer side
+            lines_queue.put(exc)
+        lines_queue.put(_END_OF_LINES)
+
+    threading.Thread(target=feed, name="log-reader", daemon=True).start()
+    try:
         while True:
-            line = handle.readline()
-            if line:
-                idle_elapsed = 0.0
-                yield line.rstrip("\n")
-                continue
-            idle_elapsed += poll_interval
-            if idle_elapsed >= idle_timeout_seconds:
+            try:
+                item = lines_queue.get_nowait()
+            except queue.Empty:
+                yield ""
+                try:
+                    item = lines_queue.get(timeout=idle_tick_seconds)
+                except queue.Empty:
+                    continue
+            if item is _END_OF_LINES:
                 return
-            time.sleep(poll_interval)
-            yield ""
+            if isinstance(item, BaseException):
+                raise item
+            if item:
+                yield item
+    finally:
+        stop_event.set()
 
 
 def collect_monitoring_data(
@@ -496,80 +836,106 @@ def collect_monitoring_data(
     debug: bool = False,
     debug_stream: TextIO | None = None,
 ) -> tuple[list[ProgressPoint], str | None]:
-    """Collect progress points until terminal status or interruption."""
-    points: list[ProgressPoint] = []
-    recent_logs: collections.deque[str] = collections.deque(maxlen=5)
+    """Collect progress points until terminal status or interruption.
+
+    New progress is rendered once the source yields an empty string (caught
+    up), on the periodic refresh, or when monitoring stops, so a burst of
+    lines costs one dashboard render instead of one per progress line. Debug
+    lines about ignored log lines are batched the same way and written to
+    ``debug_stream`` in one call.
+    """
+    points = ProgressBuffer()
+    recent_logs: collections.deque[str] = collections.deque(maxlen=_RECENT_LOG_LINES)
     now_getter = now_fn if now_fn is not None else time.monotonic
     last_output_time = now_getter()
-    last_seen_line = ""
     last_speed = 0.0
     last_eta = math.inf
+    # Only changes when a progress point is added, so idle refreshes reuse it
+    last_average_speed = 0.0
     previous_line_count = 0
     tty_mode = bool(
         output_stream and hasattr(output_stream, "isatty") and output_stream.isatty()
     )
     color_mode = tty_mode
+    render_pending = False
+    line_count = 0
+    pending_debug: list[str] = []
+
+    def flush_debug() -> None:
+        if pending_debug:
+            target = debug_stream if debug_stream is not None else sys.stderr
+            target.write("".join(pending_debug))
+            target.flush()
+            pending_debug.clear()
+
+    def render_frame(waiting: bool) -> None:
+        nonlocal previous_line_count, render_pending
+        flush_debug()
+        lines = build_dashboard_lines(
+            points,
+            last_speed,
+            last_average_speed,
+            last_eta,
+            recent_logs,
+            waiting=waiting,
+            color=color_mode,
+        )
+        previous_line_count = render_dashboard(
+            output_stream, lines, previous_line_count, tty_mode
+        )
+        render_pending = False
 
     try:
         for line in log_lines:
+            # Case-fold once; progress parsing and status detection share it, and
+            # neither looks past the first _MAX_SCAN_LEN characters
+            lowered = line[:_MAX_SCAN_LEN].lower()
             if line:
-                last_seen_line = line
                 recent_logs.append(line)
-            progress = parse_progress_line(line)
+            progress = parse_progress_line(line, lowered)
             if progress is not None:
                 points.append(progress)
                 last_speed, last_eta = calculate_eta_and_speed_with_memory(
                     points, previous_speed=last_speed
                 )
-                if output_stream is not None:
-                    lines = build_dashboard_lines(
-                        points,
-                        last_speed,
-                        calculate_total_average_speed(points),
-                        last_eta,
-                        list(recent_logs),
-                        waiting=False,
-                        color=color_mode,
-                    )
-                    previous_line_count = render_dashboard(
-                        output_stream, lines, previous_line_count, tty_mode
-                    )
-                last_output_time = now_getter()
-            elif line:
-                debug_log(debug, f"Ignored non-progress log line: {line}", debug_stream)
-
-            current_time = now_getter()
-            if (
-                output_stream is not None
-                and current_time - last_output_time >= update_interval_seconds
+                last_average_speed = calculate_total_average_speed(points)
+                render_pending = output_stream is not None
+            elif not line:
+                flush_debug()
+            elif debug:
+                pending_debug.append(f"[debug] Ignored non-progress log line: {line}\n")
+
+            # The clock is only read on idle ticks and every _CLOCK_CHECK_LINES
+            # lines (starting with the first), not once per line of a burst
+            if output_stream is not None and (
+                not line or line_count % _CLOCK_CHECK_LINES == 0
             ):
-                if not recent_logs and last_seen_line:
-                    recent_logs.append(last_seen_line)
-                lines = build_dashboard_lines(
-                    points,
-                    last_speed,
-                    calculate_total_average_speed(points),
-                    last_eta,
-                    list(recent_logs),
-                    waiting=True,
-                    color=color_mode,
-                )
-                previous_line_count = render_dashboard(
-                    output_stream, lines, previous_line_count, tty_mode
-                )
-                last_output_time = current_time
-
-            terminal_status = detect_terminal_status(line)
+                current_time = now_getter()
+                if (
+                    render_pending and not line
+                ) or current_time - last_output_time >= update_interval_seconds:
+                    render_frame(waiting=not render_pending)
+                    last_output_time = current_time
+            line_count += 1
+
+            terminal_status = detect_terminal_status(line, lowered)
             if terminal_status is not None:
+                flush_debug()
                 debug_log(
                     debug, f"Detected terminal status: {terminal_status}", debug_stream
                 )
-                return points, terminal_status
+                if render_pending:
+                    render_frame(waiting=False)
+                return points.to_list(), terminal_status
     except KeyboardInterrupt:
+        flush_debug()
         debug_log(debug, "Monitoring interrupted by user", debug_stream)
-        return points, "interrupted"
+        return points.to_list(), "interrupted"
 
-    return points, None
+    flush_debug()
+    if render_pending:
+        render_frame(waiting=False)
+    return points.to_list(), None
 
 
 def monitor_restore_task(
@@ -588,7 +954,13 @@ def monitor_restore_task(
         debug_log(debug, "Could not resolve task logfile", debug_stream)
         return [], "log-missing"
 
-    stream = log_lines if log_lines is not None else follow_log_lines(logfile)
+    if log_lines is not None:
+        stream = log_lines
+    else:
+        # Tail the log on a reader thread so rendering stays off the I/O path
+        stream = read_lines_in_background(
+            follow_log_lines(logfile), idle_tick_seconds=update_interval_seconds
+        )
     return collect_monitoring_data(
         stream,
         output_stream=output_stream,
@@ -52,3 +52,24 @@ def test_find_task_logfile_rejects_short_upid_even_if_file_exists(
     resolved = restore_watcher.find_task_logfile(short_upid, tasks_root=tmp_path)
 
     assert resolved is None
+
+
+def test_find_task_logfile_returns_none_when_tasks_root_missing(
+    tmp_path: Path,
+) -> None:
+    """Return None instead of raising when the tasks directory does not exist."""
+    upid = "UPID:node:00000001:00000000:C1234567:qmrestore:101:root@pam:"
+
+    resolved = restore_watcher.find_task_logfile(
+        upid, tasks_root=tmp_path / "missing"
+    )
+
+    assert resolved is None
+
+
+def test_find_task_logfile_rejects_non_hex_pstart(tmp_path: Path) -> None:
+    """Reject PSTART values that are not exactly eight hex digits."""
+    for pstart in ("0x123456", "A12345_7", "G1234567", "A123456"):
+        upid = f"UPID:node:00000001:00000000:{pstart}:qmrestore:101:root@pam:"
+
+        assert restore_watcher.find_task_logfile(upid, tasks_root=tmp_path) is None
@@ -94,3 +94,46 @@ def test_build_tqdm_line_includes_elapsed_avg_and_current_speed() -> None:
     assert "Avg" in line
     assert "Elapsed" in line
     assert "00:00:30" in line
+
+
+def test_progress_buffer_round_trips_points_and_unknown_totals() -> None:
+    """Store points column-wise and read them back as progress tuples."""
+    points = [(10, 2.0, 10.0), (20, 4.0, None), (30, 8.0, 10.0)]
+
+    buffer = restore_watcher.ProgressBuffer(points)
+
+    assert len(buffer) == 3
+    assert list(buffer) == points
+    assert buffer[-2].total is None
+    assert math.isnan(buffer.total[1])
+    assert buffer[1:] == points[1:]
+    assert buffer.to_list() == points
+
+
+def test_metrics_match_between_progress_buffer_and_point_list() -> None:
+    """Compute identical metrics from a buffer and from a plain list."""
+    points = [(10, 2.0, 10.0), (20, 4.0, 10.0), (30, 5.0, 10.0)]
+    buffer = restore_watcher.ProgressBuffer(points)
+
+    assert restore_watcher.calculate_eta_and_speed(
+        buffer
+    ) == restore_watcher.calculate_eta_and_speed(points)
+    assert restore_watcher.build_metrics_line(
+        buffer
+    ) == restore_watcher.build_metrics_line(points)
+    assert restore_watcher.calculate_total_average_speed(
+        buffer
+    ) == restore_watcher.calculate_total_average_speed(points)
+
+
+def test_build_tqdm_line_fills_bar_proportionally() -> None:
+    """Fill one bar cell per 1/28 of progress, full at 100%."""
+    half = restore_watcher.build_tqdm_line(
+        [(10, 5.0, 10.0)], speed_gib_s=0.0, average_speed_gib_s=0.0, eta_seconds=0.0
+    )
+    done = restore_watcher.build_tqdm_line(
+        [(10, 10.0, 10.0)], speed_gib_s=0.0, average_speed_gib_s=0.0, eta_seconds=0.0
+    )
+
+    assert half.startswith(f"[{'=' * 14}{'.' * 14}]")
+    assert done.startswith(f"[{'=' * 28}]")
@@ -46,3 +46,21 @@ def test_parse_progress_line_with_qmrestore_progress_bytes() -> None:
     parsed = restore_watcher.parse_progress_line(line)
 
     assert parsed == (100, 2.0, 4.0)
+
+
+def test_parse_progress_line_is_case_insensitive() -> None:
+    """Match progress lines regardless of keyword and unit casing."""
+    line = "Transferred 512 MIB of 1 GIB (50%) IN 10s"
+
+    parsed = restore_watcher.parse_progress_line(line)
+
+    assert parsed == (10, 0.5, 1.0)
+
+
+def test_parse_progress_line_falls_back_to_regex_for_unusual_layout() -> None:
+    """Parse size lines the split-based fast path cannot handle."""
+    line = "transferred 1 GiB of 2 GiB (50%) in 5s, 200 MiB/s"
+
+    parsed = restore_watcher.parse_progress_line(line)
+
+    assert parsed == (5, 1.0, 2.0)
@@ -6,9 +6,23 @@ from io import StringIO
 from pathlib import Path
 from typing import Iterator
 
+import pytest
+
 import restore_watcher
 
 
+class RecordingStream(StringIO):
+    """StringIO that also records each individual write call."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes: list[str] = []
+
+    def write(self, text: str) -> int:
+        self.writes.append(text)
+        return super().write(text)
+
+
 def test_detect_terminal_status_for_completion_lines() -> None:
     """Detect successful terminal status markers in task log lines."""
     lines = [
@@ -38,6 +52,26 @@ def test_detect_terminal_status_for_neutral_line() -> None:
     assert restore_watcher.detect_terminal_status("running backup extract step") is None
 
 
+def test_detect_terminal_status_prefers_failure_over_success() -> None:
+    """Report failure when one line carries both failure and success markers."""
+    lines = [
+        "TASK ERROR: verification completed with errors",
+        "restore completed, but verification failed",
+    ]
+
+    for line in lines:
+        assert restore_watcher.detect_terminal_status(line) == "failure"
+
+
+def test_markers_past_the_scan_limit_are_ignored() -> None:
+    """Only scan the leading part of very long log lines."""
+    padding = "x" * restore_watcher._MAX_SCAN_LEN
+
+    assert restore_watcher.detect_terminal_status(padding + " TASK OK") is None
+    assert restore_watcher.parse_progress_line(padding + " progress 50%") is None
+    assert restore_watcher.detect_terminal_status("TASK OK " + padding) == "success"
+
+
 def test_collect_monitoring_data_stops_on_terminal_status() -> None:
     """Collect progress points and stop immediately on terminal status."""
     lines = [
@@ -77,22 +111,32 @@ def test_choose_restore_task_auto_selects_when_only_one() -> None:
     assert selected == task
 
 
-def test_main_prints_final_summary_line(tmp_path: Path, monkeypatch, capsys) -> None:
-    """Always print one final summary line at the end of main."""
+@pytest.fixture
+def single_restore_task(monkeypatch) -> dict[str, str]:
+    """Make main() discover exactly one active restore task."""
     task = {
         "upid": "UPID:node:1:2:A1234567:qmrestore:100:root@pam:",
         "action": "qmrestore",
         "status": "0",
         "raw": "UPID:node:1:2:A1234567:qmrestore:100:root@pam:",
     }
-    logfile = tmp_path / "A" / task["upid"]
+    fakes = {
+        "read_active_tasks": lambda active_path=None: [task],
+        "filter_restore_tasks": lambda tasks: tasks,
+    }
+    for name, fake in fakes.items():
+        monkeypatch.setattr(restore_watcher, name, fake)
+    return task
+
+
+def test_main_prints_final_summary_line(
+    tmp_path: Path, monkeypatch, capsys, single_restore_task: dict[str, str]
+) -> None:
+    """Always print one final summary line at the end of main."""
+    logfile = tmp_path / "A" / single_restore_task["upid"]
     logfile.parent.mkdir(parents=True)
     logfile.write_text("", encoding="utf-8")
 
-    monkeypatch.setattr(
-        restore_watcher, "read_active_tasks", lambda active_path=None: [task]
-    )
-    monkeypatch.setattr(restore_watcher, "filter_restore_tasks", lambda tasks: tasks)
     monkeypatch.setattr(
         restore_watcher, "find_task_logfile", lambda upid_str, tasks_root=None: logfile
     )
@@ -158,19 +202,9 @@ def test_collect_monitoring_data_prints_heartbeat_without_progress() -> None:
     assert "waiting log" in output_text
 
 
+@pytest.mark.usefixtures("single_restore_task")
 def test_debug_mode_logs_to_stderr(monkeypatch, capsys) -> None:
     """Emit debug logs on stderr when --debug is enabled."""
-    task = {
-        "upid": "UPID:node:1:2:A1234567:qmrestore:100:root@pam:",
-        "action": "qmrestore",
-        "status": "0",
-        "raw": "UPID:node:1:2:A1234567:qmrestore:100:root@pam:",
-    }
-
-    monkeypatch.setattr(
-        restore_watcher, "read_active_tasks", lambda active_path=None: [task]
-    )
-    monkeypatch.setattr(restore_watcher, "filter_restore_tasks", lambda tasks: tasks)
     monkeypatch.setattr(
         restore_watcher,
         "resolve_restore_logfile",
@@ -206,3 +240,148 @@ def test_build_dashboard_lines_keeps_only_five_recent_logs() -> None:
     assert len(lines) == 6
     assert lines[1].endswith("log-3")
     assert lines[-1].endswith("log-7")
+
+
+def test_follow_log_lines_polls_without_inotify(monkeypatch, tmp_path: Path) -> None:
+    """Yield written lines, then idle ticks while polling for more data."""
+    log_path = tmp_path / "task.log"
+    log_path.write_text("first line\nsecond line\n", encoding="utf-8")
+    sleeps: list[float] = []
+    monkeypatch.setattr(restore_watcher, "INotify", None)
+    monkeypatch.setattr(restore_watcher.time, "sleep", sleeps.append)
+
+    follower = restore_watcher.follow_log_lines(log_path)
+
+    assert next(follower) == "first line"
+    assert next(follower) == "second line"
+    assert next(follower) == ""
+    assert sleeps == [restore_watcher.LOG_POLL_INTERVAL_SECONDS]
+    follower.close()
+
+
+def test_follow_log_lines_waits_for_complete_lines(monkeypatch, tmp_path: Path) -> None:
+    """Hold back a partial last line until its newline has been written."""
+    log_path = tmp_path / "task.log"
+    log_path.write_bytes(b"first line\npartial")
+    monkeypatch.setattr(restore_watcher, "INotify", None)
+    monkeypatch.setattr(restore_watcher.time, "sleep", lambda seconds: None)
+
+    follower = restore_watcher.follow_log_lines(log_path)
+
+    assert next(follower) == "first line"
+    assert next(follower) == ""
+    with log_path.open("ab") as handle:
+        handle.write(b" line\n")
+    assert next(follower) == "partial line"
+    follower.close()
+
+
+def test_collect_monitoring_data_renders_once_per_caught_up_batch() -> None:
+    """Defer progress renders until the source reports it has caught up."""
+    lines = [
+        "transferred 1.0 GiB of 10.0 GiB (10.0%) in 10s",
+        "transferred 2.0 GiB of 10.0 GiB (20.0%) in 20s",
+        "",
+        "TASK OK",
+    ]
+    output_stream = StringIO()
+
+    restore_watcher.collect_monitoring_data(
+        lines,
+        output_stream=output_stream,
+        update_interval_seconds=60.0,
+        now_fn=lambda: 0.0,
+    )
+
+    status_lines = [
+        line for line in output_stream.getvalue().splitlines() if line.startswith("[")
+    ]
+    assert len(status_lines) == 1
+    assert "2.00/ 10.00 GiB" in status_lines[0]
+
+
+def test_read_lines_in_background_yields_lines_then_stops() -> None:
+    """Forward every source line and finish once the source is exhausted."""
+    source = ["first", "", "second"]
+
+    forwarded = [
+        line for line in restore_watcher.read_lines_in_background(source) if line
+    ]
+
+    assert forwarded == ["first", "second"]
+
+
+def test_read_lines_in_background_reraises_source_errors() -> None:
+    """Surface exceptions raised by the source on the consumer side."""
+
+    def failing_source() -> Iterator[str]:
+        yield "first"
+        raise OSError("log vanished")
+
+    reader = restore_watcher.read_lines_in_background(failing_source())
+
+    with pytest.raises(OSError, match="log vanished"):
+        for _ in reader:
+            pass
+
+
+def test_follow_log_lines_joins_lines_split_across_reads(
+    monkeypatch, tmp_path: Path
+) -> None:
+    """Reassemble lines, including multi-byte characters, cut by chunk reads."""
+    log_path = tmp_path / "task.log"
+    log_path.write_bytes("first line\nrestore réussi\n".encode("utf-8"))
+    monkeypatch.setattr(restore_watcher, "INotify", None)
+    monkeypatch.setattr(restore_watcher, "LOG_READ_CHUNK_BYTES", 4)
+    monkeypatch.setattr(restore_watcher.time, "sleep", lambda seconds: None)
+
+    follower = restore_watcher.follow_log_lines(log_path)
+
+    assert [next(follower) for _ in range(3)] == ["first line", "restore réussi", ""]
+    follower.close()
+
+
+def test_collect_monitoring_data_reads_clock_on_idle_ticks_only() -> None:
+    """Read the clock on idle ticks, not for every line of a burst."""
+    lines = ["restoring archive", "extracting", "extracting", "", "TASK OK"]
+    clock_reads: list[float] = []
+
+    def fake_clock() -> float:
+        clock_reads.append(0.0)
+        return 0.0
+
+    restore_watcher.collect_monitoring_data(
+        lines, output_stream=StringIO(), now_fn=fake_clock
+    )
+
+    # Initial read, first line of the burst, then the idle tick
+    assert len(clock_reads) == 3
+
+
+def test_render_dashboard_writes_one_frame_per_call() -> None:
+    """Emit each frame, cursor movement included, in a single write."""
+    stream = RecordingStream()
+
+    count = restore_watcher.render_dashboard(stream, ["status", "  log"], 2, True)
+
+    assert count == 2
+    assert stream.writes == ["\033[2A\033[2Kstatus\n\033[2K  log\n"]
+
+
+def test_collect_monitoring_data_batches_debug_lines() -> None:
+    """Write the debug lines of one burst in a single call, before the next."""
+    debug_stream = RecordingStream()
+
+    _, status = restore_watcher.collect_monitoring_data(
+        ["first", "second", "", "TASK OK"], debug=True, debug_stream=debug_stream
+    )
+
+    assert status == "success"
+    assert debug_stream.writes[0] == (
+        "[debug] Ignored non-progress log line: first\n"
+        "[debug] Ignored non-progress log line: second\n"
+    )
+    assert "Ignored non-progress log line: TASK OK" in debug_stream.writes[1]
+    assert debug_stream.getvalue().endswith(
+        "[debug] Detected terminal status: success\n"
+    )
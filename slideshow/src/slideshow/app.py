@@ -12,8 +12,9 @@ import tkinter as tk
 from tkinter import messagebox
 import logging
 import time
+from collections import OrderedDict
 from pathlib import Path
-from PIL import Image, ImageTk, ImageSequence
+from PIL import Image, ImageTk
 
 from . import config, controls, display, favorites, hud, image_loader, yoink, exif_utils
 from .exceptions.slideshow_errors import ImageNotFound
@@ -34,8 +35,10 @@ class ImageSlideshowApp:
         # Core state
         self.images: list[Path] = []
         self.current_index: int = 0
-        self.preloaded_images: dict[int, Image.Image] = {}
+        self.preloader = image_loader.ImagePreloader()
         self.favorites: list[int] = []
+        # Modification times gathered by the first sort, reused by later ones
+        self._mtimes: dict[Path, float] = {}
         
         # Playback state
         self.timer_running: bool = True
@@ -52,16 +55,28 @@ class ImageSlideshowApp:
         self.show_full_hud: bool = True
         self._current_photo_ref: ImageTk.PhotoImage | tk.PhotoImage | None = None
         self._resize_job: str | None = None
+        self._redraw_pending: bool = False
+        self._redraw_force_reload: bool = False
+        # (index, canvas width, canvas height, brightness) of the image on screen
+        self._last_draw_key: tuple[int, int, int, float] | None = None
+        self._jump_entry: tk.Entry | None = None
+        self._display_cache: OrderedDict[tuple[int, int, int, float], ImageTk.PhotoImage | tk.PhotoImage] = OrderedDict()
 
         # GIF animation state
         self._gif_animation_after_id: str | None = None
         self._animate_gif_frames: list[ImageTk.PhotoImage | tk.PhotoImage] = []
         self._animate_gif_durations: list[int] = []
         self._animate_gif_idx: int = 0
+        self._animation_cache: OrderedDict[
+            tuple[int, int, int, float], tuple[list[ImageTk.PhotoImage | tk.PhotoImage], list[int]]
+        ] = OrderedDict()
 
         # UI Elements
         self.canvas = tk.Canvas(self.window, bg='black', highlightthickness=0)
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        # Persistent items, updated in place on every redraw; created in stacking order
+        self._image_item: int = self.canvas.create_image(0, 0, anchor=tk.CENTER, tags="image")
+        self._hud_bg_item, self._hud_text_item = hud.create_hud_items(self.canvas)
 
         self.setup()
 
@@ -117,27 +132,6 @@ class ImageSlideshowApp:
             self._gif_animation_after_id = None
 
         try:
-            pil_image = self.preloaded_images.get(self.current_index)
-            if not pil_image or force_reload:
-                pil_image = Image.open(image_path)
-                pil_image.load()
-                
-                # Convert to RGB immediately after loading to prevent compatibility issues
-                # RGB is the most reliable mode for all subsequent operations including ImageTk
-                if pil_image.mode != 'RGB':
-                    logger.debug(f"Converting loaded image from mode '{pil_image.mode}' to 'RGB' for maximum compatibility.")
-                    # Handle transparency by adding a white background
-                    if pil_image.mode in ('RGBA', 'LA') or 'transparency' in pil_image.info:
-                        background = Image.new('RGB', pil_image.size, (255, 255, 255))
-                        if pil_image.mode == 'P':
-                            pil_image = pil_image.convert('RGBA')
-                        background.paste(pil_image, mask=pil_image.split()[-1] if pil_image.mode in ('RGBA', 'LA') else None)
-                        pil_image = background
-                    else:
-                        pil_image = pil_image.convert('RGB')
-                
-                self.preloaded_images[self.current_index] = pil_image
-
             canvas_width = self.canvas.winfo_width()
             canvas_height = self.canvas.winfo_height()
 
@@ -145,53 +139,138 @@ class ImageSlideshowApp:
                 self.after_id = self.window.after(100, lambda: self.show_image(self.current_index, force_reload))
                 return
 
-            resized_image = display.resize_image(pil_image, canvas_width, canvas_height)
-            adjusted_image = display.adjust_brightness(resized_image, self.brightness)
-
-            self.canvas.delete("all")
-
-            is_animated = getattr(pil_image, "is_animated", False)
-            n_frames = getattr(pil_image, "n_frames", 1)
-
-            if is_animated and n_frames > 1:
-                self._animate_gif_frames = []
-                self._animate_gif_durations = []
-                for frame_pil in ImageSequence.Iterator(pil_image):
-                    frame_rgba = frame_pil.copy().convert("RGBA")
-                    frame_resized = display.resize_image(frame_rgba, canvas_width, canvas_height)
-                    frame_adjusted = display.adjust_brightness(frame_resized, self.brightness)
-                    frame_photo = display.create_photoimage_robust(frame_adjusted)
-                    if frame_photo:
-                        self._animate_gif_frames.append(frame_photo)
-                        self._animate_gif_durations.append(frame_pil.info.get('duration', 100))
-                
-                if self._animate_gif_frames:
-                    self._animate_gif_idx = 0
-                    display.animate_gif_next_frame(self)
-                else:
-                    self._current_photo_ref = display.display_static_image(self.canvas, adjusted_image)
+            # Redisplaying an image at the same size and brightness reuses its PhotoImage
+            cache_key = self._draw_key(canvas_width, canvas_height)
+            if force_reload:
+                self._forget_display_cache(self.current_index)
+            cached_photo = self._display_cache.get(cache_key)
+            if cached_photo is not None:
+                self._display_cache.move_to_end(cache_key)
+                self.canvas.delete("message")
+                display.draw_photo(self.canvas, cached_photo, self._image_item)
+                self._current_photo_ref = cached_photo
             else:
-                self._current_photo_ref = display.display_static_image(self.canvas, adjusted_image)
+                self._render_image(image_path, cache_key, force_reload)
+
+            self._last_draw_key = cache_key
 
             hud.update_hud(self)
             if self.info_displayed:
                 self.display_image_info()
 
-        except (FileNotFoundError, IOError, tk.TclError) as e:
+        except (FileNotFoundError, IOError, tk.TclError, ImageNotFound) as e:
             logger.error(f"Error displaying image '{image_path.name}': {e}", exc_info=True)
             self.next_image_auto()
             return
 
-        try:
-            self.preloaded_images = image_loader.preload_images(
-                self.images, self.current_index, self.preloaded_images, self.loop
-            )
-        except ImageNotFound as e:
-            logger.warning(f"Failed to preload image, it may have been moved or deleted: {e}")
+        # Decoding happens on the preloader thread; this only queues the request
+        self.preloader.schedule(
+            self.images, self.current_index, self.loop, (canvas_width, canvas_height)
+        )
 
         if self.timer_running and not self._gif_animation_after_id:
             self.after_id = self.window.after(int(self.delay * 1000), self.next_image_auto)
 
+    def _render_image(
+        self, image_path: Path, cache_key: tuple[int, int, int, float], force_reload: bool
+    ) -> None:
+        """
+        Load, resize and draw the current image, or start its animation.
+
+        Args:
+            image_path: The path of the current image.
+            cache_key: The (index, canvas width, canvas height, brightness) key
+                       under which the static PhotoImage is cached.
+            force_reload: If True, reloads the image from disk.
+        """
+        _, canvas_width, canvas_height, _ = cache_key
+        animation = self._get_animation_frames(image_path, cache_key)
+        if animation is not None:
+            self.canvas.delete("message")
+            self._animate_gif_frames, self._animate_gif_durations = animation
+            display.draw_photo(self.canvas, self._animate_gif_frames[0], self._image_item)
+            self._animate_gif_idx = 0
+            display.animate_gif_next_frame(self)
+            return
+
+        display_size = (canvas_width, canvas_height)
+        pil_image = self.preloader.get(self.current_index, display_size)
+        if not pil_image or force_reload:
+            # Decoded in RGB, and for JPEGs only at the resolution the canvas needs
+            pil_image = image_loader.load_image(image_path, display_size)
+            self.preloader.put(self.current_index, pil_image, display_size)
+
+        resized_image = display.resize_image(pil_image, canvas_width, canvas_height)
+        adjusted_image = display.adjust_brightness(resized_image, self.brightness)
+
+        # The entry about to be evicted hands over its Tk image, so pixels of
+        # the same size are pasted into it rather than allocating a new one
+        recycled_photo = None
+        if len(self._display_cache) >= config.DISPLAY_CACHE_SIZE:
+            _, recycled_photo = self._display_cache.popitem(last=False)
+
+        self.canvas.delete("message")
+        self._current_photo_ref = display.display_static_image(
+            self.canvas, adjusted_image, self._image_item, recycled_photo
+        )
+        if self._current_photo_ref is not None:
+            self._display_cache[cache_key] = self._current_photo_ref
+
+    def _get_animation_frames(
+        self, image_path: Path, cache_key: tuple[int, int, int, float]
+    ) -> tuple[list[ImageTk.PhotoImage | tk.PhotoImage], list[int]] | None:
+        """
+        Return the display-ready frames of an animated image, building them once.
+
+        The frames are decoded from the original file, since the RGB copy kept
+        by the preloader only holds the first frame.
+
+        Args:
+            image_path: The path of the current image.
+            cache_key: The (index, canvas width, canvas height, brightness) key
+                       under which the frames are cached.
+
+        Returns:
+            The frames and their durations in milliseconds, or None if the
+            image is not animated.
+        """
+        if image_path.suffix.lower() not in config.ANIMATED_IMAGE_EXTENSIONS:
+            return None
+        animation = self._animation_cache.get(cache_key)
+        if animation is not None:
+            self._animation_cache.move_to_end(cache_key)
+            return animation
+
+        _, canvas_width, canvas_height, _ = cache_key
+        with Image.open(image_path) as source:
+            if not getattr(source, "is_animated", False) or getattr(source, "n_frames", 1) <= 1:
+                return None
+            animation = display.build_animation_frames(source, canvas_width, canvas_height, self.brightness)
+        if not animation[0]:
+            return None
+
+        self._animation_cache[cache_key] = animation
+        if len(self._animation_cache) > config.ANIMATION_CACHE_SIZE:
+            self._animation_cache.popitem(last=False)
+        return animation
+
+    def _forget_display_cache(self, index: int | None = None) -> None:
+        """
+        Drop cached PhotoImages and animation frames for one index, or all of them.
+
+        Args:
+            index: The image index whose entries are dropped. If None, the
+                   whole caches are cleared.
+        """
+        if index is None:
+            self._display_cache.clear()
+            self._animation_cache.clear()
+            return
+        for key in [key for key in self._display_cache if key[0] == index]:
+            del self._display_cache[key]
+        for key in [key for key in self._animation_cache if key[0] == index]:
+            del self._animation_cache[key]
+
     def next_image_auto(self) -> None:
         """
         Automatically advance to the next image as part of the slideshow timer.
@@ -250,16 +329,20 @@ class ImageSlideshowApp:
     def shuffle_images(self) -> None:
         """Shuffle the order of images and display the new current one."""
         self.images, self.current_index = image_loader.shuffle_images(self.images, self.current_index)
+        self.preloader.clear()
+        self._forget_display_cache()
         self.show_image(self.current_index)
 
     def sort_images(self) -> None:
         """Sort images by modification time and display the first one."""
         try:
-            self.images = image_loader.sort_images_by_time(self.images)
+            self.images = image_loader.sort_images_by_time(self.images, mtimes=self._mtimes)
         except ImageNotFound as e:
             logger.error(f"Failed to sort images because a file was not found: {e}")
             messagebox.showerror("Error", f"Could not sort images.\nFile not found: {e}")
             return
+        self.preloader.clear()
+        self._forget_display_cache()
         self.current_index = 0
         self.show_image(self.current_index)
 
@@ -311,6 +394,43 @@ class ImageSlideshowApp:
         """Clear the image information overlay from the canvas."""
         self.canvas.delete("info_text")
 
+    def request_redraw(self, force_reload: bool = False) -> None:
+        """
+        Redraw the current image once Tk is idle.
+
+        Requests made before the redraw runs, such as a held brightness key or
+        a settled resize, are coalesced into a single `show_image` call.
+
+        Args:
+            force_reload: If True, the coalesced redraw reloads the image from disk.
+        """
+        self._redraw_force_reload = self._redraw_force_reload or force_reload
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.window.after_idle(self._do_redraw)
+
+    def _draw_key(self, canvas_width: int, canvas_height: int) -> tuple[int, int, int, float]:
+        """Return the key identifying how the current image is drawn at the given canvas size."""
+        return (self.current_index, canvas_width, canvas_height, round(self.brightness, 2))
+
+    def _do_redraw(self) -> None:
+        """
+        Run the redraw coalesced by `request_redraw`.
+
+        The redraw is skipped when the image on screen already matches the
+        current index, canvas size and brightness, e.g. for `<Configure>`
+        events that did not actually resize the window.
+        """
+        force_reload = self._redraw_force_reload
+        self._redraw_pending = False
+        self._redraw_force_reload = False
+        if not force_reload and self._last_draw_key == self._draw_key(
+            self.canvas.winfo_width(), self.canvas.winfo_height()
+        ):
+            logger.debug("Redraw skipped: the image on screen is already up to date.")
+            return
+        self.show_image(self.current_index, force_reload=force_reload)
+
     def on_resize(self, event: tk.Event) -> None:
         """
         Handle the window resize event.
@@ -325,14 +445,13 @@ class ImageSlideshowApp:
             if self._resize_job:
                 self.window.after_cancel(self._resize_job)
             if event.width > 50 and event.height > 50:
-                self._resize_job = self.window.after(
-                    250, lambda: self.show_image(self.current_index, force_reload=False)
-                )
+                self._resize_job = self.window.after(250, self.request_redraw)
 
     def quit(self) -> None:
         """Cleanly shut down the application."""
         logger.info("Quit command received. Saving favorites and closing.")
         favorites.save_favorites(self.image_folder, self.favorites, len(self.images))
+        self.preloader.close()
         if self.after_id:
             self.window.after_cancel(self.after_id)
         if self._gif_animation_after_id:
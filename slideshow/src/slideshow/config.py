@@ -25,3 +25,15 @@ DEFAULT_LOG_LEVEL = 'INFO'
 # Name of the file used to store the list of favorite images.
 # This file is created in the root of the scanned image folder.
 FAVORITES_FILENAME = 'favorites.txt'
+
+# Number of screen-sized PhotoImages kept for instant redisplay.
+# Entries are keyed by image index, canvas size and brightness.
+DISPLAY_CACHE_SIZE = 5
+
+# Extensions of formats that may hold an animation.
+# Their frames are decoded from the original file instead of the RGB copy.
+ANIMATED_IMAGE_EXTENSIONS = ('.gif', '.webp')
+
+# Number of animations whose decoded frames are kept for instant replay.
+# Entries are keyed like the PhotoImage cache.
+ANIMATION_CACHE_SIZE = 3
@@ -8,7 +8,6 @@ mouse events) to their corresponding actions within the application.
 
 import tkinter as tk
 import logging
-from tkinter import simpledialog, messagebox
 from typing import TYPE_CHECKING
 
 from . import hud
@@ -85,29 +84,88 @@ def on_click(app: 'ImageSlideshowApp', event: tk.Event):
     if event.y < app.canvas.winfo_height() - 100:
         toggle_timer(app)
 
-def jump_to_image(app: 'ImageSlideshowApp'):
+def jump_to_image(app: 'ImageSlideshowApp') -> None:
+    """
+    Opens an in-canvas overlay asking for the number of the image to jump to.
+
+    The entry is created once and reused; unlike a dialog, it needs no new
+    Toplevel or grab, so the slideshow keeps running while it is open.
+
+    Args:
+        app (ImageSlideshowApp): The main application instance.
+    """
+    center_x, center_y = app.canvas.winfo_width() // 2, app.canvas.winfo_height() // 2
     if not app.images:
-        messagebox.showinfo("Jump to Image", "No images loaded.", parent=app.window)
+        logger.info("Jump to image: no images loaded.")
+        app.canvas.delete("message")
+        app.canvas.create_text(
+            center_x, center_y, text="No images loaded.",
+            fill="red", font=("Helvetica", 14, "bold"), tags="message"
+        )
         return
 
-    num_str = simpledialog.askstring(
-        "Jump to Image",
-        f"Enter image number (1 to {len(app.images)}):",
-        parent=app.window
+    if app._jump_entry is None:
+        app._jump_entry = _create_jump_entry(app)
+
+    app.canvas.delete("jump")
+    app.canvas.create_text(
+        center_x, center_y - 30, text=f"Jump to image (1 to {len(app.images)}):",
+        fill="white", font=("Helvetica", 14, "bold"), tags=("jump", "jump_prompt")
     )
-    if num_str:
-        try:
-            index = int(num_str) - 1
-            if 0 <= index < len(app.images):
-                app.timer_running = False
-                if app.after_id:
-                    app.window.after_cancel(app.after_id)
-                    app.after_id = None
-                app.show_image(index)
-            else:
-                messagebox.showwarning("Invalid Input", f"Enter a number between 1 and {len(app.images)}.", parent=app.window)
-        except ValueError:
-            messagebox.showerror("Invalid Input", "Please enter a valid number.", parent=app.window)
+    app.canvas.create_window(center_x, center_y, window=app._jump_entry, tags="jump")
+    app._jump_entry.delete(0, tk.END)
+    app._jump_entry.focus_set()
+
+def _create_jump_entry(app: 'ImageSlideshowApp') -> tk.Entry:
+    """Creates the entry of the jump overlay and binds its keys."""
+    entry = tk.Entry(app.canvas, width=8, justify=tk.CENTER, font=("Helvetica", 14))
+    # Leave out the window's bind tag so its shortcuts (q, Escape, ...) don't fire while typing
+    entry.bindtags((str(entry), 'Entry', 'all'))
+    entry.bind('<Return>', lambda e: submit_jump(app))
+    entry.bind('<KP_Enter>', lambda e: submit_jump(app))
+    entry.bind('<Escape>', lambda e: close_jump_overlay(app))
+    return entry
+
+def close_jump_overlay(app: 'ImageSlideshowApp') -> None:
+    """
+    Removes the jump overlay and gives the keyboard focus back to the window.
+
+    Args:
+        app (ImageSlideshowApp): The main application instance.
+    """
+    app.canvas.delete("jump")
+    app.window.focus_set()
+
+def submit_jump(app: 'ImageSlideshowApp') -> None:
+    """
+    Jumps to the image number typed in the overlay and pauses the slideshow.
+
+    An invalid number leaves the overlay open, with the error shown in red in
+    its prompt and the typed text selected.
+
+    Args:
+        app (ImageSlideshowApp): The main application instance.
+    """
+    num_str = app._jump_entry.get().strip() if app._jump_entry else ""
+    try:
+        index = int(num_str) - 1
+    except ValueError:
+        index = -1
+    if not 0 <= index < len(app.images):
+        logger.warning(f"Invalid image number '{num_str}': enter a number between 1 and {len(app.images)}.")
+        app.canvas.itemconfigure(
+            "jump_prompt", text=f"Invalid number, enter 1 to {len(app.images)}:", fill="red"
+        )
+        if app._jump_entry:
+            app._jump_entry.select_range(0, tk.END)
+        return
+
+    close_jump_overlay(app)
+    app.timer_running = False
+    if app.after_id:
+        app.window.after_cancel(app.after_id)
+        app.after_id = None
+    app.show_image(index)
 
 def increase_speed(app: 'ImageSlideshowApp'):
     app.delay = max(0.1, app.delay - 0.5)
@@ -140,12 +198,12 @@ def toggle_always_on_top(app: 'ImageSlideshowApp'):
 def increase_brightness(app: 'ImageSlideshowApp'):
     app.brightness = min(3.0, app.brightness + 0.1)
     logger.info(f"Brightness increased to {app.brightness:.1f}")
-    app.show_image(app.current_index, force_reload=True)
+    app.request_redraw()
 
 def decrease_brightness(app: 'ImageSlideshowApp'):
     app.brightness = max(0.1, app.brightness - 0.1)
     logger.info(f"Brightness decreased to {app.brightness:.1f}")
-    app.show_image(app.current_index, force_reload=True)
+    app.request_redraw()
 
 def toggle_show_full_hud(app: 'ImageSlideshowApp'):
     app.show_full_hud = not app.show_full_hud
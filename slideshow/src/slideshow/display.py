@@ -14,6 +14,8 @@ import io
 import base64
 import tempfile
 import os
+import functools
+import struct
 from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
@@ -21,6 +23,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Number of 8-bit color bands per mode that brightness lookup tables support;
+# the alpha band of 'LA' and 'RGBA' images is left untouched
+_BRIGHTNESS_COLOR_BANDS = {'L': 1, 'LA': 1, 'RGB': 3, 'RGBA': 3}
+
 def resize_image(image: Image.Image, target_width: int, target_height: int) -> Image.Image:
     """
     Resizes a PIL Image to fit within target dimensions while maintaining aspect ratio.
@@ -42,22 +48,24 @@ def resize_image(image: Image.Image, target_width: int, target_height: int) -> I
         logger.warning(f"Resize_image: Invalid original image dimensions ({original_width}x{original_height}).")
         return image.copy()
 
-    image_aspect_ratio = original_width / original_height
-    target_aspect_ratio = target_width / target_height
-
+    # Aspect ratios are compared by cross-multiplying, so the size is exact
+    # integer math with no float rounding (e.g. 599 instead of 600)
     new_width, new_height = target_width, target_height
-    if image_aspect_ratio > target_aspect_ratio:
-        new_height = int(new_width / image_aspect_ratio)
+    if original_width * target_height > target_width * original_height:
+        new_height = target_width * original_height // original_width
     else:
-        new_width = int(new_height * image_aspect_ratio)
+        new_width = target_height * original_width // original_height
 
     new_width = max(1, new_width)
     new_height = max(1, new_height)
 
+    # Draft-decoded JPEGs are usually less than twice the target size, where
+    # BILINEAR looks the same as LANCZOS; upscales and strong reductions keep LANCZOS
+    mild_reduction = new_width <= original_width < 2 * new_width
     try:
-        resample_filter = Image.Resampling.LANCZOS
+        resample_filter = Image.Resampling.BILINEAR if mild_reduction else Image.Resampling.LANCZOS
     except AttributeError:
-        resample_filter = 1  # Fallback for older Pillow versions
+        resample_filter = 2 if mild_reduction else 1  # Fallback for older Pillow versions
 
     try:
         return image.resize((new_width, new_height), resample_filter)
@@ -76,16 +84,44 @@ def adjust_brightness(image: Image.Image, brightness_factor: float) -> Image.Ima
     Returns:
         Image.Image: The brightness-adjusted PIL Image.
     """
-    if brightness_factor == 1.0:
+    if abs(brightness_factor - 1.0) < 1e-3:
         return image
 
     try:
-        enhancer = ImageEnhance.Brightness(image)
-        return enhancer.enhance(brightness_factor)
+        color_bands = _BRIGHTNESS_COLOR_BANDS.get(image.mode)
+        if color_bands is None:
+            enhancer = ImageEnhance.Brightness(image)
+            return enhancer.enhance(brightness_factor)
+        # A lookup table applied in C, instead of blending with a black image
+        table = _brightness_table(brightness_factor) * color_bands
+        if image.mode in ('LA', 'RGBA'):
+            table += list(range(256))
+        return image.point(table)
     except Exception as e:
         logger.warning(f"Could not adjust brightness for image (mode {image.mode}): {e}")
         return image
 
+def _to_float32(value: float) -> float:
+    """Round a float to single precision."""
+    return cast(float, struct.unpack('f', struct.pack('f', value))[0])
+
+@functools.lru_cache(maxsize=64)
+def _brightness_table(brightness_factor: float) -> list[int]:
+    """
+    Builds the 256-entry lookup table scaling one 8-bit band by a brightness factor.
+
+    The products are computed in single precision and truncated, as in the
+    blend behind ImageEnhance.Brightness, so both give identical pixels.
+
+    Args:
+        brightness_factor (float): The enhancement factor.
+
+    Returns:
+        list[int]: The scaled value of every input level.
+    """
+    factor = _to_float32(brightness_factor)
+    return [min(255, int(_to_float32(factor * level))) for level in range(256)]
+
 def create_photoimage_robust(image: Image.Image) -> tk.PhotoImage | None:
     """
     Creates a tk.PhotoImage from a PIL Image with comprehensive error handling.
@@ -161,38 +197,108 @@ def create_photoimage_robust(image: Image.Image) -> tk.PhotoImage | None:
                 logger.error(f"All PhotoImage creation methods failed. Last error: {e3}")
                 return None
 
-def display_static_image(canvas: tk.Canvas, image: Image.Image) -> tk.PhotoImage | None:
+def display_static_image(
+    canvas: tk.Canvas,
+    image: Image.Image,
+    item_id: int | None = None,
+    recycle: ImageTk.PhotoImage | tk.PhotoImage | None = None,
+) -> ImageTk.PhotoImage | tk.PhotoImage | None:
     """
     Displays a static PIL image on the canvas.
 
     Args:
         canvas (tk.Canvas): The canvas to draw on.
         image (Image.Image): The (already resized and adjusted) PIL image.
+        item_id (int | None): The persistent canvas image item to update, if any.
+        recycle (ImageTk.PhotoImage | tk.PhotoImage | None): A PhotoImage that is no longer
+            displayed; if it has the image's size, the pixels are pasted into it instead of
+            allocating a new Tk image.
 
     Returns:
         tk.PhotoImage | None: The reference to the created PhotoImage to prevent
                               garbage collection, or None on failure.
     """
-    photo = create_photoimage_robust(image)
+    photo: ImageTk.PhotoImage | tk.PhotoImage | None
+    if isinstance(recycle, ImageTk.PhotoImage) and (recycle.width(), recycle.height()) == image.size:
+        recycle.paste(image)
+        photo = recycle
+    else:
+        photo = create_photoimage_robust(image)
     if photo:
-        canvas.delete("image")
-        canvas.create_image(
-            canvas.winfo_width() // 2, canvas.winfo_height() // 2,
-            image=photo, anchor=tk.CENTER, tags="image"
-        )
+        draw_photo(canvas, photo, item_id)
     else:
         logger.error("Failed to create PhotoImage for static display.")
-        canvas.delete("all")
+        if item_id is not None:
+            canvas.itemconfigure(item_id, image="")
+        else:
+            canvas.delete("image")
         canvas.create_text(
             canvas.winfo_width() // 2, canvas.winfo_height() // 2,
-            text="Error displaying image", fill="red", font=("Helvetica", 16)
+            text="Error displaying image", fill="red", font=("Helvetica", 16), tags="message"
         )
     return photo
 
+def draw_photo(canvas: tk.Canvas, photo: ImageTk.PhotoImage | tk.PhotoImage, item_id: int | None = None) -> int:
+    """
+    Draws an existing PhotoImage centered on the canvas, replacing the current image.
+
+    When a persistent image item is given, it is updated in place rather than
+    deleted and recreated, which saves round trips to Tk on every frame.
+
+    Args:
+        canvas (tk.Canvas): The canvas to draw on.
+        photo (ImageTk.PhotoImage | tk.PhotoImage): The PhotoImage to display.
+        item_id (int | None): The persistent canvas image item to update, if any.
+
+    Returns:
+        int: The ID of the canvas item showing the photo.
+    """
+    center_x, center_y = canvas.winfo_width() // 2, canvas.winfo_height() // 2
+    if item_id is None:
+        canvas.delete("image")
+        return canvas.create_image(center_x, center_y, image=photo, anchor=tk.CENTER, tags="image")
+    canvas.itemconfigure(item_id, image=photo)
+    canvas.coords(item_id, center_x, center_y)
+    return item_id
+
+def build_animation_frames(
+    image: Image.Image, target_width: int, target_height: int, brightness_factor: float
+) -> tuple[list[ImageTk.PhotoImage | tk.PhotoImage], list[int]]:
+    """
+    Decodes every frame of an animated image into display-ready PhotoImages.
+
+    Each frame is resized and brightness-adjusted once, so the animation loop
+    only has to swap precomputed images.
+
+    Args:
+        image (Image.Image): The opened animated image (e.g. a GIF).
+        target_width (int): The maximum width of the frames.
+        target_height (int): The maximum height of the frames.
+        brightness_factor (float): The brightness enhancement factor.
+
+    Returns:
+        tuple[list[ImageTk.PhotoImage | tk.PhotoImage], list[int]]: The frames that could be converted
+        and their durations in milliseconds.
+    """
+    frames: list[ImageTk.PhotoImage | tk.PhotoImage] = []
+    durations: list[int] = []
+    for frame_pil in ImageSequence.Iterator(image):
+        frame_rgba = frame_pil.copy().convert("RGBA")
+        frame_resized = resize_image(frame_rgba, target_width, target_height)
+        frame_adjusted = adjust_brightness(frame_resized, brightness_factor)
+        frame_photo = create_photoimage_robust(frame_adjusted)
+        if frame_photo:
+            frames.append(frame_photo)
+            durations.append(frame_pil.info.get('duration', 100))
+    return frames, durations
+
 def animate_gif_next_frame(app: 'ImageSlideshowApp') -> None:
     """
     Displays the next frame of an animated GIF and schedules the subsequent frame.
 
+    The frame is swapped into the app's persistent image item, which the caller
+    has already centered on the canvas.
+
     Args:
         app (ImageSlideshowApp): The main application instance containing the state
                                  for GIF animation.
@@ -203,11 +309,7 @@ def animate_gif_next_frame(app: 'ImageSlideshowApp') -> None:
     frame_photo = app._animate_gif_frames[app._animate_gif_idx]
     duration_ms = app._animate_gif_durations[app._animate_gif_idx]
 
-    app.canvas.delete("image")
-    app.canvas.create_image(
-        app.canvas.winfo_width() // 2, app.canvas.winfo_height() // 2,
-        image=frame_photo, anchor=tk.CENTER, tags="image"
-    )
+    app.canvas.itemconfigure(app._image_item, image=frame_photo)
     app._current_photo_ref = frame_photo
 
     app._animate_gif_idx = (app._animate_gif_idx + 1) % len(app._animate_gif_frames)
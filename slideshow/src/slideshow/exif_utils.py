@@ -7,6 +7,7 @@ Image File Format) data from image files. It uses the Pillow library to access
 the metadata embedded in images by digital cameras.
 """
 
+import functools
 import logging
 from pathlib import Path
 from PIL import Image
@@ -16,10 +17,15 @@ import datetime
 # Get a logger instance for this module
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=256)
 def get_formatted_exif_data(image_path: Path) -> str:
     """
     Extracts and formats key EXIF data from an image file.
 
+    Only the file header is parsed: the image is opened lazily and its pixel
+    data is never decoded. Results are memoized per path, since the info
+    overlay is redrawn every time an image is shown.
+
     Args:
         image_path (Path): The path to the image file.
 
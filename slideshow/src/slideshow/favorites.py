@@ -8,6 +8,9 @@ in a text file within the image directory.
 """
 
 import logging
+import os
+import stat
+import tempfile
 from pathlib import Path
 from typing import List
 
@@ -42,11 +45,11 @@ def load_favorites(image_folder: Path, num_images: int) -> List[int]:
         return []
 
     try:
-        with open(favorites_file, 'r', encoding='utf-8') as f:
-            # Read indices, ensuring they are digits and stripping whitespace
-            loaded_indices = [int(line.strip()) for line in f if line.strip().isdigit()]
-            # Filter to keep only valid indices within the current image list bounds
-            valid_favorites = [idx for idx in loaded_indices if 0 <= idx < num_images]
+        # Read indices in one pass, ensuring they are digits
+        tokens = favorites_file.read_text(encoding='utf-8').split()
+        loaded_indices = [int(token) for token in tokens if token.isdigit()]
+        # Filter to keep only valid indices within the current image list bounds
+        valid_favorites = [idx for idx in loaded_indices if 0 <= idx < num_images]
         logger.info(f"Loaded {len(valid_favorites)} valid favorite indices from {favorites_file}.")
         return sorted(valid_favorites)
     except ValueError:
@@ -56,11 +59,33 @@ def load_favorites(image_folder: Path, num_images: int) -> List[int]:
     
     return []
 
+def _target_file_mode(path: Path) -> int:
+    """
+    Returns the permission bits a file written to `path` should have.
+
+    An existing file keeps its mode; a new one gets the default mode for the
+    current umask, as if it had been created with `open()`.
+
+    Args:
+        path (Path): The file about to be written.
+
+    Returns:
+        int: The permission bits to apply.
+    """
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
 def save_favorites(image_folder: Path, favorites: List[int], num_images: int) -> None:
     """
     Saves the current list of favorite image indices to the favorites file.
 
     Before saving, it ensures all indices in the list are valid and unique.
+    The file is written to a temporary file in the same folder and then renamed
+    over the previous one, so an interrupted save never leaves it truncated.
 
     Args:
         image_folder (Path): The directory where the favorites file will be saved.
@@ -79,10 +104,18 @@ def save_favorites(image_folder: Path, favorites: List[int], num_images: int) ->
     try:
         # Filter out invalid indices before saving
         valid_favorites = [idx for idx in favorites if 0 <= idx < num_images]
-        with open(favorites_file, 'w', encoding='utf-8') as f:
-            # Ensure uniqueness and sort before writing
-            for index in sorted(list(set(valid_favorites))):
-                f.write(f"{index}\n")
+        # Ensure uniqueness and sort before writing
+        content = "".join(f"{index}\n" for index in sorted(set(valid_favorites)))
+        fd, temp_path = tempfile.mkstemp(dir=image_folder, prefix=".favorites-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            # mkstemp creates the file as 0600; keep the favorites file readable
+            os.chmod(temp_path, _target_file_mode(favorites_file))
+            os.replace(temp_path, favorites_file)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
         logger.info(f"Saved {len(valid_favorites)} favorite indices to {favorites_file}.")
     except Exception as e:
         logger.error(f"Error saving favorites to '{favorites_file}': {e}")
@@ -33,6 +33,24 @@ def get_hud_shortcut_text() -> str:
     ]
     return "\n".join(shortcuts)
 
+def create_hud_items(canvas: tk.Canvas) -> tuple[int, int]:
+    """
+    Creates the persistent HUD background and text items, initially hidden.
+
+    Args:
+        canvas (tk.Canvas): The canvas to draw on.
+
+    Returns:
+        tuple[int, int]: The IDs of the background rectangle and the text item.
+    """
+    bg_item = canvas.create_rectangle(
+        0, 0, 0, 0, fill="black", outline="", stipple="gray50", state="hidden", tags=("hud", "hud_bg")
+    )
+    text_item = canvas.create_text(
+        0, 0, anchor='sw', fill="white", state="hidden", tags=("hud", "hud_text")
+    )
+    return bg_item, text_item
+
 def update_hud(app: 'ImageSlideshowApp') -> None:
     """
     Updates and redraws the Heads-Up Display (HUD) on the canvas.
@@ -45,9 +63,6 @@ def update_hud(app: 'ImageSlideshowApp') -> None:
                                  the current state (e.g., timer_running, delay)
                                  and the canvas to draw on.
     """
-    # Clear previous HUD elements to prevent overlap
-    app.canvas.delete("hud_bg", "hud_text")
-
     canvas_width = app.canvas.winfo_width()
     canvas_height = app.canvas.winfo_height()
 
@@ -56,6 +71,7 @@ def update_hud(app: 'ImageSlideshowApp') -> None:
     MIN_CANVAS_HEIGHT_FOR_HUD = 60
     if canvas_width < MIN_CANVAS_WIDTH_FOR_HUD or canvas_height < MIN_CANVAS_HEIGHT_FOR_HUD:
         logger.debug(f"Canvas too small ({canvas_width}x{canvas_height}) to draw HUD.")
+        app.canvas.itemconfigure("hud", state="hidden")
         return
 
     # --- Gather HUD information strings ---
@@ -97,6 +113,7 @@ def update_hud(app: 'ImageSlideshowApp') -> None:
 
     if not final_hud_text.strip():
         logger.debug("HUD text is empty, skipping drawing.")
+        app.canvas.itemconfigure("hud", state="hidden")
         return
 
     # --- Drawing parameters ---
@@ -104,11 +121,11 @@ def update_hud(app: 'ImageSlideshowApp') -> None:
     font_size = 10
     hud_font = ("Helvetica", font_size, "bold")
 
-    # Use a temporary text object to measure the required bounding box
-    temp_text_item = app.canvas.create_text(0, 0, text=final_hud_text, font=hud_font, anchor='sw', tags="temp")
-    x1, y1, x2, y2 = app.canvas.bbox(temp_text_item)
-    app.canvas.delete(temp_text_item)
-    
+    # Update the persistent text item in place, then measure its bounding box
+    app.canvas.itemconfigure("hud", state="normal")
+    app.canvas.itemconfigure(app._hud_text_item, text=final_hud_text, font=hud_font)
+    x1, y1, x2, y2 = app.canvas.bbox(app._hud_text_item)
+
     text_width = x2 - x1
     text_height = y2 - y1
 
@@ -118,19 +135,6 @@ def update_hud(app: 'ImageSlideshowApp') -> None:
     rect_x2 = (canvas_width + text_width) / 2 + padding
     rect_y2 = canvas_height
 
-    # Draw the semi-transparent background rectangle
-    app.canvas.create_rectangle(
-        rect_x1, rect_y1, rect_x2, rect_y2,
-        fill="black", outline="", stipple="gray50", tags="hud_bg"
-    )
-
-    # Draw the HUD text on top of the background
-    app.canvas.create_text(
-        rect_x1 + padding,
-        rect_y2 - padding,
-        text=final_hud_text,
-        anchor='sw',
-        fill="white",
-        font=hud_font,
-        tags="hud_text"
-    )
+    # Move the semi-transparent background and the text on top of it
+    app.canvas.coords(app._hud_bg_item, rect_x1, rect_y1, rect_x2, rect_y2)
+    app.canvas.coords(app._hud_text_item, rect_x1 + padding, rect_y2 - padding)
@@ -8,9 +8,13 @@ preloading cache for a smooth user experience.
 """
 
 import logging
+import os
 import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Iterator, List, Dict, Tuple
 from PIL import Image
 
 from .config import SUPPORTED_IMAGE_EXTENSIONS
@@ -18,6 +22,16 @@ from .exceptions.slideshow_errors import ImageNotFound
 
 logger = logging.getLogger(__name__)
 
+# The preload cache holds up to this many times the number of preloaded images,
+# so recently shown ones stay available when going back
+PRELOAD_CACHE_FACTOR = 3
+
+# Images decoded in parallel by the preloader; Pillow's decoders release the GIL
+PRELOAD_WORKERS = min(4, os.cpu_count() or 2)
+
+# Only this many trailing characters of a file name are lowercased to match extensions
+_EXTENSION_TAIL = max(map(len, SUPPORTED_IMAGE_EXTENSIONS))
+
 def load_images_from_folder(image_folder: Path) -> list[Path]:
     """
     Scan a directory recursively for supported image files.
@@ -35,22 +49,48 @@ def load_images_from_folder(image_folder: Path) -> list[Path]:
 
     logger.info(f"Scanning for images in: {image_folder}")
     
-    raw_image_list = [
-        item for item in image_folder.rglob('*')
-        if item.is_file() and \
-           item.name.lower().endswith(SUPPORTED_IMAGE_EXTENSIONS) and \
-           not item.name.startswith('.')
-    ]
+    raw_image_list = list(_walk_image_files(str(image_folder)))
 
     if not raw_image_list:
         logger.warning(f"No images found in '{image_folder}' with supported extensions.")
         return []
 
     # Initial sort is by full path, which is deterministic
-    sorted_images = sorted(raw_image_list)
+    sorted_images = sorted(map(Path, raw_image_list))
     logger.info(f"Found {len(sorted_images)} images.")
     return sorted_images
 
+def _walk_image_files(root: str) -> Iterator[str]:
+    """
+    Yield the paths of supported, non-hidden image files below `root`.
+
+    `os.scandir` reports the entry type from the directory listing itself, so
+    unlike `Path.rglob` plus `Path.is_file` no extra stat call is made per
+    entry on most filesystems, and no Path object is built for skipped files.
+
+    Args:
+        root: The directory to scan recursively.
+
+    Yields:
+        The path of each matching file, as a string.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError as e:
+        logger.warning(f"Cannot scan directory '{root}': {e}")
+        return
+    with entries:
+        for entry in entries:
+            # Symlinked directories are not followed, like Path.rglob
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_image_files(entry.path)
+            elif (
+                not entry.name.startswith('.')
+                and entry.name[-_EXTENSION_TAIL:].lower().endswith(SUPPORTED_IMAGE_EXTENSIONS)
+                and entry.is_file()
+            ):
+                yield entry.path
+
 def shuffle_images(images: list[Path], current_index: int) -> tuple[list[Path], int]:
     """
     Shuffle the list of images, keeping the current image at the start.
@@ -76,7 +116,9 @@ def shuffle_images(images: list[Path], current_index: int) -> tuple[list[Path],
     logger.info(f"Shuffled {len(new_images)} images. Current image '{current_image.name}' is now at index 0.")
     return new_images, 0
 
-def sort_images_by_time(images: list[Path], ascending: bool = True) -> list[Path]:
+def sort_images_by_time(
+    images: list[Path], ascending: bool = True, mtimes: dict[Path, float] | None = None
+) -> list[Path]:
     """
     Sort the list of images by their file modification time.
 
@@ -84,6 +126,8 @@ def sort_images_by_time(images: list[Path], ascending: bool = True) -> list[Path
         images: The list of image paths to sort.
         ascending: If True, sorts from oldest to newest. If False, sorts
                    from newest to oldest.
+        mtimes: Optional cache of modification times, keyed by path. Missing
+                entries are filled in, so later sorts need no stat call.
 
     Returns:
         The sorted list of image paths.
@@ -91,9 +135,18 @@ def sort_images_by_time(images: list[Path], ascending: bool = True) -> list[Path
     if not images:
         return []
 
+    if mtimes is None:
+        mtimes = {}
+
+    def _mtime(path: Path) -> float:
+        mtime = mtimes.get(path)
+        if mtime is None:
+            mtime = mtimes[path] = os.stat(path).st_mtime
+        return mtime
+
     try:
         # Sort by 'st_mtime' (time of last modification)
-        sorted_list = sorted(images, key=lambda p: p.stat().st_mtime, reverse=not ascending)
+        sorted_list = sorted(images, key=_mtime, reverse=not ascending)
         sort_order = "ascending (oldest first)" if ascending else "descending (newest first)"
         logger.info(f"Sorted {len(images)} images by modification time: {sort_order}.")
         return sorted_list
@@ -101,81 +154,225 @@ def sort_images_by_time(images: list[Path], ascending: bool = True) -> list[Path
         logger.error(f"Error sorting images: file not found during stat call. {e}")
         raise ImageNotFound(str(e.filename)) from e
 
-def preload_images(
-    images: list[Path],
-    current_index: int,
-    cache: dict[int, Image.Image],
-    loop: bool,
-    count: int = 5,
-) -> dict[int, Image.Image]:
+def load_image(image_path: Path, draft_size: tuple[int, int] | None = None) -> Image.Image:
     """
-    Preload subsequent images into a cache for faster display.
+    Load an image fully into memory and normalize it to RGB.
 
-    This function loads the next `count` images into memory to ensure smooth
-    transitions. It also implements a cache eviction strategy to remove
-    images that are no longer near the current viewing index.
+    Transparent images are flattened onto a white background; an alpha band
+    that is fully opaque is simply dropped. With a
+    `draft_size`, JPEGs are decoded by libjpeg at the smallest 1/2, 1/4 or 1/8
+    scale that still covers that size, which is much faster and lighter than
+    decoding the full resolution only to shrink it for display.
 
     Args:
-        images: The full list of image paths.
-        current_index: The index of the currently displayed image.
-        cache: The dictionary used for caching preloaded images.
-        loop: Whether the slideshow is in loop mode.
-        count: The number of subsequent images to preload.
+        image_path: The path of the image file to load.
+        draft_size: The (width, height) the image will be displayed at, or
+                    None to decode the full resolution.
 
     Returns:
-        The updated cache dictionary with new images loaded and old ones evicted.
+        The decoded RGB image.
+
+    Raises:
+        ImageNotFound: If the file is missing or cannot be read.
     """
-    if not images:
-        return {}
+    try:
+        image: Image.Image = Image.open(image_path)
+        if draft_size is not None:
+            image.draft('RGB', draft_size)  # No-op for formats other than JPEG
+        image.load()  # Force loading image data into memory
+    except (FileNotFoundError, IOError) as e:
+        raise ImageNotFound(str(image_path)) from e
+
+    # Convert to RGB immediately during preloading for maximum compatibility
+    if image.mode != 'RGB':
+        logger.debug(f"Converting preloaded image from mode '{image.mode}' to 'RGB' for maximum compatibility.")
+        # Handle transparency by adding a white background
+        if image.mode in ('RGBA', 'LA') or 'transparency' in image.info:
+            if image.mode not in ('RGBA', 'LA'):
+                image = image.convert('RGBA')
+            alpha = image.getchannel('A')
+            if alpha.getextrema() == (255, 255):
+                # Opaque screenshots are often saved as RGBA: skip the compositing
+                image = image.convert('RGB')
+            else:
+                background = Image.new('RGB', image.size, (255, 255, 255))
+                background.paste(image, mask=alpha)
+                image = background
+        else:
+            image = image.convert('RGB')
+    return image
 
-    # Determine which indices to preload
+def _indices_to_preload(num_images: int, current_index: int, loop: bool, count: int) -> list[int]:
+    """Return the indices of the next `count` images, stopping at the end unless looping."""
     indices_to_preload = []
     for i in range(1, count + 1):
-        next_idx = (current_index + i) % len(images)
-        if next_idx not in cache:
-            indices_to_preload.append(next_idx)
-        if not loop and (current_index + i) >= (len(images) - 1):
+        indices_to_preload.append((current_index + i) % num_images)
+        if not loop and (current_index + i) >= (num_images - 1):
             break
-    
-    # Load the identified images
-    for index_to_load in indices_to_preload:
-        image_path = images[index_to_load]
-        try:
-            image = Image.open(image_path)
-            image.load()  # Force loading image data into memory
-            
-            # Convert to RGB immediately during preloading for maximum compatibility
-            if image.mode != 'RGB':
-                logger.debug(f"Converting preloaded image from mode '{image.mode}' to 'RGB' for maximum compatibility.")
-                # Handle transparency by adding a white background
-                if image.mode in ('RGBA', 'LA') or 'transparency' in image.info:
-                    background = Image.new('RGB', image.size, (255, 255, 255))
-                    if image.mode == 'P':
-                        image = image.convert('RGBA')
-                    background.paste(image, mask=image.split()[-1] if image.mode in ('RGBA', 'LA') else None)
-                    image = background
-                else:
-                    image = image.convert('RGB')
-            
-            cache[index_to_load] = image
-            logger.debug(f"Preloaded image {index_to_load + 1}/{len(images)}: {image_path.name}")
-        except (FileNotFoundError, IOError) as e:
-            logger.error(f"Error preloading image '{image_path.name}': {e}")
-            if index_to_load in cache:
-                del cache[index_to_load]
-            # Re-raise as a domain-specific exception
-            raise ImageNotFound(str(image_path)) from e
-
-    # Eviction strategy: remove images far from the current one
-    keys_to_keep = set()
-    preload_window_size = count * 2
-    for i in range(-preload_window_size, preload_window_size + 1):
-        idx_to_keep = (current_index + i + len(images)) % len(images)
-        keys_to_keep.add(idx_to_keep)
-
-    current_cache_keys = list(cache.keys())
-    for key in current_cache_keys:
-        if key not in keys_to_keep:
-            del cache[key]
-            
-    return cache
+    return indices_to_preload
+
+def _covers(draft_size: tuple[int, int] | None, display_size: tuple[int, int] | None) -> bool:
+    """Tell whether an image decoded for `draft_size` is sharp enough for `display_size`."""
+    if draft_size is None or display_size is None:
+        return True
+    return draft_size[0] >= display_size[0] and draft_size[1] >= display_size[1]
+
+class ImagePreloader:
+    """
+    Preload upcoming images on a background thread.
+
+    A daemon worker thread hands the missing images of each request to a small
+    pool of decoding threads, so the Tk main thread never blocks on disk reads
+    and several images are decoded at once. The main thread calls `schedule` whenever the current
+    image changes and reads decoded images back with `get`. All access to the
+    cache goes through a lock; Tk objects are never created on the worker.
+
+    Images are decoded for the display size passed to `schedule`; each cache
+    entry remembers that size so a larger window triggers a fresh decode.
+    """
+
+    def __init__(self, count: int = 5) -> None:
+        """
+        Start the preloading worker thread.
+
+        Args:
+            count: The number of subsequent images to keep preloaded.
+        """
+        self.count = count
+        self.max_cached = count * PRELOAD_CACHE_FACTOR
+        # Least recently used first: `get` and insertions move entries to the end
+        self._cache: OrderedDict[int, tuple[Image.Image, tuple[int, int] | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._request: tuple[list[Path], int, bool, tuple[int, int] | None] | None = None
+        # Bumped by `clear`, so images decoded for a stale list are dropped
+        self._generation = 0
+        self._closed = False
+        self._pool = ThreadPoolExecutor(max_workers=PRELOAD_WORKERS, thread_name_prefix="image-decode")
+        self._thread = threading.Thread(target=self._worker, name="image-preloader", daemon=True)
+        self._thread.start()
+
+    def get(self, index: int, display_size: tuple[int, int] | None = None) -> Image.Image | None:
+        """
+        Return the cached image for `index`, or None if it is not loaded.
+
+        Args:
+            index: The image index.
+            display_size: The (width, height) the image is about to be shown
+                          at. An entry decoded for a smaller size counts as
+                          missing.
+        """
+        with self._lock:
+            entry = self._cache.get(index)
+            if entry is not None:
+                self._cache.move_to_end(index)
+        if entry is None:
+            return None
+        image, draft_size = entry
+        return image if _covers(draft_size, display_size) else None
+
+    def put(self, index: int, image: Image.Image, draft_size: tuple[int, int] | None = None) -> None:
+        """Store an image loaded by the caller, with the draft size it was decoded for."""
+        with self._lock:
+            self._cache[index] = (image, draft_size)
+            self._cache.move_to_end(index)
+            self._evict_oldest()
+
+    def clear(self) -> None:
+        """Drop every cached image, e.g. after the image list was reordered."""
+        with self._lock:
+            self._cache.clear()
+            self._request = None
+            self._generation += 1
+
+    def close(self) -> None:
+        """
+        Stop preloading and drop pending decodes.
+
+        The decoding threads are not daemons, so without this the interpreter
+        would run every queued decode before exiting.
+        """
+        with self._lock:
+            self._closed = True
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._wakeup.set()
+
+    def schedule(
+        self,
+        images: list[Path],
+        current_index: int,
+        loop: bool,
+        draft_size: tuple[int, int] | None = None,
+    ) -> None:
+        """
+        Ask the worker to preload the images following `current_index`.
+
+        Only the latest request is kept; an older one still in progress is
+        abandoned before its next image.
+
+        Args:
+            images: The full list of image paths.
+            current_index: The index of the currently displayed image.
+            loop: Whether the slideshow is in loop mode.
+            draft_size: The display size JPEGs may be draft-decoded for.
+        """
+        with self._lock:
+            self._request = (images, current_index, loop, draft_size)
+        self._wakeup.set()
+
+    def _worker(self) -> None:
+        """Serve preload requests until `close` is called."""
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            with self._lock:
+                if self._closed:
+                    return
+                request, self._request = self._request, None
+                generation = self._generation
+            if request is None or not request[0]:
+                continue
+            images, current_index, loop, draft_size = request
+
+            # Candidates are checked against the live cache, so images the main
+            # thread stored in the meantime are not decoded twice
+            futures = {}
+            for index_to_load in _indices_to_preload(len(images), current_index, loop, self.count):
+                with self._lock:
+                    entry = self._cache.get(index_to_load)
+                if entry is None or not _covers(entry[1], draft_size):
+                    try:
+                        future = self._pool.submit(load_image, images[index_to_load], draft_size)
+                    except RuntimeError:
+                        return  # The pool was shut down by `close`
+                    futures[future] = index_to_load
+
+            for future in as_completed(futures):
+                if self._wakeup.is_set():
+                    break  # A newer request supersedes this one
+                index_to_load = futures[future]
+                image_path = images[index_to_load]
+                try:
+                    image = future.result()
+                except ImageNotFound as e:
+                    logger.warning(f"Failed to preload image, it may have been moved or deleted: {e}")
+                    continue
+                except Exception as e:
+                    # Any other decode error must not end the worker thread
+                    logger.error(f"Failed to preload image '{image_path.name}': {e}")
+                    continue
+                with self._lock:
+                    if generation != self._generation:
+                        break
+                    self._cache[index_to_load] = (image, draft_size)
+                    self._cache.move_to_end(index_to_load)
+                    self._evict_oldest()
+                logger.debug(f"Preloaded image {index_to_load + 1}/{len(images)}: {image_path.name}")
+            # Decodes that have not started yet are dropped with an abandoned request
+            for future in futures:
+                future.cancel()
+
+    def _evict_oldest(self) -> None:
+        """Drop least recently used entries beyond `max_cached`; needs the lock."""
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
@@ -8,9 +8,11 @@ from unittest.mock import patch, MagicMock, call
 from pathlib import Path
 from PIL import Image
 
-from slideshow import app, display, hud, image_loader
+from slideshow import app, display, hud
 from slideshow.app import ImageSlideshowApp
 
+_REAL_IMAGE_OPEN = Image.open
+
 # --- Fixtures ---
 
 @pytest.fixture
@@ -23,7 +25,8 @@ def mock_app_dependencies(mocker):
     mocker.patch('slideshow.app.display.resize_image', return_value=Image.new('RGB', (10, 10)))
     mocker.patch('slideshow.app.display.adjust_brightness', return_value=Image.new('RGB', (10, 10)))
     mocker.patch('slideshow.app.display.display_static_image')
-    mocker.patch('slideshow.app.image_loader.preload_images', return_value={})
+    preloader_class = mocker.patch('slideshow.app.image_loader.ImagePreloader')
+    preloader_class.return_value.get.return_value = None
     mocker.patch('PIL.Image.open', return_value=Image.new('RGB', (100, 100)))
 
 @pytest.fixture
@@ -80,7 +83,10 @@ def test_show_image_flow(app_instance):
     display.adjust_brightness.assert_called_once()
     display.display_static_image.assert_called_once()
     hud.update_hud.assert_called_once_with(app_instance)
-    image_loader.preload_images.assert_called_once()
+    app_instance.preloader.put.assert_called_once_with(1, Image.open.return_value, (800, 600))
+    app_instance.preloader.schedule.assert_called_once_with(
+        app_instance.images, 1, app_instance.loop, (800, 600)
+    )
     
     # Check that a new timer was set
     app_instance.window.after.assert_called_with(int(app_instance.delay * 1000), app_instance.next_image_auto)
@@ -88,7 +94,7 @@ def test_show_image_flow(app_instance):
 def test_show_image_uses_cache(app_instance):
     """Test that show_image uses a preloaded image from the cache."""
     cached_image = Image.new('RGB', (50, 50), color='red')
-    app_instance.preloaded_images[0] = cached_image
+    app_instance.preloader.get.return_value = cached_image
     
     with patch('PIL.Image.open') as mock_open:
         app_instance.show_image(0)
@@ -97,8 +103,98 @@ def test_show_image_uses_cache(app_instance):
     # Check that the cached image was used for resizing
     display.resize_image.assert_called_once_with(cached_image, 800, 600)
 
+def test_show_image_reuses_cached_photo(app_instance):
+    """Test that redisplaying at the same size and brightness skips rendering."""
+    app_instance.show_image(0)
+    app_instance.show_image(1)
+    app_instance.show_image(0)
+
+    assert display.resize_image.call_count == 2
+    assert display.display_static_image.call_count == 2
+    assert app_instance._current_photo_ref is display.display_static_image.return_value
+
+    # A new brightness is a different entry and renders again
+    app_instance.brightness = 1.5
+    app_instance.show_image(0)
+    assert display.resize_image.call_count == 3
+
+def test_show_image_recycles_evicted_photo(app_instance, mocker):
+    """Test that the photo evicted from the display cache is offered for reuse."""
+    mocker.patch('slideshow.app.config.DISPLAY_CACHE_SIZE', 1)
+    first_photo, second_photo = MagicMock(), MagicMock()
+    display.display_static_image.side_effect = [first_photo, second_photo]
+
+    app_instance.show_image(0)
+    app_instance.show_image(1)
+
+    assert display.display_static_image.call_args_list[0].args[3] is None
+    assert display.display_static_image.call_args_list[1].args[3] is first_photo
+    assert list(app_instance._display_cache.values()) == [second_photo]
+
+def test_show_image_updates_persistent_image_item(app_instance):
+    """Test that a cached photo is swapped into the existing canvas item."""
+    app_instance.show_image(0)
+    app_instance.show_image(1)
+    app_instance.canvas.reset_mock()
+    app_instance.show_image(0)
+
+    photo = display.display_static_image.return_value
+    app_instance.canvas.itemconfigure.assert_any_call(app_instance._image_item, image=photo)
+    app_instance.canvas.create_image.assert_not_called()
+    assert call("all") not in app_instance.canvas.delete.call_args_list
+
+def test_show_image_builds_animation_frames_once(app_instance, mocker, tmp_path):
+    """Test that GIF frames are decoded once and replayed from the cache."""
+    gif_path = tmp_path / "anim.gif"
+    frames = [Image.new('RGB', (20, 20), color) for color in ('red', 'blue')]
+    frames[0].save(gif_path, save_all=True, append_images=frames[1:], duration=50)
+    app_instance.images = [gif_path, Path("img2.png")]
+    mocker.patch('PIL.Image.open', side_effect=_REAL_IMAGE_OPEN)
+    build = mocker.patch(
+        'slideshow.app.display.build_animation_frames',
+        return_value=([MagicMock(), MagicMock()], [50, 50]),
+    )
+    mocker.patch('slideshow.app.display.animate_gif_next_frame')
+
+    app_instance.show_image(0)
+    app_instance.show_image(0)
+
+    build.assert_called_once()
+    assert display.animate_gif_next_frame.call_count == 2
+    assert app_instance._animate_gif_durations == [50, 50]
+
+# --- Tests for request_redraw ---
+
+def test_request_redraw_coalesces_requests(app_instance):
+    """Test that several redraw requests before idle cause one show_image."""
+    app_instance.current_index = 1
+
+    app_instance.request_redraw()
+    app_instance.request_redraw(force_reload=True)
+
+    app_instance.window.after_idle.assert_called_once_with(app_instance._do_redraw)
+    with patch.object(app_instance, 'show_image') as mock_show_image:
+        app_instance._do_redraw()
+        mock_show_image.assert_called_once_with(1, force_reload=True)
+
+    app_instance.request_redraw()
+    assert app_instance.window.after_idle.call_count == 2
+
+def test_redraw_skipped_when_nothing_changed(app_instance):
+    """Test that a redraw at the same index, size and brightness is skipped."""
+    app_instance.show_image(0)
+
+    with patch.object(app_instance, 'show_image') as mock_show_image:
+        app_instance._do_redraw()
+        mock_show_image.assert_not_called()
+
+        app_instance.canvas.winfo_width.return_value = 1024
+        app_instance._do_redraw()
+        mock_show_image.assert_called_once_with(0, force_reload=False)
+
 # --- Tests for next_image_auto ---
 
+
 def test_next_image_auto_loops(app_instance):
     """Test that next_image_auto calls show_image with the next index."""
     app_instance.current_index = 0
@@ -120,3 +216,12 @@ def test_next_image_auto_no_loop_end(app_instance):
         assert not app_instance.timer_running
         # HUD should be updated to reflect paused state
         hud.update_hud.assert_called_with(app_instance)
+
+# --- Tests for quit ---
+
+def test_quit_closes_preloader(app_instance, mocker):
+    """Test that quitting stops the preloader so pending decodes do not delay exit."""
+    mocker.patch('slideshow.app.favorites.save_favorites')
+    app_instance.quit()
+    app_instance.preloader.close.assert_called_once_with()
+    app_instance.window.destroy.assert_called_once()
@@ -111,21 +111,21 @@ def test_toggle_loop(mock_app):
 # Test cases for brightness control functions
 def test_increase_brightness(mock_app):
     """
-    Test that increase_brightness increases the brightness and reloads the image.
+    Test that increase_brightness increases the brightness and requests a redraw.
     """
     initial_brightness = mock_app.brightness
     controls.increase_brightness(mock_app)
     assert mock_app.brightness == pytest.approx(initial_brightness + 0.1)
-    mock_app.show_image.assert_called_once_with(mock_app.current_index, force_reload=True)
+    mock_app.request_redraw.assert_called_once_with()
 
 def test_decrease_brightness(mock_app):
     """
-    Test that decrease_brightness decreases the brightness and reloads the image.
+    Test that decrease_brightness decreases the brightness and requests a redraw.
     """
     initial_brightness = mock_app.brightness
     controls.decrease_brightness(mock_app)
     assert mock_app.brightness == pytest.approx(initial_brightness - 0.1)
-    mock_app.show_image.assert_called_once_with(mock_app.current_index, force_reload=True)
+    mock_app.request_redraw.assert_called_once_with()
 
 def test_increase_brightness_at_max(mock_app):
     """
@@ -153,3 +153,56 @@ def test_toggle_show_full_hud(mock_app):
         controls.toggle_show_full_hud(mock_app)
         assert mock_app.show_full_hud is not initial_show_full_hud
         mock_update_hud.assert_called_once_with(mock_app)
+
+# Test cases for the jump overlay
+def test_jump_to_image_reuses_overlay_entry(mock_app):
+    """
+    Test that the jump overlay creates its entry once and shows it on the canvas.
+    """
+    mock_app._jump_entry = None
+    with patch("slideshow.controls.tk.Entry") as mock_entry_class:
+        controls.jump_to_image(mock_app)
+        controls.jump_to_image(mock_app)
+        mock_entry_class.assert_called_once()
+    entry = mock_entry_class.return_value
+    assert mock_app.canvas.create_window.call_count == 2
+    mock_app.canvas.create_window.assert_called_with(
+        mock_app.canvas.winfo_width() // 2, mock_app.canvas.winfo_height() // 2, window=entry, tags="jump"
+    )
+    entry.focus_set.assert_called()
+
+def test_submit_jump_valid_number(mock_app):
+    """
+    Test that a valid number closes the overlay, pauses and shows the image.
+    """
+    mock_app.timer_running = True
+    mock_app._jump_entry.get.return_value = "2"
+    controls.submit_jump(mock_app)
+    mock_app.canvas.delete.assert_called_once_with("jump")
+    assert mock_app.timer_running is False
+    mock_app.show_image.assert_called_once_with(1)
+
+@pytest.mark.parametrize("text", ["0", "3", "abc"])
+def test_submit_jump_invalid_number(mock_app, text):
+    """
+    Test that an invalid number keeps the overlay open.
+    """
+    mock_app._jump_entry.get.return_value = text
+    controls.submit_jump(mock_app)
+    mock_app.canvas.delete.assert_not_called()
+    mock_app.show_image.assert_not_called()
+    mock_app._jump_entry.select_range.assert_called_once_with(0, tk.END)
+    mock_app.canvas.itemconfigure.assert_called_once_with(
+        "jump_prompt", text="Invalid number, enter 1 to 2:", fill="red"
+    )
+
+def test_jump_to_image_without_images_shows_message(mock_app):
+    """
+    Test that jumping with no images loaded tells the user on the canvas.
+    """
+    mock_app.images = []
+    controls.jump_to_image(mock_app)
+    mock_app.canvas.create_window.assert_not_called()
+    _, kwargs = mock_app.canvas.create_text.call_args
+    assert kwargs["text"] == "No images loaded."
+    assert kwargs["fill"] == "red"
@@ -7,7 +7,7 @@ PhotoImage creation.
 """
 
 import pytest
-from PIL import Image
+from PIL import Image, ImageEnhance, ImageTk
 from unittest.mock import patch, MagicMock
 
 from slideshow import display
@@ -37,6 +37,24 @@ def test_resize_image_no_change_needed(sample_image):
     # The current implementation will resize to fit, so it will be 400x200
     assert resized.size == (400, 200)
 
+def test_resize_image_exact_integer_size():
+    """Test that sizes are not truncated by float rounding."""
+    # With float ratios, 2763 * (1727 / 2763) came out as 1726
+    image = Image.new('RGB', (1727, 2763))
+    resized = display.resize_image(image, 2656, 2763)
+    assert resized.size == (1727, 2763)
+
+@pytest.mark.parametrize("target_width, expected_filter", [
+    (400, Image.Resampling.LANCZOS),   # upscale
+    (150, Image.Resampling.BILINEAR),  # reduction under 2x
+    (100, Image.Resampling.LANCZOS),   # reduction of 2x or more
+])
+def test_resize_image_resample_filter(sample_image, target_width, expected_filter):
+    """Test that BILINEAR is only used for mild reductions, never for upscales."""
+    with patch.object(sample_image, 'resize', wraps=sample_image.resize) as resize:
+        display.resize_image(sample_image, target_width, 1000)
+    assert resize.call_args.args[1] == expected_filter
+
 def test_resize_image_invalid_target_dims(sample_image, caplog):
     """Test that invalid target dimensions are handled gracefully."""
     resized = display.resize_image(sample_image, 0, -10)
@@ -50,6 +68,47 @@ def test_resize_image_invalid_source_dims(caplog):
     assert resized.size == invalid_image.size
     assert "Invalid original image dimensions" in caplog.text
 
+# --- Tests for adjust_brightness ---
+
+@pytest.mark.parametrize("factor", [0.1, 0.7, 1.5, 3.0])
+def test_adjust_brightness_matches_image_enhance(factor):
+    """Test that the lookup table gives the same pixels as ImageEnhance."""
+    image = Image.frombytes('RGB', (16, 16), bytes(range(256)) * 3)
+    expected = ImageEnhance.Brightness(image).enhance(factor)
+    assert display.adjust_brightness(image, factor).tobytes() == expected.tobytes()
+
+def test_adjust_brightness_keeps_alpha():
+    """Test that only the color bands of an RGBA image are scaled."""
+    image = Image.new('RGBA', (2, 2), (200, 100, 50, 128))
+    assert display.adjust_brightness(image, 0.5).getpixel((0, 0)) == (100, 50, 25, 128)
+
+# --- Tests for display_static_image ---
+
+@patch('slideshow.display.create_photoimage_robust')
+def test_display_static_image_pastes_into_recycled_photo(mock_create, sample_image):
+    """Test that a recycled PhotoImage of the same size is reused."""
+    canvas = MagicMock()
+    recycled = MagicMock(spec=ImageTk.PhotoImage)
+    recycled.width.return_value, recycled.height.return_value = sample_image.size
+
+    result = display.display_static_image(canvas, sample_image, 1, recycled)
+
+    assert result is recycled
+    recycled.paste.assert_called_once_with(sample_image)
+    mock_create.assert_not_called()
+    canvas.itemconfigure.assert_called_once_with(1, image=recycled)
+
+@patch('slideshow.display.create_photoimage_robust')
+def test_display_static_image_ignores_recycled_photo_of_other_size(mock_create, sample_image):
+    """Test that a recycled PhotoImage of another size is not reused."""
+    recycled = MagicMock(spec=ImageTk.PhotoImage)
+    recycled.width.return_value, recycled.height.return_value = (10, 10)
+
+    result = display.display_static_image(MagicMock(), sample_image, 1, recycled)
+
+    assert result is mock_create.return_value
+    recycled.paste.assert_not_called()
+
 # --- Tests for create_photoimage_robust ---
 
 @patch('slideshow.display.ImageTk.PhotoImage')
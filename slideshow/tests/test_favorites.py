@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the favorites module.
+"""
+
+import os
+import stat
+from unittest.mock import patch
+
+from slideshow import favorites
+from slideshow.config import FAVORITES_FILENAME
+
+
+def test_save_and_load_favorites_roundtrip(tmp_path):
+    """Test that saved favorites are deduplicated, sorted and filtered on load."""
+    favorites.save_favorites(tmp_path, [4, 1, 4, 9], num_images=10)
+
+    assert (tmp_path / FAVORITES_FILENAME).read_text(encoding='utf-8') == "1\n4\n9\n"
+    assert favorites.load_favorites(tmp_path, num_images=5) == [1, 4]
+
+def test_load_favorites_skips_invalid_lines(tmp_path):
+    """Test that non-numeric lines in the favorites file are ignored."""
+    (tmp_path / FAVORITES_FILENAME).write_text("3\n\nabc\n-1\n 2 \n", encoding='utf-8')
+    assert favorites.load_favorites(tmp_path, num_images=5) == [2, 3]
+
+def test_save_favorites_keeps_previous_file_on_failure(tmp_path):
+    """Test that a failed save leaves the previous file intact and no temporary file."""
+    favorites.save_favorites(tmp_path, [1], num_images=5)
+
+    with patch("slideshow.favorites.os.replace", side_effect=OSError("disk full")):
+        favorites.save_favorites(tmp_path, [2, 3], num_images=5)
+
+    assert (tmp_path / FAVORITES_FILENAME).read_text(encoding='utf-8') == "1\n"
+    assert [p.name for p in tmp_path.iterdir()] == [FAVORITES_FILENAME]
+
+def test_save_favorites_keeps_file_mode(tmp_path):
+    """Test that saving keeps the existing file mode instead of mkstemp's 0600."""
+    favorites_file = tmp_path / FAVORITES_FILENAME
+    favorites_file.write_text("1\n", encoding='utf-8')
+    favorites_file.chmod(0o644)
+
+    favorites.save_favorites(tmp_path, [2], num_images=5)
+
+    assert stat.S_IMODE(favorites_file.stat().st_mode) == 0o644
+
+def test_save_favorites_new_file_follows_umask(tmp_path):
+    """Test that a newly created favorites file gets the umask default mode."""
+    old_umask = os.umask(0o022)
+    try:
+        favorites.save_favorites(tmp_path, [2], num_images=5)
+    finally:
+        os.umask(old_umask)
+
+    assert stat.S_IMODE((tmp_path / FAVORITES_FILENAME).stat().st_mode) == 0o644
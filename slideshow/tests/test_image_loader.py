@@ -5,10 +5,20 @@ Unit tests for the image_loader module.
 This module tests the functionality of image discovery, sorting, and filtering.
 """
 
+import os
+import threading
+import time
 from pathlib import Path
 import pytest
+from PIL import Image
 
-from slideshow.image_loader import load_images_from_folder
+from slideshow import image_loader
+from slideshow.image_loader import (
+    ImagePreloader,
+    load_image,
+    load_images_from_folder,
+    sort_images_by_time,
+)
 
 def test_load_images_from_folder_success(tmp_path: Path):
     """
@@ -74,3 +84,161 @@ def test_load_images_from_folder_with_no_supported_files(tmp_path: Path, caplog)
 
     assert images == []
     assert f"No images found in '{d}'" in caplog.text
+
+def test_image_preloader_loads_following_images_in_background(tmp_path: Path):
+    """
+    Test that the preloader decodes the next images off the calling thread.
+    """
+    images = []
+    for i in range(3):
+        image_path = tmp_path / f"image_{i}.png"
+        Image.new('RGBA', (4, 4), color='red').save(image_path)
+        images.append(image_path)
+
+    preloader = ImagePreloader(count=2)
+    preloader.schedule(images, 0, loop=False)
+
+    deadline = time.monotonic() + 5
+    while preloader.get(2) is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert preloader.get(0) is None
+    assert preloader.get(1).mode == 'RGB'
+    assert preloader.get(2).size == (4, 4)
+
+    preloader.clear()
+    assert preloader.get(1) is None
+
+def test_image_preloader_skips_missing_images(tmp_path: Path):
+    """
+    Test that a missing image does not keep the following ones from preloading.
+    """
+    images = [tmp_path / f"image_{i}.png" for i in range(4)]
+    for image_path in (images[0], images[2], images[3]):
+        Image.new('RGB', (4, 4), color='red').save(image_path)
+
+    preloader = ImagePreloader(count=3)
+    preloader.schedule(images, 0, loop=False)
+
+    deadline = time.monotonic() + 5
+    while (preloader.get(2) is None or preloader.get(3) is None) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert preloader.get(1) is None
+    assert preloader.get(2) is not None
+    assert preloader.get(3) is not None
+
+def test_image_preloader_survives_decode_errors(tmp_path: Path, mocker):
+    """
+    Test that an error other than ImageNotFound does not stop the preloader.
+    """
+    images = [tmp_path / f"image_{i}.png" for i in range(3)]
+    for image_path in images:
+        Image.new('RGB', (4, 4), color='red').save(image_path)
+    real_load_image = image_loader.load_image
+
+    def _load_image(image_path, draft_size=None):
+        if image_path == images[1]:
+            raise Image.DecompressionBombError("too many pixels")
+        return real_load_image(image_path, draft_size)
+
+    mocker.patch('slideshow.image_loader.load_image', side_effect=_load_image)
+    preloader = ImagePreloader(count=2)
+    preloader.schedule(images, 0, loop=False)
+
+    deadline = time.monotonic() + 5
+    while preloader.get(2) is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert preloader.get(1) is None
+    assert preloader.get(2) is not None
+
+    # The worker is still alive and serves the next request
+    mocker.patch('slideshow.image_loader.load_image', side_effect=real_load_image)
+    preloader.schedule(images, 0, loop=False)
+    deadline = time.monotonic() + 5
+    while preloader.get(1) is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert preloader.get(1) is not None
+
+def test_image_preloader_close_drops_pending_decodes(tmp_path: Path, mocker):
+    """
+    Test that `close` stops the worker and cancels decodes that have not started.
+    """
+    count = image_loader.PRELOAD_WORKERS + 2
+    images = [tmp_path / f"image_{i}.png" for i in range(count + 1)]
+    started = []
+    release = threading.Event()
+
+    def _load_image(image_path, draft_size=None):
+        started.append(image_path)
+        release.wait(5)
+        return Image.new('RGB', (4, 4))
+
+    mocker.patch('slideshow.image_loader.load_image', side_effect=_load_image)
+    preloader = ImagePreloader(count=count)
+    preloader.schedule(images, 0, loop=False)
+
+    deadline = time.monotonic() + 5
+    while len(started) < image_loader.PRELOAD_WORKERS and time.monotonic() < deadline:
+        time.sleep(0.01)
+    preloader.close()
+    release.set()
+    preloader._thread.join(5)
+
+    assert not preloader._thread.is_alive()
+    assert len(started) == image_loader.PRELOAD_WORKERS
+
+def test_load_image_flattens_only_transparent_alpha(tmp_path: Path):
+    """
+    Test that opaque alpha is dropped and translucent pixels are blended onto white.
+    """
+    opaque_path = tmp_path / "opaque.png"
+    translucent_path = tmp_path / "translucent.png"
+    Image.new('RGBA', (2, 2), (10, 20, 30, 255)).save(opaque_path)
+    Image.new('RGBA', (2, 2), (0, 0, 0, 0)).save(translucent_path)
+
+    opaque = load_image(opaque_path)
+    translucent = load_image(translucent_path)
+
+    assert opaque.mode == translucent.mode == 'RGB'
+    assert opaque.getpixel((0, 0)) == (10, 20, 30)
+    assert translucent.getpixel((0, 0)) == (255, 255, 255)
+
+def test_load_image_draft_decodes_large_jpegs(tmp_path: Path):
+    """
+    Test that a display size lets JPEGs decode at a reduced scale.
+    """
+    image_path = tmp_path / "large.jpg"
+    Image.new('RGB', (1600, 1200), color='green').save(image_path)
+
+    assert load_image(image_path).size == (1600, 1200)
+    drafted = load_image(image_path, (400, 300))
+    assert drafted.size == (400, 300)
+    assert drafted.mode == 'RGB'
+
+def test_image_preloader_rejects_images_drafted_too_small():
+    """
+    Test that an entry decoded for a smaller display counts as missing.
+    """
+    preloader = ImagePreloader()
+    image = Image.new('RGB', (400, 300))
+    preloader.put(0, image, (400, 300))
+
+    assert preloader.get(0, (400, 300)) is image
+    assert preloader.get(0, (800, 600)) is None
+
+def test_sort_images_by_time_reuses_cached_mtimes(tmp_path: Path, mocker):
+    """
+    Test that modification times are only read once across sorts.
+    """
+    old, new = tmp_path / "old.png", tmp_path / "new.png"
+    old.touch()
+    new.touch()
+    os.utime(old, (1000, 1000))
+    os.utime(new, (2000, 2000))
+    stat = mocker.spy(os, "stat")
+    mtimes: dict[Path, float] = {}
+
+    assert sort_images_by_time([new, old], mtimes=mtimes) == [old, new]
+    assert sort_images_by_time([old, new], ascending=False, mtimes=mtimes) == [new, old]
+    assert stat.call_count == 2